@@ -26,6 +26,10 @@ sys.path.insert(0, PROJECT_ROOT)
 
 CONFIG_FILE = os.path.join(PROJECT_ROOT, 'openclaw-guardian', 'config.yaml')
 MEMORY_FILE = os.path.join(PROJECT_ROOT, 'openclaw-guardian', 'memory.json')
+UPGRADES_FILES = [
+    os.path.join(PROJECT_ROOT, 'openclaw-guardian', 'memory.upgrades.jsonl'),
+    os.path.join(PROJECT_ROOT, 'openclaw-guardian', 'memory.upgrades.msgpack'),
+]
 REPOS_DIR   = os.path.join(PROJECT_ROOT, 'openclaw-guardian', 'repos')
 
 # ---------------------------------------------------------------------------
@@ -125,6 +129,10 @@ def _reset_memory_file():
         os.makedirs(os.path.dirname(MEMORY_FILE), exist_ok=True)
         with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
             json.dump({"last_updated": [], "successful_upgrades": 0, "repo_url": ""}, f, indent=4)
+        # Upgrade history lives in its own file next to memory.json
+        for upgrades_file in UPGRADES_FILES:
+            if os.path.exists(upgrades_file):
+                os.remove(upgrades_file)
     except Exception as e:
         print(f"[memory] write error: {e}")
 
@@ -30,6 +30,10 @@ import re
 # re: Built-in Python library for working with regular expressions
 # Regular expressions (regex) are patterns used to match text
 
+import json
+# json: Built-in Python library for working with JSON data
+# We use json.dumps() to build a stable "fingerprint" string of a config
+
 from pathlib import Path
 # pathlib: Built-in Python library for file path operations
 # Path is a cleaner way to work with file paths instead of raw strings
@@ -372,6 +376,133 @@ def load_config(config_path: str = 'config.yaml') -> Dict[str, Any]:
     return loader.load()
 
 
+# ============================================================================
+# CONFIG KEY - Lets a config dictionary be used as a cache key
+# ============================================================================
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """
+    Build a stable string that identifies the contents of a config.
+
+    Two configs with the same keys and values always give the same
+    fingerprint, no matter what order the keys were added in.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        A JSON string with sorted keys
+
+    Example:
+        config_fingerprint({'b': 1, 'a': 2})  # '{"a": 2, "b": 1}'
+    """
+    # sort_keys=True makes the output independent of key order
+    # default=str handles values YAML can produce but JSON can't (e.g. dates)
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+class ConfigKey:
+    """
+    A hashable wrapper around a configuration dictionary.
+
+    Dictionaries can't be passed to functools.lru_cache because they are
+    mutable (and so unhashable). ConfigKey hashes and compares by the
+    config's fingerprint, but still keeps the original dictionary around
+    so cached factories can build objects from it.
+
+    Attributes:
+        config: The original configuration dictionary
+        fingerprint: The config_fingerprint() of that dictionary
+
+    Example:
+        @functools.lru_cache(maxsize=16)
+        def _cached_thing(config_key, logger):
+            return Thing(config_key.config, logger)
+
+        thing = _cached_thing(ConfigKey(config), logger)
+    """
+
+    __slots__ = ('config', 'fingerprint')
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.fingerprint = config_fingerprint(config)
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ConfigKey) and self.fingerprint == other.fingerprint
+
+
+# ============================================================================
+# FROZEN CONFIG - Read-only config with attribute access
+# ============================================================================
+
+class FrozenConfig(dict):
+    """
+    A read-only configuration dictionary that also allows attribute access.
+
+    After loading, the config never changes during a run, so we freeze it.
+    Nested sections become FrozenConfig too, which means both of these work:
+
+        config.get('github', {}).get('repo_url', '')   # old dict style
+        config.github.repo_url                         # attribute style
+
+    It is still a real dict, so json.dumps(), ConfigKey and every skill
+    that expects a dictionary keep working unchanged.
+
+    Example:
+        config = freeze_config({'github': {'repo_url': 'https://...'}})
+        print(config.github.repo_url)
+        config['github'] = {}  # TypeError: FrozenConfig is read-only
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal attribute lookup fails,
+        # so dict methods like .get() and .items() still win
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("FrozenConfig is read-only")
+
+    # Block every method that could change the dictionary
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        # Lets copy.deepcopy() and pickle rebuild the object without
+        # going through the blocked __setitem__
+        return (FrozenConfig, (dict(self),))
+
+
+def freeze_config(value: Any) -> Any:
+    """
+    Recursively turn a loaded config into FrozenConfig objects.
+
+    Args:
+        value: A config dictionary (or any value inside one)
+
+    Returns:
+        FrozenConfig for dictionaries, tuples for lists, other values as-is
+
+    Example:
+        config = freeze_config(load_config('config.yaml'))
+        token = config.github.token
+    """
+    if isinstance(value, dict):
+        return FrozenConfig({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
 # ============================================================================
 # MAIN - Code that runs when we execute this file directly
 # ============================================================================
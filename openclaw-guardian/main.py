@@ -44,6 +44,14 @@ import importlib
 # importlib: Built-in library for dynamic imports
 # We use it to import modules dynamically if needed
 
+from operator import itemgetter
+# itemgetter: Built-in helper that builds a fast "get this key" function
+# itemgetter('name')(pkg) is the same as pkg['name']
+
+
+# Pulls the 'name' out of a package dictionary (used with map() below)
+_get_name = itemgetter('name')
+
 
 # ============================================================================
 # MAIN ORCHESTRATOR CLASS - Ties everything together
@@ -132,17 +140,20 @@ class OpenClawGuardian:
         and environment variables.
         """
         # Import here to avoid issues if not installed
-        from config.config_loader import load_config
+        from config.config_loader import load_config, freeze_config
         
         # Get config file path from args or use default
         config_path = self.args.config if self.args else 'config.yaml'
         
-        self.config = load_config(config_path)
+        # Freeze the config: it is read-only for the rest of the run and
+        # sections can be read as attributes (self.config.github.repo_url)
+        self.config = freeze_config(load_config(config_path))
+        github = self.config.get('github', {})
         
         # Validate that we have what we need
-        if not self.config.get('github', {}).get('repo_url'):
+        if not github.get('repo_url'):
             raise ValueError("No repository URL configured. Please save configuration first.")
-        if not self.config.get('github', {}).get('token'):
+        if not github.get('token'):
             raise ValueError("No GitHub token configured. Please save configuration first.")
     
     def _setup_logger(self):
@@ -175,17 +186,19 @@ class OpenClawGuardian:
         data from memory.json. Every run starts with an empty slate so that
         no previous upgrade history can influence the current run.
         """
-        from skills.memory_manager import get_memory_manager
+        from skills.memory_manager import get_memory_manager, MAX_UPGRADE_ENTRIES
 
         memory_file = self.config.get('paths', {}).get('memory_file', 'memory.json')
+        upgrades_format = self.config.get('paths', {}).get('upgrades_format', 'jsonl')
+        max_entries = self.config.get('agent', {}).get('max_upgrade_entries', MAX_UPGRADE_ENTRIES)
 
         # Create manager object but immediately overwrite its in-memory state
         # with an empty dict, regardless of what is on disk.
-        self.memory = get_memory_manager(memory_file, self.logger)
+        self.memory = get_memory_manager(memory_file, self.logger, upgrades_format, max_entries)
         self.memory.memory = self.memory._create_empty_memory()  # force blank state
 
         # Record which repo we're working on (doesn't affect upgrade logic)
-        repo_url = self.config.get('github', {}).get('repo_url', '')
+        repo_url = self.config.github.repo_url
         self.memory.memory['repo_url'] = repo_url
 
         self.logger.info("Memory manager initialised with clean/empty state")
@@ -205,14 +218,14 @@ class OpenClawGuardian:
         from skills.dependency_checker import get_dependency_checker
         from skills.upgrade_executor import get_upgrade_executor
         from skills.pr_creator import get_pr_creator
-        from skills.moltbook_poster import MoltbookPoster
+        from skills.moltbook_poster import get_moltbook_poster
         
         # Create all skill instances
         self.monitor = get_repo_monitor(self.config, self.logger)
         self.checker = get_dependency_checker(self.config, self.logger)
         self.executor = get_upgrade_executor(self.config, self.logger)
         self.pr_creator = get_pr_creator(self.config, self.logger)
-        self.moltbook_poster = MoltbookPoster(self.config, self.logger)
+        self.moltbook_poster = get_moltbook_poster(self.config, self.logger)
         
         self.logger.info("All skills initialized")
     
@@ -338,9 +351,12 @@ class OpenClawGuardian:
         self.logger.info("=" * 50)
         self.logger.info("Starting new cycle")
         
+        # Import here, like the skills in _setup_skills()
+        from skills.repo_snapshot import RepoSnapshot
+        
         # Get configuration
-        repo_url = self.config.get('github', {}).get('repo_url', '')
-        token = self.config.get('github', {}).get('token', '')
+        repo_url = self.config.github.repo_url
+        token = self.config.github.token
         
         repo_path = None
         
@@ -370,14 +386,16 @@ class OpenClawGuardian:
             # Step 2: Check for outdated packages
             self.logger.info("Step 2: Checking for outdated packages")
             
-            # Check if this is a Node.js project
-            if not self.checker.has_package_json(repo_path):
+            # Read package.json / package-lock.json once for the whole cycle.
+            # No snapshot means there is no package.json - not a Node.js project
+            snapshot = RepoSnapshot.load(repo_path, self.logger)
+            if snapshot is None:
                 self.logger.warning("No package.json found - not a Node.js project")
                 self._cleanup_repo(repo_path)
                 return (False, [], '')
             
             # Check for outdated packages
-            outdated = self.checker.check_outdated(repo_path)
+            outdated = self.checker.check_outdated(repo_path, snapshot)
 
             if not outdated:
                 self.logger.info("No outdated packages found — all packages are at their latest versions")
@@ -390,12 +408,14 @@ class OpenClawGuardian:
             # No filter — always process every package npm outdated reports
             # (Memory is cleared on every page reload, so filtering would cause
             # false "up-to-date" results if the same repo is used again)
-            package_names = [pkg['name'] for pkg in outdated]
+            package_names = list(map(_get_name, outdated))
             
             # Step 3: Upgrade dependencies
             self.logger.info("Step 3: Upgrading dependencies to latest versions")
             
-            success, upgraded = self.executor.upgrade_dependencies(repo_path, package_names)
+            success, upgraded = self.executor.upgrade_dependencies(
+                repo_path, package_names, snapshot
+            )
             
             if not success or not upgraded:
                 self.logger.error("Upgrade failed or no packages were changed")
@@ -421,13 +441,13 @@ class OpenClawGuardian:
             self.logger.info(f"Pull request created: {pr_url}")
             
             # Step 5: Record in memory
-            branch_name = self.pr_creator.generate_branch_name()
-            upgraded_names = [pkg['name'] for pkg in upgraded]
+            branch_name = self.pr_creator.last_branch_name
+            upgraded_names = list(map(_get_name, upgraded))
             self.memory.record_upgrade(branch_name, upgraded_names, pr_url)
             self.memory.update_last_check_time()
+            self.memory.flush()
             
             # Step 6: Post to Moltbook (if configured)
-            repo_url = self.config.get('github', {}).get('repo_url', '')
             self.moltbook_poster.post_upgrade(repo_url, upgraded, pr_url)
             
             self.logger.info("Cycle complete!")
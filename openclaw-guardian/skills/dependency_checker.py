@@ -29,16 +29,253 @@ import json
 # json: Built-in library for working with JSON data
 # npm outdated --json returns JSON output
 
-from typing import List, Dict, Any, Optional
+import asyncio
+# asyncio: Built-in library for running many tasks at the same time
+# We use it to run 'npm outdated' for several repos concurrently
+
+import shutil
+# shutil: Built-in library for shell utilities
+# shutil.which() finds the full path to npm (npm.cmd on Windows)
+
+import hashlib
+# hashlib: Built-in library for hashing
+# We hash package.json + package-lock.json to key the outdated cache
+
+import time
+# time: Built-in library for time-related functions
+# We use it to check how old a cache file is
+
+import logging
+# logging: Built-in logging library (we only need its level constants)
+
+from concurrent.futures import Future, ThreadPoolExecutor
+# ThreadPoolExecutor: Built-in pool of worker threads
+# Lets us run two independent npm commands at the same time
+# Future: A placeholder for a result that another thread will fill in
+
+import threading
+# threading: Built-in library for working with threads
+# A Lock protects the table of in-progress outdated checks
+
+import operator
+# operator: Built-in library of fast function versions of operators
+# operator.itemgetter() reads several dictionary keys in one call
+
+import copy
+# copy: Built-in library for copying objects
+# Cached package.json data is deep-copied so callers can't change the cache
+
+from dataclasses import dataclass, asdict
+# dataclasses: Built-in library for simple data-holding classes
+# asdict() turns a dataclass back into a plain dictionary
+
+from typing import List, Dict, Any, Optional, Tuple, Union
 # typing: Library for type hints
 # List: List type (e.g., List[str] is a list of strings)
 # Dict: Dictionary type (e.g., Dict[str, int] is a dict with string keys, int values)
 # Any: Any type
 # Optional: Can be the type or None
+# Tuple: Fixed-size group of values
+# Union: One of several types (e.g. str or bytes)
 
 import sys
 # sys: Built-in library for system operations
 
+import functools
+# functools: Built-in library for higher-order functions
+# We use lru_cache to remember results of small helper functions
+
+# When this file is run directly (python skills/dependency_checker.py) the
+# project folder isn't on the import path yet, so add it before the
+# imports below (an import from main.py or the tests already has it)
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skills.repo_snapshot import RepoSnapshot
+# RepoSnapshot: package.json / package-lock.json read once per cycle
+
+from utils import fast_json
+# fast_json: Parses JSON with orjson when installed (falls back to json)
+
+from utils.logger import is_enabled_for, is_debug_enabled
+# is_enabled_for / is_debug_enabled: Let us skip building log messages
+# that would be thrown away anyway
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# How long one 'npm outdated' run may take (seconds)
+NPM_OUTDATED_TIMEOUT = 120
+
+# Arguments for 'npm outdated' / 'npm ls'
+# --depth=0: only top-level dependencies (the ones in package.json)
+# --no-audit / --no-fund: skip the security audit and funding lookups,
+#   which we never read
+NPM_OUTDATED_ARGS = ('outdated', '--json', '--depth=0', '--no-audit', '--no-fund')
+NPM_LS_ARGS = ('ls', '--json', '--depth=0', '--no-audit', '--no-fund')
+
+# How many 'npm outdated' processes check_outdated_many() runs at once
+MAX_CONCURRENT_CHECKS = 8
+
+# Where cached 'npm outdated' results are stored (override with
+# paths.npm_cache_directory in config.yaml)
+DEFAULT_OUTDATED_CACHE_DIR = os.path.join(
+    os.path.expanduser('~'), '.openclaw', 'npm_outdated_cache'
+)
+
+# How long a cached 'npm outdated' result stays valid (seconds)
+# (override with agent.cache_ttl in config.yaml)
+DEFAULT_CACHE_TTL = 3600
+
+
+@functools.lru_cache(maxsize=256)
+def _load_pkg_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse a package.json file (cached).
+    
+    mtime_ns is part of the cache key, so when the file is modified the
+    next call misses the cache and reads it again.
+    
+    Raises:
+        IOError / json.JSONDecodeError: Left to the caller to handle
+    """
+    return fast_json.load_file(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_entries(repo_path: str, mtime_ns: int) -> frozenset:
+    """
+    List the names of everything directly inside a directory (cached).
+    
+    A directory's mtime changes whenever an entry is added or removed,
+    so using it in the cache key means a stale listing is never reused.
+    """
+    with os.scandir(repo_path) as entries:
+        return frozenset(entry.name for entry in entries)
+
+
+def _repo_entries(repo_path: str) -> Optional[frozenset]:
+    """
+    Get the top-level entry names of a repository with one stat call.
+    
+    Args:
+        repo_path: Path to the repository
+    
+    Returns:
+        Set of file/folder names, or None if the directory doesn't exist
+    """
+    try:
+        mtime_ns = os.stat(repo_path).st_mtime_ns
+        return _scan_entries(repo_path, mtime_ns)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _npm_executable() -> Optional[str]:
+    """
+    Find the full path of the npm program (searched once, then cached).
+    
+    Without a shell, Windows can't run plain 'npm' (the real file is
+    npm.cmd), so we look up the full path ourselves.
+    
+    Returns:
+        Full path to npm, or None if it isn't on PATH
+    """
+    return shutil.which('npm') or shutil.which('npm.cmd')
+
+
+def _npm_error(outdated_data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Get the error npm reported instead of an 'npm outdated' result.
+    
+    npm reports registry/network failures as {"error": {"code": ...}} -
+    that's not a package called "error".
+    
+    Args:
+        outdated_data: Parsed 'npm outdated --json' output
+    
+    Returns:
+        The error dictionary, or None if this is a normal result
+    """
+    if not isinstance(outdated_data, dict):
+        return None
+    error = outdated_data.get('error')
+    if isinstance(error, dict) and 'code' in error:
+        return error
+    return None
+
+
+# Pulls the five version fields out of one 'npm outdated' entry in a single call
+_get_package_fields = operator.itemgetter(
+    'current', 'wanted', 'latest', 'dependent', 'location'
+)
+
+
+# ============================================================================
+# PACKAGE CLASS - One outdated package reported by npm
+# ============================================================================
+
+@dataclass(frozen=True)
+class Package:
+    """
+    An outdated package reported by 'npm outdated'.
+    
+    __slots__ means each Package stores its six fields directly instead
+    of in a per-object dictionary, so a big list of them uses much less
+    memory and reading pkg.name is a fast attribute lookup.
+    
+    Older code that treats packages as dictionaries (pkg['name'],
+    pkg.get('latest')) keeps working.
+    
+    Attributes:
+        name: Package name
+        current: Currently installed version
+        wanted: Version that satisfies the semver range
+        latest: Latest available version
+        dependent: Package that depends on this
+        location: Where the package is installed
+    """
+    
+    # Written out by hand (not slots=True) so this works on Python 3.9
+    __slots__ = ('name', 'current', 'wanted', 'latest', 'dependent', 'location')
+    
+    name: str
+    current: str
+    wanted: str
+    latest: str
+    dependent: str
+    location: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Package':
+        """Build a Package from a dictionary with the same keys (missing ones get defaults)."""
+        return cls(
+            name=data['name'],
+            current=data.get('current', 'N/A'),
+            wanted=data.get('wanted', 'N/A'),
+            latest=data.get('latest', 'N/A'),
+            dependent=data.get('dependent', 'unknown'),
+            location=data.get('location', '')
+        )
+    
+    def as_dict(self) -> Dict[str, str]:
+        """Return the package as a plain dictionary (e.g. for JSON output)."""
+        return asdict(self)
+    
+    def __getitem__(self, key: str) -> str:
+        # Lets old code keep using pkg['name']
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        # Lets old code keep using pkg.get('name')
+        return getattr(self, key, default)
+
 
 # ============================================================================
 # DEPENDENCY CHECKER CLASS - Checks for outdated packages
@@ -77,8 +314,198 @@ class DependencyChecker:
         """
         self.config = config
         self.logger = logger
+        
+        # Outdated checks currently running, by absolute repo path
+        # (so two threads checking the same repo share one npm run)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Find npm once, so we can run it directly (no shell needed)
+        self._npm = _npm_executable()
+        if self._npm is None:
+            # Keep going with plain 'npm' - the commands will report
+            # "npm is not installed" if it really is missing
+            self._npm = 'npm'
+            if self.logger:
+                self.logger.warning("npm was not found in PATH")
+        
+        # Settings for the on-disk 'npm outdated' cache
+        self.cache_dir = config.get('paths', {}).get(
+            'npm_cache_directory', DEFAULT_OUTDATED_CACHE_DIR
+        )
+        self.cache_ttl = config.get('agent', {}).get('cache_ttl', DEFAULT_CACHE_TTL)
+        
+        # repo path -> (manifest size/mtime fingerprint, content hash)
+        # Lets unchanged repos skip re-hashing package-lock.json
+        self._cache_key_memo: Dict[str, Tuple[Tuple, str]] = {}
+
+    # ------------------------------------------------------------------
+    # 'npm outdated' result cache
+    # ------------------------------------------------------------------
 
-    def check_outdated(self, repo_path: str) -> List[Dict[str, Any]]:
+    def _manifest_stat_key(self, repo_path: str) -> Optional[Tuple]:
+        """
+        Cheap fingerprint of the manifest files from their size and mtime.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            Tuple of (mtime_ns, size) pairs, or None if package.json is missing
+        """
+        stat_key = []
+        
+        for filename in ('package.json', 'package-lock.json'):
+            try:
+                st = os.stat(os.path.join(repo_path, filename))
+                stat_key.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                # package-lock.json is optional, package.json is not
+                if filename == 'package.json':
+                    return None
+                stat_key.append(None)
+        
+        return tuple(stat_key)
+
+    def _outdated_cache_key(self, repo_path: str) -> Optional[str]:
+        """
+        Build the cache key for a repo from its manifest file contents.
+        
+        The key is the SHA-1 of package.json + package-lock.json, so any
+        change to either file automatically gives a new key (a cache miss).
+        
+        Hashing a big lockfile isn't free, so the key is remembered per
+        repo along with the files' sizes and mtimes. While those stay the
+        same, the files are not read or hashed again.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            A hex string, or None if package.json can't be read
+        """
+        memo_key = os.path.abspath(repo_path)
+        stat_key = self._manifest_stat_key(repo_path)
+        if stat_key is None:
+            return None
+        
+        remembered = self._cache_key_memo.get(memo_key)
+        if remembered is not None and remembered[0] == stat_key:
+            return remembered[1]
+        
+        digest = hashlib.sha1()
+        
+        for filename in ('package.json', 'package-lock.json'):
+            try:
+                with open(os.path.join(repo_path, filename), 'rb') as f:
+                    digest.update(f.read())
+            except FileNotFoundError:
+                # package-lock.json is optional, package.json is not
+                if filename == 'package.json':
+                    return None
+            except IOError:
+                return None
+        
+        cache_key = digest.hexdigest()
+        self._cache_key_memo[memo_key] = (stat_key, cache_key)
+        return cache_key
+
+    def _read_outdated_cache(self, key: str) -> Optional[List[Package]]:
+        """
+        Return the cached package list for a key if it is still fresh.
+        
+        Args:
+            key: Cache key from _outdated_cache_key()
+        
+        Returns:
+            The cached package list, or None on a miss / expired entry
+        """
+        cache_file = os.path.join(self.cache_dir, f'{key}.json')
+        
+        try:
+            age = time.time() - os.path.getmtime(cache_file)
+            if age > self.cache_ttl:
+                return None
+            
+            return [Package.from_dict(item) for item in fast_json.load_file(cache_file)]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or corrupt cache file - just treat it as a miss
+            return None
+
+    def _write_outdated_cache(self, key: str, packages: List[Package]):
+        """
+        Save a package list to the cache.
+        
+        The data is written to a temporary file first and then moved into
+        place with os.replace(), so a reader never sees a half-written file.
+        
+        Args:
+            key: Cache key from _outdated_cache_key()
+            packages: The parsed 'npm outdated' result
+        """
+        cache_file = os.path.join(self.cache_dir, f'{key}.json')
+        temp_file = f'{cache_file}.tmp'
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump([pkg.as_dict() for pkg in packages], f)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            # Caching is only an optimisation - never fail the check over it
+            if self.logger:
+                self.logger.debug(f"Could not write outdated cache: {e}")
+
+    def invalidate_cache(self, repo_path: str) -> bool:
+        """
+        Remove the cached 'npm outdated' result for a repository.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            True if a cache entry was removed, False otherwise
+        
+        Example:
+            checker.invalidate_cache('./repos/my-project')
+            outdated = checker.check_outdated('./repos/my-project')  # runs npm
+        """
+        key = self._outdated_cache_key(repo_path)
+        if key is None:
+            return False
+        
+        try:
+            os.remove(os.path.join(self.cache_dir, f'{key}.json'))
+            return True
+        except OSError:
+            return False
+
+    def cached_outdated(self, repo_path: str) -> Optional[List[Package]]:
+        """
+        Get the cached 'npm outdated' result for a repo, without running npm.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            The outdated package list from the last check of the same
+            package.json + package-lock.json, or None if there's no fresh one
+        
+        Example:
+            outdated = checker.cached_outdated(repo_path)
+            if outdated is None:
+                outdated = checker.check_outdated(repo_path)
+        """
+        cache_key = self._outdated_cache_key(repo_path)
+        if not cache_key:
+            return None
+        return self._read_outdated_cache(cache_key)
+
+    def check_outdated(
+        self, 
+        repo_path: str, 
+        snapshot: Optional[RepoSnapshot] = None
+    ) -> List[Package]:
         """
         Check for outdated packages in a repository.
         
@@ -87,9 +514,12 @@ class DependencyChecker:
         
         Args:
             repo_path: Path to the repository to check
+            snapshot: Optional RepoSnapshot already loaded for this repo.
+                      When given, package.json is known to exist and we
+                      skip checking the disk again.
         
         Returns:
-            List of dictionaries, each containing package information:
+            List of Package objects, each containing package information:
             - name: Package name
             - current: Currently installed version
             - wanted: Version that satisfies semver range
@@ -100,82 +530,265 @@ class DependencyChecker:
         Example:
             outdated = checker.check_outdated('./repos/my-project')
             for pkg in outdated:
-                print(f"{pkg['name']}: {pkg['current']} -> {pkg['latest']}")
+                print(f"{pkg.name}: {pkg.current} -> {pkg.latest}")
+        
+        Note:
+            If another thread is already checking the same repo, this
+            call waits for that check and returns its result instead of
+            starting a second npm process.
         """
+        key = os.path.abspath(repo_path)
+        
+        # Is someone already checking this repo? If not, we become the
+        # "owner" and register a Future the other callers can wait on.
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            if self.logger:
+                self.logger.info(f"Waiting for the running outdated check of {repo_path}")
+            return future.result()
+        
+        try:
+            packages = self._check_outdated(repo_path, snapshot)
+            future.set_result(packages)
+            return packages
+        except BaseException as e:
+            # Waiting callers get the same error we do
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _check_outdated(
+        self, 
+        repo_path: str, 
+        snapshot: Optional[RepoSnapshot]
+    ) -> List[Package]:
+        """Do the actual work of check_outdated() (always runs npm unless cached)."""
         if self.logger:
             self.logger.info("Checking for outdated packages")
         
-        # Validate that the repo exists
-        if not os.path.exists(repo_path):
-            if self.logger:
-                self.logger.error(f"Repository not found: {repo_path}")
-            return []
+        # A snapshot means the repo and its package.json were already read
+        if snapshot is None:
+            # One directory listing answers both questions below
+            entries = _repo_entries(repo_path)
+            
+            # Validate that the repo exists
+            if entries is None:
+                if self.logger:
+                    self.logger.error(f"Repository not found: {repo_path}")
+                return []
+            
+            # Check if package.json exists
+            if 'package.json' not in entries:
+                if self.logger:
+                    self.logger.warning(f"No package.json found in {repo_path}")
+                return []
         
-        # Check if package.json exists
-        package_json = os.path.join(repo_path, 'package.json')
-        if not os.path.exists(package_json):
-            if self.logger:
-                self.logger.warning(f"No package.json found in {repo_path}")
-            return []
+        # Same package.json + package-lock.json as a recent check?
+        # Then reuse that result instead of asking the npm registry again
+        cache_key = self._outdated_cache_key(repo_path)
+        if cache_key:
+            cached = self._read_outdated_cache(cache_key)
+            if cached is not None:
+                if self.logger:
+                    self.logger.info(f"Using cached npm outdated result ({len(cached)} packages)")
+                return cached
         
         try:
             # Run 'npm outdated --json' command
             # --json gives us machine-readable output
             
-            # On Windows, we need to use shell=True to find npm
-            # or we can explicitly pass the environment
-            result = subprocess.run(
-                ['npm', 'outdated', '--json'],
+            # We run the npm path found in __init__ directly - no shell.
+            #
+            # Popen + communicate() gives us stdout as raw bytes, which go
+            # straight to the JSON parser (no text decoding step, no
+            # extra str copy). stderr isn't used, so it is discarded.
+            with subprocess.Popen(
+                [self._npm, *NPM_OUTDATED_ARGS],
                 cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout
-                shell=True    # Use shell on Windows to find npm
-            )
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as process:
+                try:
+                    output, _ = process.communicate(timeout=NPM_OUTDATED_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    # Don't leave a stuck npm process behind
+                    process.kill()
+                    process.communicate()
+                    raise
             
             # npm outdated returns exit code 1 when there are outdated packages
             # (it's not an error, just indicating packages are outdated)
-            # So we capture both stdout and stderr regardless of return code
-            
-            output = result.stdout
-            
-            # Handle empty output (no outdated packages)
-            if not output or output.strip() == '':
-                if self.logger:
-                    self.logger.info("No outdated packages found")
-                return []
+            # Any other code means npm itself failed
+            return self._packages_from_npm_output(output, cache_key, process.returncode)
             
-            # Parse the JSON output
-            # npm outdated returns a dictionary like:
-            # {
-            #   "lodash": {
-            #     "current": "4.17.15",
-            #     "wanted": "4.17.21",
-            #     "latest": "4.17.21",
-            #     "dependent": "myproject",
-            #     "location": "/path/to/node_modules/lodash"
-            #   }
-            # }
-            try:
-                outdated_data = json.loads(output)
-            except json.JSONDecodeError as e:
-                if self.logger:
-                    self.logger.error(f"Failed to parse npm output: {e}")
-                return []
-            
-            # Convert the dictionary into a list of packages
-            packages = self.parse_outdated_packages(outdated_data)
+        except subprocess.TimeoutExpired:
+            if self.logger:
+                self.logger.error("npm outdated command timed out")
+            return []
             
+        except FileNotFoundError:
             if self.logger:
-                self.logger.info(f"Found {len(packages)} outdated packages")
-                for pkg in packages:
-                    self.logger.info(
-                        f"  {pkg['name']}: {pkg['current']} -> {pkg['latest']}"
-                    )
+                self.logger.error("npm is not installed or not in PATH")
+            return []
             
-            return packages
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error checking outdated packages: {e}")
+            return []
+
+    def _packages_from_npm_output(
+        self, 
+        output: Union[str, bytes], 
+        cache_key: Optional[str] = None,
+        returncode: int = 0
+    ) -> List[Package]:
+        """
+        Turn the text printed by 'npm outdated --json' into a package list.
+        
+        Shared by check_outdated() and check_outdated_async().
+        
+        Args:
+            output: The stdout of 'npm outdated --json' (str or raw bytes)
+            cache_key: If given, a successfully parsed result is cached
+            returncode: npm's exit code (0 or 1 means it ran normally)
+        
+        Returns:
+            List of package dictionaries (empty if nothing is outdated,
+            npm failed or the output can't be parsed)
+        """
+        # Crashed or killed npm (often with no output at all) - that's not
+        # "nothing outdated", so don't cache it
+        if returncode not in (0, 1):
+            if self.logger:
+                self.logger.error(f"npm outdated failed with exit code {returncode}")
+            return []
+        
+        # Handle empty output (no outdated packages)
+        if not output or not output.strip():
+            if self.logger:
+                self.logger.info("No outdated packages found")
+            if cache_key:
+                self._write_outdated_cache(cache_key, [])
+            return []
+        
+        # Parse the JSON output
+        # npm outdated returns a dictionary like:
+        # {
+        #   "lodash": {
+        #     "current": "4.17.15",
+        #     "wanted": "4.17.21",
+        #     "latest": "4.17.21",
+        #     "dependent": "myproject",
+        #     "location": "/path/to/node_modules/lodash"
+        #   }
+        # }
+        try:
+            outdated_data = fast_json.loads(output)
+        except fast_json.JSONDecodeError as e:
+            if self.logger:
+                self.logger.error(f"Failed to parse npm output: {e}")
+            return []
+        
+        # An npm error is not a package, and it must never be cached
+        error = _npm_error(outdated_data)
+        if error is not None:
+            if self.logger:
+                self.logger.error(f"npm outdated failed: {error.get('summary', error['code'])}")
+            return []
+        
+        # Convert the dictionary into a list of packages
+        packages = self.parse_outdated_packages(outdated_data)
+        
+        if cache_key:
+            self._write_outdated_cache(cache_key, packages)
+        
+        # One log call for the whole list, and only built if INFO is on
+        if is_enabled_for(self.logger, logging.INFO):
+            lines = [f"Found {len(packages)} outdated packages"]
+            lines.extend(
+                f"  {pkg.name}: {pkg.current} -> {pkg.latest}" for pkg in packages
+            )
+            self.logger.info("\n".join(lines))
+        
+        return packages
+
+    async def _run_npm_outdated(self, repo_path: str) -> Tuple[bytes, int]:
+        """
+        Run 'npm outdated --json' without blocking the event loop.
+        
+        Args:
+            repo_path: Path to the repository to check
+        
+        Returns:
+            (stdout as raw bytes, exit code)
+        
+        Raises:
+            asyncio.TimeoutError: If npm takes longer than NPM_OUTDATED_TIMEOUT
+            FileNotFoundError: If npm is not installed
+        """
+        process = await asyncio.create_subprocess_exec(
+            self._npm, *NPM_OUTDATED_ARGS,
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        try:
+            stdout, _ = await asyncio.wait_for(
+                process.communicate(),
+                NPM_OUTDATED_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # Don't leave a stuck npm process behind
+            process.kill()
+            await process.wait()
+            raise
+        
+        return stdout, process.returncode
+
+    async def check_outdated_async(
+        self, 
+        repo_path: str, 
+        snapshot: Optional[RepoSnapshot] = None
+    ) -> List[Package]:
+        """
+        Async version of check_outdated().
+        
+        Same arguments and result as check_outdated(), but npm runs as an
+        asyncio subprocess so several repos can be checked at once.
+        
+        Example:
+            outdated = asyncio.run(checker.check_outdated_async(repo_path))
+        """
+        if self.logger:
+            self.logger.info(f"Checking for outdated packages in {repo_path}")
+        
+        if snapshot is None and not self.has_package_json(repo_path):
+            if self.logger:
+                self.logger.warning(f"No package.json found in {repo_path}")
+            return []
+        
+        cache_key = self._outdated_cache_key(repo_path)
+        if cache_key:
+            cached = self._read_outdated_cache(cache_key)
+            if cached is not None:
+                if self.logger:
+                    self.logger.info(f"Using cached npm outdated result ({len(cached)} packages)")
+                return cached
+        
+        try:
+            output, returncode = await self._run_npm_outdated(repo_path)
+            return self._packages_from_npm_output(output, cache_key, returncode)
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             if self.logger:
                 self.logger.error("npm outdated command timed out")
             return []
@@ -190,47 +803,84 @@ class DependencyChecker:
                 self.logger.error(f"Error checking outdated packages: {e}")
             return []
 
-    def parse_outdated_packages(self, json_output: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def check_outdated_many(
+        self, 
+        repo_paths: List[str],
+        max_concurrency: int = MAX_CONCURRENT_CHECKS
+    ) -> Dict[str, List[Package]]:
+        """
+        Check several repositories for outdated packages at the same time.
+        
+        'npm outdated' mostly waits on the network, so running the checks
+        side by side takes about as long as the slowest one instead of
+        the sum of all of them. A semaphore caps how many run at once.
+        
+        Args:
+            repo_paths: Paths of the repositories to check
+            max_concurrency: Most npm processes to run at the same time
+        
+        Returns:
+            Dictionary mapping each repo path to its outdated package list
+        
+        Example:
+            results = asyncio.run(checker.check_outdated_many(paths))
+            for path, outdated in results.items():
+                print(f"{path}: {len(outdated)} outdated")
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def check_one(repo_path: str) -> List[Package]:
+            async with semaphore:
+                return await self.check_outdated_async(repo_path)
+        
+        results = await asyncio.gather(*(check_one(path) for path in repo_paths))
+        return dict(zip(repo_paths, results))
+
+    def parse_outdated_packages(self, json_output: Dict[str, Any]) -> List[Package]:
         """
         Parse the npm outdated JSON output into a list format.
         
         npm outdated returns a dictionary where keys are package names.
-        This converts it to a list of dictionaries for easier processing.
+        This converts it to a list of Package objects for easier processing.
         
         Args:
             json_output: The JSON output from npm outdated
         
         Returns:
-            List of package dictionaries with standardized keys
+            List of Package objects
         
         Example:
             Input: {"lodash": {"current": "4.17.15", "wanted": "4.17.21", ...}}
-            Output: [{"name": "lodash", "current": "4.17.15", "wanted": "4.17.21", ...}]
+            Output: [Package(name="lodash", current="4.17.15", wanted="4.17.21", ...)]
         """
         packages = []
         
-        # Iterate through each package in the dictionary
         # .items() gives us both key (name) and value (info)
         for name, info in json_output.items():
-            # Create a standardized package dictionary
-            package_info = {
-                'name': name,  # Package name
-                'current': info.get('current', 'N/A'),  # Currently installed version
-                'wanted': info.get('wanted', 'N/A'),    # Wanted version (semver range)
-                'latest': info.get('latest', 'N/A'),    # Latest available version
-                'dependent': info.get('dependent', 'unknown'),  # Parent package
-                'location': info.get('location', '')    # File location
-            }
+            try:
+                # Fast path: npm gave us all five fields, so grab them
+                # with one itemgetter call instead of five .get() calls
+                current, wanted, latest, dependent, location = _get_package_fields(info)
+            except KeyError:
+                # Some field is missing (e.g. 'current' for a package that
+                # isn't installed yet) - fill in defaults one by one
+                current = info.get('current', 'N/A')          # Currently installed version
+                wanted = info.get('wanted', 'N/A')            # Wanted version (semver range)
+                latest = info.get('latest', 'N/A')            # Latest available version
+                dependent = info.get('dependent', 'unknown')  # Parent package
+                location = info.get('location', '')           # File location
             
-            packages.append(package_info)
+            packages.append(
+                Package(name, current, wanted, latest, dependent, location)
+            )
         
         return packages
 
     def filter_packages_to_upgrade(
         self, 
-        outdated_list: List[Dict[str, Any]], 
+        outdated_list: List[Package], 
         memory: Any
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Package]:
         """
         Filter out packages that were recently upgraded.
         
@@ -258,28 +908,27 @@ class DependencyChecker:
         
         # Get list of packages that were recently upgraded
         # This uses the memory manager to check history
-        recently_upgraded = set()
-        
+        # (a frozenset makes each "is this name in it?" check instant)
+        recently_upgraded = frozenset()
         if memory:
             # Get packages upgraded in the last 7 days
-            recent = memory.get_recently_upgraded_packages(days=7)
-            recently_upgraded = set(recent)
-            
-            if recently_upgraded and self.logger:
-                self.logger.info(
-                    f"Excluding recently upgraded packages: {recently_upgraded}"
-                )
-        
-        # Filter out recently upgraded packages
-        filtered = []
-        for pkg in outdated_list:
-            if pkg['name'] in recently_upgraded:
-                if self.logger:
-                    self.logger.info(
-                        f"Skipping {pkg['name']} - upgraded recently"
-                    )
-            else:
-                filtered.append(pkg)
+            recently_upgraded = frozenset(
+                memory.get_recently_upgraded_packages(days=7) or ()
+            )
+        
+        # Filter out recently upgraded packages in one pass
+        filtered = [
+            pkg for pkg in outdated_list
+            if pkg.name not in recently_upgraded
+        ]
+        
+        # Only build the list of skipped names if someone will see it
+        if recently_upgraded and is_debug_enabled(self.logger):
+            skipped = [
+                pkg.name for pkg in outdated_list
+                if pkg.name in recently_upgraded
+            ]
+            self.logger.debug(f"Skipping recently upgraded packages: {skipped}")
         
         if self.logger:
             self.logger.info(
@@ -302,32 +951,69 @@ class DependencyChecker:
             pkg_json = checker.get_package_json('./repos/my-project')
             name = pkg_json.get('name')
         """
-        package_json_path = os.path.join(repo_path, 'package.json')
-        
-        if not os.path.exists(package_json_path):
+        return self._read_package_json_file(os.path.join(repo_path, 'package.json'))
+
+    def _read_package_json_file(self, package_json_path: str) -> Optional[Dict[str, Any]]:
+        """Read a package.json given its full path (shared with bind())."""
+        try:
+            # One stat call gives us both "does it exist?" and the
+            # modification time used as part of the cache key
+            mtime_ns = os.stat(package_json_path).st_mtime_ns
+        except FileNotFoundError:
             if self.logger:
                 self.logger.warning(f"package.json not found at {package_json_path}")
             return None
         
         try:
-            with open(package_json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            # Copy so callers can freely modify what they get back
+            return copy.deepcopy(_load_pkg_json(package_json_path, mtime_ns))
+        except (fast_json.JSONDecodeError, IOError) as e:
             if self.logger:
                 self.logger.error(f"Failed to read package.json: {e}")
             return None
 
-    def get_installed_packages(self, repo_path: str) -> List[str]:
+    def check_outdated_and_installed(
+        self, 
+        repo_path: str
+    ) -> Tuple[List[Package], List[str]]:
         """
-        Get a list of all installed packages.
+        Run check_outdated() and a verified get_installed_packages() at the same time.
         
-        This runs 'npm ls --depth=0' to get all top-level dependencies.
+        Both spawn npm and mostly wait on it, and neither needs the other's
+        result, so running them in two threads takes about as long as the
+        slower one instead of both added together.
         
         Args:
             repo_path: Path to the repository
         
         Returns:
-            List of installed package names
+            Tuple of (outdated packages, installed package names)
+        
+        Example:
+            outdated, installed = checker.check_outdated_and_installed(repo_path)
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            outdated_future = pool.submit(self.check_outdated, repo_path)
+            installed_future = pool.submit(
+                self.get_installed_packages, repo_path, verify=True
+            )
+            return outdated_future.result(), installed_future.result()
+
+    def get_installed_packages(self, repo_path: str, verify: bool = False) -> List[str]:
+        """
+        Get a list of the project's top-level packages.
+        
+        By default this just reads the dependency names from package.json
+        (no npm process needed). Pass verify=True to ask 'npm ls' which of
+        them are really installed in node_modules.
+        
+        Args:
+            repo_path: Path to the repository
+            verify: If True, run 'npm ls --depth=0' and only return
+                    packages npm reports as installed
+        
+        Returns:
+            List of package names
         
         Example:
             installed = checker.get_installed_packages('./repos/my-project')
@@ -336,35 +1022,39 @@ class DependencyChecker:
         if self.logger:
             self.logger.info("Getting installed packages")
         
+        # Get dependencies from package.json
+        package_json = self.get_package_json(repo_path)
+        if not package_json:
+            return []
+        
+        # Combine dependencies and devDependencies
+        packages = (
+            list(package_json.get('dependencies', {})) +
+            list(package_json.get('devDependencies', {}))
+        )
+        
+        if not verify:
+            return packages
+        
         try:
             result = subprocess.run(
-                ['npm', 'ls', '--depth=0', '--json'],
+                [self._npm, *NPM_LS_ARGS],
                 cwd=repo_path,
                 capture_output=True,
-                text=True,
                 timeout=60
             )
             
             output = result.stdout
-            if not output or output.strip() == '':
-                return []
-            
-            data = json.loads(output)
-            
-            # Get dependencies from package.json
-            package_json = self.get_package_json(repo_path)
-            if not package_json:
+            if not output or not output.strip():
                 return []
             
-            packages = []
-            
-            # Combine dependencies and devDependencies
-            deps = package_json.get('dependencies', {})
-            dev_deps = package_json.get('devDependencies', {})
-            
-            packages = list(deps.keys()) + list(dev_deps.keys())
-            
-            return packages
+            # npm ls lists installed packages under "dependencies";
+            # ones that are declared but not installed say "missing": true
+            installed = fast_json.loads(output).get('dependencies', {})
+            return [
+                name for name in packages
+                if name in installed and not installed[name].get('missing')
+            ]
             
         except Exception as e:
             if self.logger:
@@ -385,8 +1075,7 @@ class DependencyChecker:
             if checker.has_package_json('./repos/my-project'):
                 print("This is a Node.js project")
         """
-        package_json = os.path.join(repo_path, 'package.json')
-        return os.path.exists(package_json)
+        return 'package.json' in (_repo_entries(repo_path) or ())
 
     def has_node_modules(self, repo_path: str) -> bool:
         """
@@ -402,8 +1091,76 @@ class DependencyChecker:
             if not checker.has_node_modules('./repos/my-project'):
                 print("Need to run npm install first")
         """
-        node_modules = os.path.join(repo_path, 'node_modules')
-        return os.path.exists(node_modules)
+        return 'node_modules' in (_repo_entries(repo_path) or ())
+
+    def clear_cache(self):
+        """
+        Forget all cached package.json reads and directory listings.
+        
+        Useful for long-running processes (like the web dashboard) that
+        want to be sure the next call looks at the disk again.
+        
+        Example:
+            checker.clear_cache()
+        """
+        _load_pkg_json.cache_clear()
+        _scan_entries.cache_clear()
+        self._cache_key_memo.clear()
+
+    def bind(self, repo_path: str) -> '_BoundChecker':
+        """
+        Get a checker tied to one repository.
+        
+        The bound checker works out the repo's file paths once, which
+        helps loops that run many checks against the same repo.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            A _BoundChecker for that repository
+        
+        Example:
+            repo = checker.bind('./repos/my-project')
+            if repo.has_package_json() and not repo.has_node_modules():
+                print("Need to run npm install first")
+        """
+        return _BoundChecker(self, repo_path)
+
+
+class _BoundChecker:
+    """
+    A DependencyChecker tied to a single repository (made by bind()).
+    
+    The package.json path is joined once here instead of on every call,
+    and the has_*() checks read the cached directory listing directly.
+    Everything else is handed to the parent DependencyChecker.
+    """
+    
+    __slots__ = ('checker', 'repo_path', '_pkg_json_path')
+    
+    def __init__(self, checker: DependencyChecker, repo_path: str):
+        self.checker = checker
+        self.repo_path = repo_path
+        self._pkg_json_path = os.path.join(repo_path, 'package.json')
+    
+    def has_package_json(self) -> bool:
+        return 'package.json' in (_repo_entries(self.repo_path) or ())
+    
+    def has_node_modules(self) -> bool:
+        return 'node_modules' in (_repo_entries(self.repo_path) or ())
+    
+    def has_package_lock(self) -> bool:
+        return 'package-lock.json' in (_repo_entries(self.repo_path) or ())
+    
+    def get_package_json(self) -> Optional[Dict[str, Any]]:
+        return self.checker._read_package_json_file(self._pkg_json_path)
+    
+    def check_outdated(self, snapshot: Optional[RepoSnapshot] = None) -> List[Package]:
+        return self.checker.check_outdated(self.repo_path, snapshot)
+    
+    def get_installed_packages(self, verify: bool = False) -> List[str]:
+        return self.checker.get_installed_packages(self.repo_path, verify)
 
 
 # ============================================================================
@@ -412,7 +1169,11 @@ class DependencyChecker:
 
 def get_dependency_checker(config: Dict[str, Any], logger) -> DependencyChecker:
     """
-    Create a DependencyChecker instance.
+    Get a DependencyChecker instance.
+    
+    Every call builds a new instance: a DependencyChecker keeps per-run state
+    (in-flight npm runs, cache keys), so a shared one would let one guardian
+    overwrite another's.
     
     Args:
         config: Configuration dictionary
@@ -482,12 +1243,13 @@ if __name__ == "__main__":
         
         # Check for outdated packages
         print(f"\n=== Checking Outdated Packages ===")
-        outdated = checker.check_outdated(repo_path)
+        outdated, installed = checker.check_outdated_and_installed(repo_path)
+        print(f"Installed top-level packages: {len(installed)}")
         
         if outdated:
             print(f"Found {len(outdated)} outdated packages:")
             for pkg in outdated:
-                print(f"  {pkg['name']}: {pkg['current']} -> {pkg['latest']}")
+                print(f"  {pkg.name}: {pkg.current} -> {pkg.latest}")
         else:
             print("All packages are up to date!")
         
@@ -4,6 +4,20 @@ Memory Manager - Handles persistent memory for OpenClaw Guardian
 This module stores what the agent has done so it doesn't repeat work.
 It saves information to memory.json and reads it back when needed.
 
+Upgrade history is kept in a second file next to it,
+memory.upgrades.jsonl, with one JSON object per line. Recording an
+upgrade just adds a line to the end of that file instead of rewriting
+everything we've ever remembered.
+
+If the optional msgpack library is installed, the history can be stored
+as MessagePack instead (memory.upgrades.msgpack) - a compact binary
+format that is smaller and faster to read than JSON. Turn it on with
+upgrades_format='msgpack'.
+
+Changes are kept in memory until flush() is called (or the manager is
+used as a context manager: "with MemoryManager(...) as memory:"), so a
+run that changes several things still writes to disk only once.
+
 Think of this as the agent's "memory" - it remembers:
 - When it last checked for updates
 - Which packages were already upgraded
@@ -11,7 +25,9 @@ Think of this as the agent's "memory" - it remembers:
 - Links to created PRs
 
 Beginner Python Notes:
-- json: Built-in library for reading/writing JSON files
+- json: A text format for storing data (like dictionaries)
+- JSON Lines (.jsonl): a text file with one JSON value on each line
+- MessagePack: like JSON, but binary; records can be appended one after another
 - datetime: Built-in library for dates and times
 - pathlib: For file path operations
 - Optional: Type hint meaning value can be None
@@ -21,17 +37,26 @@ Beginner Python Notes:
 # IMPORTS - Bring in external libraries we need
 # ============================================================================
 
-import json
-# json: Built-in Python library for working with JSON data
-# JSON is a text format for storing data (like dictionaries)
-# json.load() reads JSON from a file
-# json.dump() writes JSON to a file
-
 import os
 # os: Built-in Python library for file operations
 # os.path.exists() checks if a file exists
 # os.makedirs() creates directories
 
+import sys
+# sys: Built-in library for system operations
+# sys.path is used to add directories to Python's import search path
+
+# When this file is run directly (python skills/memory_manager.py) the
+# project folder isn't on the import path yet, so add it before importing
+# from utils/ (an import from main.py or the tests already has it)
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import fast_json
+# fast_json: Our JSON helpers (use orjson when it's installed)
+# fast_json.load_file() reads JSON from a file
+# fast_json.dumps() turns data into JSON bytes
+
 from datetime import datetime, timezone
 # datetime: Built-in library for dates and times
 # datetime.now() gets current time
@@ -41,12 +66,140 @@ from datetime import datetime, timezone
 from pathlib import Path
 # pathlib: Built-in library for file paths
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 # typing: Library for type hints
 # Any: Any type of value
 # Dict: Dictionary type
 # List: List type
 # Optional: Can be None
+# Tuple: Fixed-size sequence type
+
+import time
+# time: Built-in library for time functions
+# time.time() is the current time as seconds since the epoch (cheap to call)
+# time.monotonic() is a clock that never jumps (used to time unsaved changes)
+
+try:
+    from ciso8601 import parse_datetime
+    # ciso8601: Optional C library that parses ISO 8601 timestamps much
+    # faster than datetime.fromisoformat() (and understands "Z" itself)
+    # Install with: pip install ciso8601
+except ImportError:
+    parse_datetime = None
+
+try:
+    import msgpack
+    # msgpack: Optional third-party library for MessagePack encoding
+    # Install with: pip install msgpack
+except ImportError:
+    msgpack = None
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# Seconds in one day (used to turn "days" into a cutoff timestamp)
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Most upgrade entries to keep; the oldest are dropped beyond this so the
+# history (and every scan over it) can't grow forever
+MAX_UPGRADE_ENTRIES = 5000
+
+# On-disk formats for the upgrade history, and the file extension of each
+UPGRADE_FORMATS = {
+    'jsonl': '.upgrades.jsonl',
+    'msgpack': '.upgrades.msgpack',
+}
+
+
+def _parse_timestamp(timestamp_str: str) -> Optional[float]:
+    """
+    Turn an ISO timestamp string into seconds since the epoch.
+    
+    Args:
+        timestamp_str: e.g. "2024-01-15T10:35:00Z" or "...+00:00"
+    
+    Returns:
+        The timestamp as a float, or None if it is missing or invalid
+    """
+    if not timestamp_str:
+        return None
+    
+    try:
+        if parse_datetime is not None:
+            return parse_datetime(timestamp_str).timestamp()
+        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def upgrades_file_for(memory_file: str, upgrades_format: str = 'jsonl') -> str:
+    """
+    Get the path of the upgrade history file that belongs to a memory file.
+    
+    Args:
+        memory_file: e.g. "./memory.json"
+        upgrades_format: 'jsonl' or 'msgpack'
+    
+    Returns:
+        e.g. "./memory.upgrades.jsonl"
+    """
+    return os.path.splitext(memory_file)[0] + UPGRADE_FORMATS[upgrades_format]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Get (modification time, size) of a file, or None if it doesn't exist.
+    
+    If either number changes, the file was written since we last looked.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _entry_for_disk(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an upgrade entry without in-memory-only fields (like '_ts')."""
+    return {key: value for key, value in entry.items() if key != '_ts'}
+
+
+def _entry_ts(entry: Dict[str, Any]) -> Optional[float]:
+    """
+    Get an upgrade entry's time as a float, parsing it at most once.
+    
+    The parsed value is kept on the entry under '_ts' (never saved to
+    disk), so later scans just compare numbers.
+    
+    Args:
+        entry: One item from memory['last_updated']
+    
+    Returns:
+        Seconds since the epoch, or None if the entry has no valid timestamp
+    """
+    if '_ts' not in entry:
+        entry['_ts'] = _parse_timestamp(entry.get('timestamp', ''))
+    return entry['_ts']
+
+
+def _add_to_index(index: Dict[str, float], entry: Dict[str, Any]) -> None:
+    """
+    Record an upgrade entry in a {package name: newest upgrade time} index.
+    
+    Args:
+        index: The index to update
+        entry: One item from memory['last_updated']
+    """
+    entry_time = _entry_ts(entry)
+    if entry_time is None:
+        return
+    
+    # Keep the newest time seen for each package
+    for package in entry.get('packages', []):
+        if entry_time > index.get(package, float('-inf')):
+            index[package] = entry_time
 
 
 # ============================================================================
@@ -70,34 +223,83 @@ class MemoryManager:
     {
         "repo_url": "https://github.com/user/project",
         "last_checked": "2024-01-15T10:30:00Z",
-        "last_updated": [
-            {
-                "branch": "auto/dependency-update-1705312200",
-                "packages": ["lodash", "axios"],
-                "timestamp": "2024-01-15T10:35:00Z",
-                "pr_url": "https://github.com/user/project/pull/5"
-            }
-        ],
         "total_runs": 15,
         "successful_upgrades": 8
     }
+    
+    Example memory.upgrades.jsonl (one upgrade per line, loaded into
+    memory['last_updated']):
+    {"branch": "auto/dependency-update-1705312200", "packages": ["lodash", "axios"], "timestamp": "2024-01-15T10:35:00Z", "pr_url": "https://github.com/user/project/pull/5"}
     """
     
-    def __init__(self, memory_file: str = 'memory.json', logger=None):
+    # What the files looked like the last time any manager loaded them:
+    # (memory file path, format) -> (file signatures, state, upgrades,
+    # index, saved count). Lets a new manager skip re-reading files that
+    # haven't changed.
+    _load_cache: Dict[Tuple[str, str], tuple] = {}
+    
+    def __init__(
+        self,
+        memory_file: str = 'memory.json',
+        logger=None,
+        upgrades_format: str = 'jsonl',
+        max_entries: int = MAX_UPGRADE_ENTRIES
+    ):
         """
         Initialize the MemoryManager.
         
         Args:
             memory_file: Path to the memory JSON file (defaults to 'memory.json')
             logger: Optional logger for logging messages
+            upgrades_format: How to store upgrade history: 'jsonl' (default)
+                or 'msgpack' (needs the msgpack library)
+            max_entries: Most upgrade entries to keep (oldest are dropped)
         
         Example:
             manager = MemoryManager('memory.json')
         """
+        if upgrades_format not in UPGRADE_FORMATS:
+            raise ValueError(f"Unknown upgrades_format: {upgrades_format}")
+        
+        if upgrades_format == 'msgpack' and msgpack is None:
+            if logger:
+                logger.warning("msgpack is not installed - storing upgrade history as JSON Lines")
+            upgrades_format = 'jsonl'
+        
         self.memory_file = memory_file
+        self.backup_file = f'{memory_file}.bak'
+        self.upgrades_format = upgrades_format
+        self.upgrades_file = upgrades_file_for(memory_file, upgrades_format)
+        self.max_entries = max_entries
         self.logger = logger
         self.memory: Dict[str, Any] = {}
         
+        # Which upgrade list is on disk in upgrades_file, and how many of
+        # its entries have been written. If record_upgrade() sees the same
+        # list with exactly one new entry it can append a single line;
+        # anything else (list replaced, entries removed) means a rewrite.
+        self._saved_upgrades: Optional[List[Dict[str, Any]]] = None
+        self._saved_upgrade_count = 0
+        
+        # True when memory has changes that flush() hasn't written yet,
+        # and when the oldest of those changes was made
+        self._dirty = False
+        self._dirty_since: Optional[float] = None
+        
+        # (hash of the bytes, file signature) of our last memory.json
+        # write, so writing the same content again can be skipped
+        self._last_saved: Optional[Tuple[int, Optional[Tuple[int, int]]]] = None
+        
+        # Index of {package name: time of its newest upgrade}, plus the
+        # list/length it was built from (see _latest_upgrade_ts())
+        self._upgrade_index: Dict[str, float] = {}
+        self._index_source: Optional[List[Dict[str, Any]]] = None
+        self._index_length = 0
+        
+        # get_recently_upgraded_packages() answers, per 'days' value:
+        # days -> (index it was computed from, valid until, package names)
+        self._recent_cache: Dict[int, tuple] = {}
+        
         # Load existing memory if file exists
         self.load_memory()
 
@@ -114,28 +316,186 @@ class MemoryManager:
             memory = manager.load_memory()
             print(memory['total_runs'])  # Shows total runs
         """
-        # Check if memory file exists
-        if os.path.exists(self.memory_file):
+        cache_key = self._load_cache_key()
+        signature = self._disk_signature()
+        cached = MemoryManager._load_cache.get(cache_key)
+        
+        if cached is not None and cached[0] == signature:
+            # Nothing changed on disk since the last load - reuse what was
+            # parsed then. The entry dicts are shared; nothing edits an
+            # entry once it's recorded (except caching '_ts', which is the
+            # same value for everyone).
+            _, state, saved_upgrades, index, saved_count = cached
+            self.memory = dict(state)
+            upgrades = list(saved_upgrades)
+            self.memory['last_updated'] = upgrades
+            
+            if self.logger:
+                self.logger.debug(f"Memory files unchanged, reused parsed memory for {self.memory_file}")
+        else:
+            upgrades, index, saved_count = self._read_memory_files()
+            MemoryManager._load_cache[cache_key] = (
+                signature,
+                self._memory_for_disk(),
+                tuple(upgrades),
+                index,
+                saved_count
+            )
+        
+        self._upgrade_index = index
+        self._index_source = upgrades
+        self._index_length = len(upgrades)
+        
+        # If there were inline or JSON Lines entries they aren't in our
+        # file yet, so the counts won't match and the next save migrates them
+        self._saved_upgrades = upgrades
+        self._saved_upgrade_count = saved_count if len(upgrades) == saved_count else -1
+        
+        self._dirty = False
+        self._dirty_since = None
+        
+        # A file written before the limit existed (or with a bigger limit)
+        # may hold more entries than we keep
+        self._trim_upgrades()
+        
+        return self.memory
+
+    def _load_cache_key(self) -> Tuple[str, str]:
+        """Key for this manager's files in MemoryManager._load_cache."""
+        return (os.path.abspath(self.memory_file), self.upgrades_format)
+
+    def _disk_signature(self) -> tuple:
+        """Signatures of every file load_memory() might read."""
+        return (
+            _file_signature(self.memory_file),
+            _file_signature(self.backup_file),
+            _file_signature(self.upgrades_file),
+            _file_signature(upgrades_file_for(self.memory_file, 'jsonl')),
+        )
+
+    def _read_memory_files(self) -> Tuple[List[Dict[str, Any]], Dict[str, float], int]:
+        """
+        Parse the memory and upgrade history files into self.memory.
+        
+        Returns:
+            (upgrade entries, latest-upgrade index, entries read from our
+            own history file)
+        """
+        # Start from the defaults so a partial file still has every key
+        self.memory = self._create_empty_memory()
+        
+        # Try memory.json first, then the backup of the previous save
+        # (used if memory.json is missing or damaged)
+        for path in (self.memory_file, self.backup_file):
+            if not os.path.exists(path):
+                continue
             try:
                 # Open and read the JSON file
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    self.memory = json.load(f)
+                self.memory.update(fast_json.load_file(path))
                 
                 if self.logger:
-                    self.logger.info(f"Loaded memory from {self.memory_file}")
+                    self.logger.info(f"Loaded memory from {path}")
+                break
                 
-                return self.memory
-                
-            except (json.JSONDecodeError, IOError) as e:
-                # If file is corrupted or can't be read, start fresh
+            except (fast_json.JSONDecodeError, IOError) as e:
+                # If file is corrupted or can't be read, try the next one
+                # (or start fresh if there isn't one)
                 if self.logger:
-                    self.logger.warning(f"Could not load memory file: {e}. Starting fresh.")
+                    self.logger.warning(f"Could not load memory file {path}: {e}")
                 self.memory = self._create_empty_memory()
+        
+        # Older memory files kept the history inline in 'last_updated';
+        # those entries come first, then everything from the JSONL file.
+        # The "latest upgrade per package" index is built as we go, so the
+        # history is only walked once.
+        upgrades = list(self.memory.get('last_updated') or [])
+        index: Dict[str, float] = {}
+        for entry in upgrades:
+            _add_to_index(index, entry)
+        
+        if os.path.exists(self.upgrades_file):
+            saved_count = self._read_upgrades_file(self.upgrades_file, self.upgrades_format, upgrades, index)
         else:
-            # File doesn't exist, create empty memory
-            self.memory = self._create_empty_memory()
+            # Switching to MessagePack: pick up the existing JSON Lines
+            # history. None of it is in our file yet, so saved_count
+            # stays 0 and the next save converts it.
+            saved_count = 0
+            jsonl_file = upgrades_file_for(self.memory_file, 'jsonl')
+            if jsonl_file != self.upgrades_file:
+                self._read_upgrades_file(jsonl_file, 'jsonl', upgrades, index)
+        self.memory['last_updated'] = upgrades
         
-        return self.memory
+        return upgrades, index, saved_count
+
+    def _read_upgrades_file(
+        self,
+        path: str,
+        upgrades_format: str,
+        upgrades: List[Dict[str, Any]],
+        index: Dict[str, float]
+    ) -> int:
+        """
+        Stream upgrade entries from a history file into a list.
+        
+        Only one entry is decoded at a time, so even a long history
+        never needs the whole file in memory at once.
+        
+        Args:
+            path: The history file to read
+            upgrades_format: 'jsonl' or 'msgpack'
+            upgrades: List to append the entries to
+            index: Latest-upgrade index to update with each entry
+        
+        Returns:
+            Number of entries read from the file
+        """
+        count = 0
+        
+        try:
+            with open(path, 'rb') as f:
+                if upgrades_format == 'msgpack':
+                    entries = self._iter_msgpack_entries(f, path)
+                else:
+                    entries = self._iter_jsonl_entries(f, path)
+                
+                for entry in entries:
+                    upgrades.append(entry)
+                    _add_to_index(index, entry)
+                    count += 1
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            if self.logger:
+                self.logger.warning(f"Could not read upgrade history: {e}")
+        
+        return count
+
+    def _iter_jsonl_entries(self, f, path: str):
+        """Yield the entries of a JSON Lines file, skipping bad lines."""
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield fast_json.loads(line)
+            except fast_json.JSONDecodeError:
+                # A half-written last line (e.g. after a crash) -
+                # skip it rather than losing the whole history
+                if self.logger:
+                    self.logger.warning(f"Skipping bad line in {path}")
+
+    def _iter_msgpack_entries(self, f, path: str):
+        """Yield the entries of a MessagePack file, stopping at bad data."""
+        # The Unpacker reads from the file in chunks; a record cut off at
+        # the end (e.g. after a crash) simply ends the loop
+        unpacker = msgpack.Unpacker(f, raw=False)
+        try:
+            for entry in unpacker:
+                yield entry
+        except ValueError:
+            # msgpack's decode errors are all ValueError subclasses
+            if self.logger:
+                self.logger.warning(f"Stopped at bad data in {path}")
 
     def _create_empty_memory(self) -> Dict[str, Any]:
         """
@@ -159,9 +519,11 @@ class MemoryManager:
 
     def save_memory(self) -> bool:
         """
-        Save the current memory to the JSON file.
+        Save the current memory to disk.
         
-        This writes all changes to disk so they persist between runs.
+        This writes the small state file (memory.json) and rewrites the
+        upgrade history file. record_upgrade() doesn't need this - it
+        appends just the new entry.
         
         Returns:
             True if save was successful, False otherwise
@@ -169,15 +531,126 @@ class MemoryManager:
         Example:
             manager.save_memory()  # Saves current memory to file
         """
+        # The files are about to change, so the parsed copy is out of date
+        MemoryManager._load_cache.pop(self._load_cache_key(), None)
+        
+        saved = self._save_state() and self._rewrite_upgrades()
+        if saved:
+            self._dirty = False
+            self._dirty_since = None
+        return saved
+
+    def flush(self) -> bool:
+        """
+        Write any unsaved changes to disk.
+        
+        The methods that change memory (record_upgrade, set_repo_url,
+        update_last_check_time, clear_old_entries) only mark it as changed.
+        Call this once when you're done, e.g. at the end of a cycle.
+        
+        New upgrade entries are appended to the history file; it is only
+        rewritten if entries were removed or the list was replaced.
+        
+        Returns:
+            True if everything was saved (or there was nothing to save)
+        
+        Example:
+            manager.record_upgrade('auto/dependency-update-1', ['lodash'])
+            manager.update_last_check_time()
+            manager.flush()  # One write for both changes
+        """
+        if not self._dirty:
+            return True
+        
+        # The files are about to change, so the parsed copy is out of date
+        MemoryManager._load_cache.pop(self._load_cache_key(), None)
+        
+        upgrades = self.memory.get('last_updated', [])
+        
+        # Same list as last time, only added to -> append the new entries
+        only_appended = (
+            upgrades is self._saved_upgrades and
+            0 <= self._saved_upgrade_count <= len(upgrades)
+        )
+        if only_appended:
+            saved_history = self._append_upgrades(upgrades[self._saved_upgrade_count:])
+        else:
+            saved_history = self._rewrite_upgrades()
+        
+        saved = self._save_state() and saved_history
+        if saved:
+            self._dirty = False
+            self._dirty_since = None
+        return saved
+
+    def _trim_upgrades(self):
+        """
+        Drop the oldest upgrade entries beyond max_entries.
+        
+        The kept entries go into a new list, so the upgrade index is
+        rebuilt and the next flush() rewrites the history file.
+        """
+        last_updated = self.memory.get('last_updated', [])
+        extra = len(last_updated) - self.max_entries
+        
+        if extra > 0:
+            self.memory['last_updated'] = last_updated[extra:]
+            self._mark_dirty()
+            
+            if self.logger:
+                self.logger.debug(f"Dropped {extra} oldest upgrade entries (limit {self.max_entries})")
+
+    def _mark_dirty(self):
+        """Note that memory has changes that haven't been written yet."""
+        if not self._dirty:
+            self._dirty = True
+            self._dirty_since = time.monotonic()
+
+    def __enter__(self) -> 'MemoryManager':
+        """Start a "with" block; changes are flushed when it ends."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """End a "with" block by saving any unsaved changes."""
+        self.flush()
+
+    def _save_state(self) -> bool:
+        """
+        Write memory.json: everything except the upgrade history.
+        
+        Returns:
+            True if save was successful, False otherwise
+        """
+        temp_file = f'{self.memory_file}.tmp'
+        
         try:
+            # pretty=True makes the JSON readable (each level indented)
+            data = fast_json.dumps(self._memory_for_disk(), pretty=True)
+            
+            # Same content as our last write, and nobody has touched the
+            # file since? Then there's nothing to do.
+            content_hash = hash(data)
+            if self._last_saved == (content_hash, _file_signature(self.memory_file)):
+                return True
+            
             # Ensure the directory exists
             memory_path = Path(self.memory_file)
             memory_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write to file with pretty formatting
-            # indent=4 makes the JSON readable (each level indented 4 spaces)
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=4)
+            # Write to a temporary file first
+            # fsync makes sure the bytes are really on disk before we switch
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Keep the previous save as memory.json.bak, then move the new
+            # file into place. os.replace() is atomic, so a crash leaves
+            # either the old or the new file - never a half-written one.
+            if memory_path.exists():
+                os.replace(self.memory_file, self.backup_file)
+            os.replace(temp_file, self.memory_file)
+            self._last_saved = (content_hash, _file_signature(self.memory_file))
             
             if self.logger:
                 self.logger.info(f"Saved memory to {self.memory_file}")
@@ -189,6 +662,125 @@ class MemoryManager:
                 self.logger.error(f"Failed to save memory: {e}")
             return False
 
+    def _append_upgrades(self, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Add upgrade entries to the end of the history file.
+        
+        Args:
+            entries: The upgrade entries to write
+        
+        Returns:
+            True if the entries were written, False otherwise
+        """
+        if not entries:
+            return True
+        
+        try:
+            Path(self.upgrades_file).parent.mkdir(parents=True, exist_ok=True)
+            
+            # 'a' = append mode: the existing entries are left untouched
+            with open(self.upgrades_file, 'ab') as f:
+                f.write(b''.join(map(self._encode_entry, entries)))
+                f.flush()
+                os.fsync(f.fileno())
+            
+            self._saved_upgrade_count += len(entries)
+            return True
+            
+        except IOError as e:
+            if self.logger:
+                self.logger.error(f"Failed to save upgrade history: {e}")
+            return False
+
+    def _encode_entry(self, entry: Dict[str, Any]) -> bytes:
+        """
+        Encode one upgrade entry in this manager's history format.
+        
+        Args:
+            entry: The upgrade entry
+        
+        Returns:
+            One JSON line, or one MessagePack record
+        """
+        entry = _entry_for_disk(entry)
+        if self.upgrades_format == 'msgpack':
+            return msgpack.packb(entry, use_bin_type=True)
+        return fast_json.dumps(entry) + b'\n'
+
+    def _rewrite_upgrades(self) -> bool:
+        """
+        Rewrite the whole history file from memory['last_updated'].
+        
+        The lines go to a temporary file that then replaces the real one,
+        so the history file is never left half-written.
+        
+        Returns:
+            True if the file was written, False otherwise
+        """
+        upgrades = self.memory.get('last_updated', [])
+        temp_file = f'{self.upgrades_file}.tmp'
+        
+        try:
+            Path(self.upgrades_file).parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(temp_file, 'wb') as f:
+                for entry in upgrades:
+                    f.write(self._encode_entry(entry))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.upgrades_file)
+            
+            # Once the history is in MessagePack, the old JSON Lines copy
+            # it was converted from is no longer needed
+            jsonl_file = upgrades_file_for(self.memory_file, 'jsonl')
+            if jsonl_file != self.upgrades_file and os.path.exists(jsonl_file):
+                os.remove(jsonl_file)
+            
+            self._saved_upgrades = upgrades
+            self._saved_upgrade_count = len(upgrades)
+            return True
+            
+        except IOError as e:
+            if self.logger:
+                self.logger.error(f"Failed to save upgrade history: {e}")
+            return False
+
+    def _latest_upgrade_ts(self) -> Dict[str, float]:
+        """
+        Get {package name: time of its newest upgrade} for all entries.
+        
+        The index is rebuilt only when the upgrade list changes (a new
+        list was assigned, or entries were added/removed), so repeated
+        has_been_upgraded() calls are just dictionary lookups.
+        
+        Returns:
+            Dictionary of package name -> epoch seconds
+        """
+        last_updated = self.memory.get('last_updated', [])
+        
+        if last_updated is not self._index_source or len(last_updated) != self._index_length:
+            index: Dict[str, float] = {}
+            
+            for entry in last_updated:
+                _add_to_index(index, entry)
+            
+            self._upgrade_index = index
+            self._index_source = last_updated
+            self._index_length = len(last_updated)
+        
+        return self._upgrade_index
+
+    def _memory_for_disk(self) -> Dict[str, Any]:
+        """
+        Get the part of memory that goes into memory.json.
+        
+        The upgrade history lives in the JSONL file instead.
+        
+        Returns:
+            Memory dictionary without 'last_updated'
+        """
+        return {key: value for key, value in self.memory.items() if key != 'last_updated'}
+
     def get_last_check_time(self) -> Optional[str]:
         """
         Get the time when we last checked for updates.
@@ -219,6 +811,8 @@ class MemoryManager:
         # Increment total runs
         self.memory['total_runs'] = self.memory.get('total_runs', 0) + 1
         
+        self._mark_dirty()
+        
         if self.logger:
             self.logger.info(f"Updated last check time: {self.memory['last_checked']}")
 
@@ -231,8 +825,8 @@ class MemoryManager:
         """
         Record an upgrade that was performed.
         
-        This saves information about what was upgraded so we don't
-        upgrade the same packages again too soon.
+        This remembers what was upgraded so we don't upgrade the same
+        packages again too soon. Call flush() to write it to disk.
         
         Args:
             branch_name: The git branch name (e.g., "auto/dependency-update-1705312200")
@@ -250,27 +844,31 @@ class MemoryManager:
             )
         """
         # Create a new entry for this upgrade
+        now = datetime.now(timezone.utc)
         upgrade_entry = {
             'branch': branch_name,
             'packages': packages,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'pr_url': pr_url
+            'timestamp': now.isoformat(),
+            'pr_url': pr_url,
+            '_ts': now.timestamp()  # parsed time, kept in memory only
         }
         
         # Add to the list of last_updated entries
-        # We keep a history of all upgrades
+        # We keep a history of the most recent max_entries upgrades
         last_updated = self.memory.get('last_updated', [])
         last_updated.append(upgrade_entry)
         self.memory['last_updated'] = last_updated
+        self._trim_upgrades()
         
         # Increment successful upgrades counter
         self.memory['successful_upgrades'] = self.memory.get('successful_upgrades', 0) + 1
         
+        self._mark_dirty()
+        
         if self.logger:
             self.logger.info(f"Recorded upgrade: {packages} on branch {branch_name}")
         
-        # Save to file
-        return self.save_memory()
+        return True
 
     def has_been_upgraded(self, package_name: str, days: int = 7) -> bool:
         """
@@ -291,40 +889,13 @@ class MemoryManager:
             else:
                 print("Upgrade lodash")
         """
-        # Get all upgrade entries
-        last_updated = self.memory.get('last_updated', [])
-        
         # Calculate the cutoff date
-        # datetime.now(timezone.utc) gives current time
+        # time.time() gives the current time in seconds since the epoch (UTC)
         # We subtract 'days' to get the cutoff time
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (days * 24 * 60 * 60)
+        cutoff_time = time.time() - (days * SECONDS_PER_DAY)
         
-        # Check each upgrade entry
-        for entry in last_updated:
-            # Get the timestamp of this upgrade
-            timestamp_str = entry.get('timestamp', '')
-            if not timestamp_str:
-                continue
-            
-            try:
-                # Parse the ISO timestamp string back to datetime
-                entry_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                
-                # Skip if this entry is older than our cutoff
-                if entry_time.timestamp() < cutoff_time:
-                    continue
-                
-                # Check if this package was in this upgrade
-                packages = entry.get('packages', [])
-                if package_name in packages:
-                    return True
-                    
-            except (ValueError, TypeError):
-                # If timestamp is invalid, skip this entry
-                continue
-        
-        # Package wasn't upgraded recently
-        return False
+        # One dictionary lookup instead of scanning every upgrade entry
+        return self._latest_upgrade_ts().get(package_name, float('-inf')) >= cutoff_time
 
     def get_recently_upgraded_packages(self, days: int = 7) -> List[str]:
         """
@@ -340,31 +911,29 @@ class MemoryManager:
             recent = manager.get_recently_upgraded_packages(days=7)
             print(f"Recently upgraded: {recent}")  # ['lodash', 'axios']
         """
-        recently_upgraded = set()
-        last_updated = self.memory.get('last_updated', [])
+        now = time.time()
+        index = self._latest_upgrade_ts()
+        
+        # The answer only changes when the index changes (an upgrade was
+        # recorded or removed) or when the oldest package in the answer
+        # gets too old - until then, reuse the last answer
+        cached = self._recent_cache.get(days)
+        if cached is not None and cached[0] is index and now < cached[1]:
+            return list(cached[2])
         
         # Calculate cutoff time
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (days * 24 * 60 * 60)
+        cutoff_time = now - (days * SECONDS_PER_DAY)
         
-        for entry in last_updated:
-            timestamp_str = entry.get('timestamp', '')
-            if not timestamp_str:
-                continue
-            
-            try:
-                entry_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                
-                if entry_time.timestamp() < cutoff_time:
-                    continue
-                
-                # Add all packages from this entry to our set
-                packages = entry.get('packages', [])
-                recently_upgraded.update(packages)
-                
-            except (ValueError, TypeError):
-                continue
+        recent = [
+            package for package, upgraded_at in index.items()
+            if upgraded_at >= cutoff_time
+        ]
+        
+        # Valid until the oldest recent upgrade falls out of the window
+        oldest = min((index[package] for package in recent), default=float('inf'))
+        self._recent_cache[days] = (index, oldest + days * SECONDS_PER_DAY, tuple(recent))
         
-        return list(recently_upgraded)
+        return recent
 
     def clear_old_entries(self, days: int = 30) -> int:
         """
@@ -386,29 +955,16 @@ class MemoryManager:
         last_updated = self.memory.get('last_updated', [])
         
         # Calculate cutoff time
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (days * 24 * 60 * 60)
+        cutoff_time = time.time() - (days * SECONDS_PER_DAY)
         
         # Filter to keep only recent entries
-        new_list = []
-        removed_count = 0
-        
-        for entry in last_updated:
-            timestamp_str = entry.get('timestamp', '')
-            if not timestamp_str:
-                continue
-            
-            try:
-                entry_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                
-                # Keep entry if it's recent enough
-                if entry_time.timestamp() >= cutoff_time:
-                    new_list.append(entry)
-                else:
-                    removed_count += 1
-                    
-            except (ValueError, TypeError):
-                # Keep entries with invalid timestamps
-                new_list.append(entry)
+        # (entries with invalid timestamps are kept too; entries with no
+        # timestamp at all are dropped)
+        new_list = [
+            entry for entry in last_updated
+            if entry.get('timestamp') and (_entry_ts(entry) is None or entry['_ts'] >= cutoff_time)
+        ]
+        removed_count = len(last_updated) - len(new_list)
         
         # Update memory
         self.memory['last_updated'] = new_list
@@ -416,7 +972,7 @@ class MemoryManager:
         if removed_count > 0:
             if self.logger:
                 self.logger.info(f"Cleared {removed_count} old entries from memory")
-            self.save_memory()
+            self._mark_dirty()
         
         return removed_count
 
@@ -449,8 +1005,11 @@ class MemoryManager:
         Example:
             manager.set_repo_url('https://github.com/user/project')
         """
+        if self.memory.get('repo_url') == repo_url:
+            return
+        
         self.memory['repo_url'] = repo_url
-        self.save_memory()
+        self._mark_dirty()
 
 
 # ============================================================================
@@ -459,14 +1018,21 @@ class MemoryManager:
 
 def get_memory_manager(
     memory_file: str = 'memory.json', 
-    logger = None
+    logger = None,
+    upgrades_format: str = 'jsonl',
+    max_entries: int = MAX_UPGRADE_ENTRIES
 ) -> MemoryManager:
     """
-    Create a MemoryManager instance.
+    Get the MemoryManager for a memory file.
+    
+    Every call builds a new manager. A MemoryManager holds the state of
+    one run, so two guardians must never share one.
     
     Args:
         memory_file: Path to the memory JSON file
         logger: Optional logger instance
+        upgrades_format: 'jsonl' (default) or 'msgpack'
+        max_entries: Most upgrade entries to keep
     
     Returns:
         A MemoryManager instance
@@ -475,7 +1041,7 @@ def get_memory_manager(
         memory = get_memory_manager('memory.json')
         memory.record_upgrade('branch', ['package'])
     """
-    return MemoryManager(memory_file, logger)
+    return MemoryManager(memory_file, logger, upgrades_format, max_entries)
 
 
 # ============================================================================
@@ -488,10 +1054,8 @@ if __name__ == "__main__":
     
     It demonstrates how to use the MemoryManager.
     """
-    # Import our logger (from the file we created earlier)
-    import sys
-    sys.path.insert(0, 'utils')
-    from logger import get_logger
+    # Import our logger (the project folder was added to the path above)
+    from utils.logger import get_logger
     
     # Create a logger
     logger = get_logger()
@@ -513,6 +1077,7 @@ if __name__ == "__main__":
         packages=["lodash", "axios"],
         pr_url="https://github.com/abdullahadm9862873-oss/TestingDependency1/pull/1"
     )
+    memory.flush()
     
     # Check if a package was upgraded
     print("\n=== Checking Packages ===")
@@ -5,9 +5,25 @@ This module handles posting upgrade notifications to the Moltbook API,
 a social network for AI agents.
 """
 
-import requests
-from typing import Dict, List, Optional
+import functools
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from config.config_loader import ConfigKey
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_repo(repo_url: str) -> Tuple[str, str]:
+    """Split a repository URL into (owner, name), ignoring query, fragment and .git."""
+    path = urlsplit(repo_url).path.strip('/')
+    if path.endswith('.git'):
+        path = path[:-len('.git')]
+    parts = path.rsplit('/', 1)
+    if len(parts) < 2:
+        return '', parts[0]
+    return parts[0].replace(':', '/').rsplit('/', 1)[-1], parts[1]
 
 
 class MoltbookPoster:
@@ -15,6 +31,9 @@ class MoltbookPoster:
     
     BASE_URL = "https://www.moltbook.com/api/v1"
     DEFAULT_MOLT_NAME = "github-upgrades"
+    # (connect, read) seconds: fail fast if Moltbook can't be reached,
+    # but give a slow response a bit longer
+    REQUEST_TIMEOUT = (3.05, 10)
     
     def __init__(self, config: Dict, logger):
         """
@@ -29,21 +48,47 @@ class MoltbookPoster:
         self.api_key = config.get('moltbook', {}).get('api_key', '')
         self.molt_name = config.get('moltbook', {}).get('molt_name', self.DEFAULT_MOLT_NAME)
         self.enabled = bool(self.api_key)
+        self._session_instance = None
         self._submolt_created = False
     
+    @property
+    def _session(self):
+        """The HTTP session, created (and requests imported) on first use."""
+        if self._session_instance is None:
+            self._session_instance = self._create_session()
+        return self._session_instance
+    
+    def _create_session(self):
+        """
+        Create a session that keeps the connection to Moltbook open.
+        
+        Requests made through one session reuse the same TCP/TLS
+        connection instead of doing a new handshake each time. Idempotent
+        requests (GET) are retried on 429/5xx; POSTs are not, so a post
+        is never sent twice.
+        
+        requests is imported here rather than at the top of the module,
+        so runs without a Moltbook API key never pay for importing it.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update(self._get_headers())
+        
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        session.mount('https://', adapter)
+        return session
+    
     def _get_repo_name(self, repo_url: str) -> str:
         """Extract repo name from URL."""
-        if repo_url.endswith('/'):
-            repo_url = repo_url.rstrip('/')
-        parts = repo_url.rsplit('/', 1)
-        return parts[-1] if parts else repo_url
+        return _parse_repo(repo_url)[1]
     
     def _get_repo_owner(self, repo_url: str) -> str:
         """Extract repo owner from URL."""
-        if repo_url.endswith('/'):
-            repo_url = repo_url.rstrip('/')
-        parts = repo_url.rsplit('/', 2)
-        return parts[-2] if len(parts) >= 2 else ''
+        return _parse_repo(repo_url)[0]
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -52,30 +97,13 @@ class MoltbookPoster:
             "Content-Type": "application/json"
         }
     
-    def _submolt_exists(self, molt_name: str) -> bool:
-        """Check if a submolt already exists."""
-        try:
-            response = requests.get(
-                f"{self.BASE_URL}/submolts/{molt_name}",
-                headers=self._get_headers(),
-                timeout=30
-            )
-            if response.status_code == 200:
-                return True
-            elif response.status_code == 404:
-                return False
-            else:
-                self.logger.warning(f"Could not check submolt existence: {response.status_code}")
-                return False
-        except requests.exceptions.RequestException as e:
-            self.logger.warning(f"Error checking submolt existence: {e}")
-            return False
-    
     def _create_submolt(self, molt_name: str) -> bool:
         """Create a new submolt if it doesn't exist."""
         if self._submolt_created:
             return True
         
+        import requests
+        
         payload = {
             "name": molt_name,
             "display_name": molt_name.replace('-', ' ').replace('_', ' ').title(),
@@ -83,19 +111,24 @@ class MoltbookPoster:
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/submolts",
                 json=payload,
-                headers=self._get_headers(),
-                timeout=30
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code in (200, 201):
                 self.logger.info(f"Created new submolt: {molt_name}")
                 self._submolt_created = True
                 return True
+            elif response.status_code == 409:
+                self.logger.info(f"Submolt {molt_name} already exists")
+                self._submolt_created = True
+                return True
             elif response.status_code == 400:
-                error_msg = response.json().get('message', '')
+                # Check the raw body - no JSON parse needed, and an HTML
+                # error page can't raise here and hide the real error
+                error_msg = response.text
                 if 'already exists' in error_msg.lower():
                     self.logger.info(f"Submolt {molt_name} already exists")
                     self._submolt_created = True
@@ -111,30 +144,21 @@ class MoltbookPoster:
             return False
     
     def _ensure_submolt(self) -> bool:
-        """Ensure submolt exists, create if needed."""
-        if self._submolt_created:
-            return True
-        
-        if self._submolt_exists(self.molt_name):
-            self.logger.info(f"Submolt '{self.molt_name}' already exists")
-            self._submolt_created = True
-            return True
+        """
+        Ensure submolt exists, create if needed.
         
-        self.logger.info(f"Submolt '{self.molt_name}' not found, creating it...")
+        Just tries to create it: an "already exists" answer counts as
+        success, which saves a separate existence check on every run.
+        """
         return self._create_submolt(self.molt_name)
     
     def _format_upgrade_message(self, upgraded: List[Dict], pr_url: str) -> str:
         """Format the upgrade details as a message."""
-        lines = [f"Upgraded {len(upgraded)} package(s):"]
-        
-        for pkg in upgraded:
-            name = pkg.get('name', 'unknown')
-            old_version = pkg.get('old_version', '?')
-            new_version = pkg.get('new_version', '?')
-            lines.append(f"• {name}: {old_version} → {new_version}")
-        
-        lines.append(f"\nPR: {pr_url}")
-        return '\n'.join(lines)
+        package_lines = ''.join(
+            f"\n• {pkg.get('name', 'unknown')}: {pkg.get('old_version', '?')} → {pkg.get('new_version', '?')}"
+            for pkg in upgraded
+        )
+        return f"Upgraded {len(upgraded)} package(s):{package_lines}\n\nPR: {pr_url}"
     
     def post_upgrade(self, repo_url: str, upgraded: List[Dict], pr_url: str) -> bool:
         """
@@ -160,8 +184,9 @@ class MoltbookPoster:
             self.logger.error(f"Could not ensure submolt '{self.molt_name}' exists")
             return False
         
-        owner = self._get_repo_owner(repo_url)
-        repo_name = self._get_repo_name(repo_url)
+        import requests
+        
+        owner, repo_name = _parse_repo(repo_url)
         
         title = f"✅ Dependency Upgrade: {owner}/{repo_name}"
         content = self._format_upgrade_message(upgraded, pr_url)
@@ -173,11 +198,10 @@ class MoltbookPoster:
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/posts",
                 json=payload,
-                headers=self._get_headers(),
-                timeout=30
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code == 201:
@@ -192,11 +216,10 @@ class MoltbookPoster:
             elif response.status_code == 404:
                 self.logger.warning(f"Submolt '{self.molt_name}' not found, trying to create it...")
                 if self._create_submolt(self.molt_name):
-                    response = requests.post(
+                    response = self._session.post(
                         f"{self.BASE_URL}/posts",
                         json=payload,
-                        headers=self._get_headers(),
-                        timeout=30
+                        timeout=self.REQUEST_TIMEOUT
                     )
                     if response.status_code == 201:
                         self.logger.info(f"Successfully posted upgrade to Moltbook: {title}")
@@ -215,3 +238,16 @@ class MoltbookPoster:
         except Exception as e:
             self.logger.error(f"Unexpected error posting to Moltbook: {e}")
             return False
+
+
+def get_moltbook_poster(config: Dict, logger) -> MoltbookPoster:
+    """Get a MoltbookPoster, cached by config contents and logger."""
+    # Imported here so this file still runs on its own (python skills/moltbook_poster.py)
+    from config.config_loader import ConfigKey
+    return _cached_moltbook_poster(ConfigKey(config), logger)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_moltbook_poster(config_key: 'ConfigKey', logger) -> MoltbookPoster:
+    """Build the MoltbookPoster behind get_moltbook_poster()."""
+    return MoltbookPoster(config_key.config, logger)
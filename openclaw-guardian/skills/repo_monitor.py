@@ -2,7 +2,8 @@
 Repository Monitor Skill - Handles Git clone/pull operations
 
 This module handles interacting with Git repositories:
-- Cloning repositories from GitHub
+- Cloning repositories from GitHub (through a local mirror, so repeat
+  clones only download what changed)
 - Pulling latest changes
 - Checking if the working directory is clean
 - Managing Git authentication
@@ -39,15 +40,316 @@ from urllib.parse import urlparse
 # Example: urlparse("https://github.com/user/repo")
 #   -> scheme="https", netloc="github.com", path="/user/repo"
 
-from typing import Optional, Tuple
+from typing import Any, Awaitable, Iterable, Iterator, List, Optional, Tuple
 # typing: Library for type hints
+# Any: Any type
+# Awaitable: Something you can "await" (e.g. a coroutine)
+# Iterable: Anything you can loop over
+# Iterator: What a generator function yields
+# List: A list of values
 # Optional: Can be the type or None
 # Tuple: Fixed-size collection of values
 
+from concurrent.futures import ThreadPoolExecutor
+# ThreadPoolExecutor: Runs several clones/pulls at once
+# (git does the work in its own process, so threads are enough)
+
+import threading
+# threading: Built-in library for working with threads
+# A Lock keeps the background-pull bookkeeping consistent
+
+import time
+# time: Built-in library for time-related functions
+
+import hashlib
+# hashlib: Built-in library for hashes (git ids file contents by SHA-1)
+
+import struct
+# struct: Built-in library for reading binary data (used for .git/index)
+
+import asyncio
+# asyncio: Built-in library for async code
+# Lets async callers run many git commands while waiting on the network
+
+import contextlib
+# contextlib: Built-in helpers for "with" statements
+# @contextmanager turns the mirror lock into a simple "with" block
+
+try:
+    import fcntl
+    # fcntl: File locking on Linux/macOS
+    msvcrt = None
+except ImportError:
+    fcntl = None
+    import msvcrt
+    # msvcrt: File locking on Windows
+
 import sys
 # sys: Built-in Python library for system operations
 # sys.path is used to add directories to Python's import search path
 
+import functools
+# functools: Built-in library for higher-order functions
+# We use lru_cache to remember repo names worked out from URLs
+
+try:
+    import pygit2
+    # pygit2: Optional third-party bindings to libgit2
+    # Lets us check status/branches in-process instead of starting
+    # a new git program each time. Install with: pip install pygit2
+except ImportError:
+    pygit2 = None
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# Environment for git commands:
+# - LC_ALL=C keeps git's messages in English, because stash_changes()
+#   looks for "No local changes to save"
+# - GIT_OPTIONAL_LOCKS=0: don't take index locks that are only optional
+#   (e.g. git status refreshing the index)
+# - GIT_TERMINAL_PROMPT=0, GIT_ASKPASS=echo, GCM_INTERACTIVE=never: with a
+#   bad token git would ask for a username/password and wait for an answer
+#   that never comes (until our 5 minute timeout). These make it fail at once
+GIT_ENV = {
+    **os.environ,
+    'LC_ALL': 'C',
+    'GIT_OPTIONAL_LOCKS': '0',
+    'GIT_TERMINAL_PROMPT': '0',
+    'GIT_ASKPASS': 'echo',
+    'GCM_INTERACTIVE': 'never',
+}
+
+# Options put in front of every git command we run:
+# - core.untrackedCache: git remembers which folders had no new files
+# - gc.auto=0: never start a background "git gc" in the middle of our work
+# - protocol.version=2: the server only lists the branches we ask for
+#   (default since git 2.26; set so older installs use it too)
+GIT_OPTIONS = ['-c', 'core.untrackedCache=true', '-c', 'gc.auto=0', '-c', 'protocol.version=2']
+
+# Folder (inside the working directory) holding one bare mirror per repo
+MIRRORS_DIR = '.mirrors'
+
+# Settings saved into each new clone's .git/config (git clone --config):
+# - fetch.parallel=0 / submodule.fetchJobs: fetch submodules side by side
+# - pack.threads=0: use every CPU core when packing objects (e.g. for push)
+# - http.postBuffer: send a big push in one request instead of chunks
+CLONE_CONFIG = {
+    'fetch.parallel': '0',
+    'submodule.fetchJobs': '8',
+    'pack.threads': '0',
+    'http.postBuffer': '524288000',
+}
+
+# How many submodules "git fetch" downloads at once (--jobs)
+FETCH_JOBS = max(4, os.cpu_count() or 1)
+
+# Default for how many git clones/pulls clone_many()/pull_many() run at once
+# (override with paths.git_concurrency in the config)
+DEFAULT_GIT_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+# Runs pull_latest_swr()'s refreshes in the background
+# (threads are only started when the first refresh is submitted)
+_BACKGROUND_PULLS = ThreadPoolExecutor(max_workers=4, thread_name_prefix='repo-pull')
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Get (modification time in ns, size) of a file, or None if it's missing.
+    
+    Git rewrites .git/index and .git/HEAD whenever it stages, commits,
+    checks out or resets, so a changed signature means git state changed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Fixed-size start of each .git/index entry: ctime, mtime (seconds +
+# nanoseconds), dev, ino, mode, uid, gid, size - all 32-bit big-endian -
+# then the 20-byte object id and 16-bit flags
+_INDEX_ENTRY = struct.Struct('>10I20sH')
+_INDEX_EXTENDED_FLAG = 0x4000
+_GITLINK_MODE = 0o160000
+
+
+def _uses_sha256(repo_path: str) -> bool:
+    """Check whether a repository uses SHA-256 object ids (rare)."""
+    try:
+        with open(os.path.join(repo_path, '.git', 'config'), 'rb') as f:
+            return b'sha256' in f.read()
+    except OSError:
+        return False
+
+
+def _same_blob(repo_path: str, name: bytes, object_id: bytes) -> bool:
+    """
+    Check whether a file's contents hash to the given git object id.
+    
+    git names a file's contents SHA-1("blob <size>\\0<contents>").
+    """
+    try:
+        with open(os.path.join(repo_path, os.fsdecode(name)), 'rb') as f:
+            contents = f.read()
+    except OSError:
+        return False
+    header = b'blob %d\0' % len(contents)
+    return hashlib.sha1(header + contents).digest() == object_id
+
+
+def _tracked_files_unchanged(repo_path: str) -> bool:
+    """
+    Check that no tracked file changed since git last recorded it.
+    
+    This is the same quick test git itself starts "git status" with: every
+    file listed in .git/index still has the size and modification time
+    stored there. It only needs a stat() per file - no git process - but
+    it can't see untracked files or staged changes, so it is only used to
+    confirm an earlier "clean" answer from git.
+    
+    Args:
+        repo_path: Path to the local repository
+    
+    Returns:
+        True if every tracked file looks unchanged. False if one changed,
+        or the index couldn't be read (then ask git).
+    """
+    index_path = os.path.join(repo_path, '.git', 'index')
+    try:
+        with open(index_path, 'rb') as f:
+            data = f.read()
+        index_mtime_ns = os.stat(index_path).st_mtime_ns
+    except OSError:
+        return False
+    
+    if len(data) < 12 or data[:4] != b'DIRC':
+        return False
+    if _uses_sha256(repo_path):
+        # Object ids are 32 bytes there; _INDEX_ENTRY expects 20
+        return False
+    version, count = struct.unpack_from('>II', data, 4)
+    if version not in (2, 3, 4):
+        return False
+    
+    pos = 12
+    name = b''
+    try:
+        for _ in range(count):
+            fields = _INDEX_ENTRY.unpack_from(data, pos)
+            mtime_s, mtime_ns, mode, size, flags = fields[2], fields[3], fields[6], fields[9], fields[11]
+            pos += _INDEX_ENTRY.size
+            if flags & _INDEX_EXTENDED_FLAG:
+                pos += 2
+            
+            if version == 4:
+                # Name is stored as "drop N bytes from the previous name,
+                # then add this": N is a variable-length number
+                byte = data[pos]
+                pos += 1
+                drop = byte & 0x7f
+                while byte & 0x80:
+                    byte = data[pos]
+                    pos += 1
+                    drop = ((drop + 1) << 7) | (byte & 0x7f)
+                end = data.index(b'\0', pos)
+                name = name[:len(name) - drop] + data[pos:end]
+                pos = end + 1
+            else:
+                # Name, then 1-8 NUL bytes so the entry is a multiple of 8 long
+                start = pos
+                end = data.index(b'\0', pos)
+                name = data[start:end]
+                entry_length = _INDEX_ENTRY.size + (end - start) + (2 if flags & _INDEX_EXTENDED_FLAG else 0)
+                pos = end + (8 - entry_length % 8)
+            
+            if mode == _GITLINK_MODE:
+                # Submodule - git checks those separately
+                return False
+            
+            st = os.lstat(os.path.join(repo_path, os.fsdecode(name)))
+            
+            # The index keeps times and sizes as 32-bit numbers
+            if (int(st.st_mtime) & 0xffffffff != mtime_s
+                    or st.st_mtime_ns % 1_000_000_000 != mtime_ns
+                    or st.st_size & 0xffffffff != size):
+                return False
+            
+            # Changed in the same moment the index was written ("racy git",
+            # common right after a clone): the time can't be trusted, so do
+            # what git does and compare the contents' object id instead
+            if st.st_mtime_ns >= index_mtime_ns and not _same_blob(repo_path, name, fields[10]):
+                return False
+    except (OSError, ValueError, IndexError, struct.error):
+        # File deleted, or an index we couldn't follow
+        return False
+    
+    return True
+
+
+def _with_git_options(args: list) -> list:
+    """Add GIT_OPTIONS right after "git" (other programs are left alone)."""
+    if args and args[0] == 'git':
+        return ['git', *GIT_OPTIONS, *args[1:]]
+    return args
+
+
+def _as_text(output) -> str:
+    """Turn git output (str, bytes or None) into a string."""
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output or ''
+
+
+def _first_line(output) -> str:
+    """
+    Get the line that explains a git failure, for the logs.
+    
+    That's the first "fatal:"/"error:" line (e.g. "fatal: Authentication
+    failed for ..."), skipping chatter like "Cloning into ..." before it
+    and hints after it. Falls back to the first non-empty line.
+    """
+    lines = [line.strip() for line in _as_text(output).splitlines() if line.strip()]
+    for line in lines:
+        if line.startswith(('fatal:', 'error:')):
+            return line
+    return lines[0] if lines else ''
+
+
+@contextlib.contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file for the length of a "with" block.
+    
+    Used so two agents sharing a working directory never update the same
+    mirror at once (git would corrupt it).
+    
+    Args:
+        lock_path: Lock file to create/lock (e.g. "<mirror>.lock")
+    
+    Example:
+        with _file_lock(mirror + '.lock'):
+            ...  # only one process gets here at a time
+    """
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            # Lock the first byte; LK_LOCK keeps retrying for ~10 seconds
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 # ============================================================================
 # REPO MONITOR CLASS - Handles Git operations
@@ -71,6 +373,9 @@ class RepoMonitor:
         working_dir: Directory where repositories are stored
     """
     
+    # Working directories already created by a RepoMonitor in this process
+    _created_dirs = set()
+    
     def __init__(self, config: dict, logger):
         """
         Initialize the RepoMonitor.
@@ -101,17 +406,62 @@ class RepoMonitor:
         
         # Create the working directory if it doesn't exist
         # exist_ok=True means don't error if it already exists
-        os.makedirs(self.working_dir, exist_ok=True)
+        # (skipped if an earlier RepoMonitor already made sure of it)
+        if self.working_dir not in RepoMonitor._created_dirs:
+            os.makedirs(self.working_dir, exist_ok=True)
+            RepoMonitor._created_dirs.add(self.working_dir)
+        
+        # How much of the repository a clone downloads. We only need the
+        # latest commit of the default branch to read and edit package.json,
+        # so by default: 1 commit deep, no file contents until checkout
+        # (blob:none), one branch, no tags. Set clone_depth to 0 for a full
+        # clone, or clone_filter to '' to turn the filter off.
+        self.clone_depth = int(paths_config.get('clone_depth', 1) or 0)
+        self.clone_filter = paths_config.get('clone_filter', 'blob:none')
+        
+        # Most git commands clone_many()/pull_many() run at the same time
+        self.git_concurrency = paths_config.get('git_concurrency', DEFAULT_GIT_CONCURRENCY)
+        
+        # Faster "git status": skip untracked files. Off by default because
+        # it then misses brand-new files.
+        self.fast_status = bool(paths_config.get('fast_status', False))
+        
+        # Local bare repos whose objects clones share (see clone_repo):
+        # repo URL -> path
+        self.reference_repos = paths_config.get('reference_repos') or {}
+        
+        # Default branch per repo (it doesn't change while we're running):
+        # repo_path -> branch name
+        self._default_branch_cache = {}
+        
+        # Last is_clean_working_directory() answer per repo:
+        # repo_path -> (signature of .git/index + .git/HEAD, is_clean)
+        self._status_cache = {}
+        
+        # Opened pygit2 repositories: repo_path -> (inode of .git, Repository)
+        # The inode tells us if the repo was deleted and cloned again
+        self._git_repos = {}
+        
+        # For pull_latest_swr(): when each repo was last pulled successfully
+        # (time.time()), and the background pull running for it, if any
+        self._last_pull = {}
+        self._pull_futures = {}
+        self._pull_lock = threading.Lock()
         
         if self.logger:
             self.logger.info(f"RepoMonitor initialized. Working directory: {self.working_dir}")
 
-    def get_repo_name(self, repo_url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_repo_name(repo_url: str) -> str:
         """
         Extract the repository name from a GitHub URL.
         
         The repository name is the last part of the URL, without .git
         
+        The answer only depends on the URL, so it's cached: the same URL
+        is looked up many times during one cycle.
+        
         Args:
             repo_url: The GitHub repository URL
         
@@ -159,11 +509,339 @@ class RepoMonitor:
         
         return repo_path
 
+    def _mirror_path(self, repo_url: str) -> str:
+        """
+        Get where the bare mirror of a repository is kept.
+        
+        Mirrors live in {working_dir}/.mirrors/{host}/{owner}/{repo}.git, so
+        repos with the same name from different owners don't clash.
+        
+        Args:
+            repo_url: The GitHub repository URL
+        
+        Returns:
+            Full path to the mirror
+        
+        Example:
+            monitor._mirror_path("https://github.com/user/my-project")
+            # Returns: "./repos/.mirrors/github.com/user/my-project.git"
+        """
+        parsed = urlparse(repo_url)
+        
+        # netloc may hold a token ("token@github.com"); keep just the host
+        host = parsed.hostname or 'unknown-host'
+        
+        # "/user/my-project.git" -> ["user", "my-project"]
+        parts = parsed.path.strip('/').removesuffix('.git').split('/')
+        owner = parts[-2] if len(parts) >= 2 else '_'
+        
+        return os.path.join(self.working_dir, MIRRORS_DIR, host, owner, f'{parts[-1]}.git')
+
+    def _update_mirror(self, repo_url: str, auth_url: str) -> Optional[str]:
+        """
+        Create or refresh the local bare mirror of a repository.
+        
+        The first time, the whole repository is downloaded into the mirror.
+        After that a fetch only downloads objects that are new on GitHub,
+        which is usually a few KB instead of the whole project.
+        
+        Args:
+            repo_url: The GitHub repository URL
+            auth_url: The same URL with the token in it (if any)
+        
+        Returns:
+            Path to the mirror, or None if it couldn't be created/updated
+        """
+        mirror = self._mirror_path(repo_url)
+        os.makedirs(os.path.dirname(mirror), exist_ok=True)
+        
+        with _file_lock(mirror + '.lock'):
+            if os.path.isdir(mirror):
+                # Fetch from auth_url (not the URL saved in the mirror) so
+                # a changed token is picked up; --prune drops deleted branches.
+                # Only branches: our clones never use tags
+                success, output = self._run_git_command(
+                    ['git', '-C', mirror, 'fetch', '--prune', '--no-progress', '--no-tags', auth_url,
+                     '+refs/heads/*:refs/heads/*'],
+                    cwd=self.working_dir,
+                    check=False,
+                    discard_output=True
+                )
+            else:
+                success, output = self._run_git_command(
+                    ['git', 'clone', '--mirror', '--no-progress', auth_url, mirror],
+                    cwd=self.working_dir,
+                    check=False,
+                    discard_output=True
+                )
+        
+        if not success:
+            if self.logger:
+                self.logger.warning(f"Could not update mirror, cloning without it: {_first_line(output)}")
+            return None
+        
+        return mirror
+
+    def _reset_clone(self, repo_path: str, source: str, origin_url: str) -> bool:
+        """
+        Bring an existing clone back to a fresh-clone state.
+        
+        Points origin at origin_url, fetches the default branch, checks it
+        out (throwing away local changes) and deletes every untracked and
+        ignored file - the result is the same as cloning again, without
+        downloading everything.
+        
+        Args:
+            repo_path: Path to the local repository
+            source: Where to fetch from - the local mirror if there is one
+                (no network needed), otherwise the (auth) repository URL
+            origin_url: The (auth) repository URL origin should point at,
+                same as a fresh clone's
+        
+        Returns:
+            True if the clone was reset, False if it should be re-cloned
+        """
+        # The clone may have been made with an old token (or none), so set
+        # origin like a fresh clone would - push and pull_latest use it
+        success, output = self._run_git_command(
+            ['git', 'remote', 'set-url', 'origin', origin_url],
+            cwd=repo_path,
+            check=False
+        )
+        if not success:
+            return False
+        
+        # "origin/main" -> "main" (origin/HEAD is set by git clone)
+        success, output = self._run_git_command(
+            ['git', 'symbolic-ref', '--short', 'refs/remotes/origin/HEAD'],
+            cwd=repo_path,
+            check=False
+        )
+        if not success:
+            return False
+        branch = output.strip().split('/', 1)[-1]
+        
+        fetch = ['git', 'fetch', '--no-progress', '--prune', '--no-tags', *self._fetch_jobs(repo_path)]
+        if self.clone_depth:
+            fetch.append(f'--depth={self.clone_depth}')
+        fetch += [source, f'+refs/heads/{branch}:refs/remotes/origin/{branch}']
+        
+        for args in (
+            fetch,
+            # -B resets the local branch to origin's, --force drops changes
+            ['git', 'checkout', '--quiet', '--force', '-B', branch, f'origin/{branch}'],
+            # -x also removes ignored files (node_modules, build output)
+            ['git', 'clean', '--quiet', '-fdx']
+        ):
+            success, output = self._run_git_command(
+                args,
+                cwd=repo_path,
+                check=False,
+                discard_output=True
+            )
+            if not success:
+                if self.logger:
+                    self.logger.warning(f"Could not reset existing clone: {output}")
+                return False
+        
+        return True
+
+    def _reference_repo(
+        self,
+        repo_url: str,
+        upstream_url: Optional[str],
+        token: Optional[str]
+    ) -> Optional[str]:
+        """
+        Find a shared object store to clone repo_url against.
+        
+        Args:
+            repo_url: The GitHub repository URL
+            upstream_url: URL of the project repo_url is a fork of, or None
+            token: Token for the upstream (same one as for repo_url)
+        
+        Returns:
+            Path to the upstream's mirror (updated first) or the repo set in
+            paths.reference_repos for repo_url, or None if there's neither
+        """
+        if upstream_url:
+            auth_url = upstream_url.replace('https://', f'https://{token}@') if token else upstream_url
+            return self._update_mirror(upstream_url, auth_url)
+        
+        reference = self.reference_repos.get(repo_url)
+        if reference and os.path.isdir(reference):
+            return os.path.abspath(reference)
+        return None
+
+    def _fetch_jobs(self, repo_path: str) -> List[str]:
+        """
+        Extra "git fetch" arguments to fetch submodules in parallel.
+        
+        Args:
+            repo_path: Path to the local repository
+        
+        Returns:
+            ['--jobs=N'] if the repo has submodules (.gitmodules), else []
+        """
+        if os.path.exists(os.path.join(repo_path, '.gitmodules')):
+            return [f'--jobs={FETCH_JOBS}']
+        return []
+
+    def _remove_clone(self, repo_path: str):
+        """
+        Delete a local clone (working copy).
+        
+        .git object files are read-only on Windows, so shutil.rmtree would
+        raise WinError 5 (Access Denied) on them. We clear the read-only flag
+        and retry each one, which works without starting any program.
+        'cmd /c rd /s /q' (~40ms just to start cmd.exe) is only used on
+        Windows when that still leaves something behind.
+        
+        Args:
+            repo_path: Path to the local repository
+        """
+        import stat as _stat, shutil as _shutil
+        
+        def _rm_ro(func, path, _):
+            os.chmod(path, _stat.S_IWRITE)
+            func(path)
+        
+        try:
+            _shutil.rmtree(repo_path, onerror=_rm_ro)
+            return
+        except FileNotFoundError:
+            return  # Already gone
+        except Exception as del_err:
+            error = del_err
+        
+        if os.name == 'nt':
+            try:
+                subprocess.run(['cmd', '/c', 'rd', '/s', '/q', repo_path],
+                               capture_output=True, text=True, timeout=60)
+                if not os.path.exists(repo_path):
+                    return
+            except Exception as rd_err:
+                error = rd_err
+        
+        if self.logger:
+            self.logger.warning(f"Could not remove old clone: {error}")
+
+    def _open_git_repo(self, repo_path: str):
+        """
+        Get a pygit2 Repository for a local repository, reusing open ones.
+        
+        Args:
+            repo_path: Path to the local repository
+        
+        Returns:
+            A pygit2.Repository, or None if pygit2 isn't installed or
+            the repository can't be opened
+        """
+        if pygit2 is None:
+            return None
+        
+        try:
+            git_dir_inode = os.stat(os.path.join(repo_path, '.git')).st_ino
+        except OSError:
+            return None
+        
+        cached = self._git_repos.get(repo_path)
+        if cached is not None and cached[0] == git_dir_inode:
+            return cached[1]
+        
+        try:
+            repo = pygit2.Repository(repo_path)
+        except pygit2.GitError as e:
+            if self.logger:
+                self.logger.debug(f"pygit2 could not open {repo_path}: {e}")
+            return None
+        
+        self._git_repos[repo_path] = (git_dir_inode, repo)
+        return repo
+
+    def _pygit2_has_changes(self, repo_path: str) -> Optional[bool]:
+        """
+        Check for uncommitted changes with pygit2 (no git process).
+        
+        Args:
+            repo_path: Path to the local repository
+        
+        Returns:
+            True/False like "git status" having output, or None if pygit2
+            isn't available or failed (then run git instead)
+        """
+        repo = self._open_git_repo(repo_path)
+        if repo is None:
+            return None
+        
+        try:
+            if self.fast_status:
+                try:
+                    status = repo.status(untracked_files='no')
+                except TypeError:
+                    # pygit2 older than 1.14 can't skip untracked files
+                    return None
+            else:
+                status = repo.status()
+        except pygit2.GitError as e:
+            if self.logger:
+                self.logger.debug(f"pygit2 status failed for {repo_path}: {e}")
+            return None
+        
+        # Files that are unchanged have flags 0 (GIT_STATUS_CURRENT)
+        return any(flags != 0 for flags in status.values())
+
+    def _git_has_output(self, args: list, cwd: str) -> Optional[bool]:
+        """
+        Run a git command only far enough to see whether it prints anything.
+        
+        Reads one byte of output, then stops git if it's still going - for
+        a repository with thousands of changed files that skips reading
+        (and git producing) the rest of the list.
+        
+        Args:
+            args: List of command arguments
+            cwd: Current working directory for the command
+        
+        Returns:
+            True if the command printed something, False if it finished
+            successfully without output, None if it failed
+        
+        Example:
+            dirty = self._git_has_output(['git', 'status', '--porcelain'], repo_path)
+        """
+        try:
+            proc = subprocess.Popen(
+                _with_git_options(args),
+                cwd=cwd,
+                env=GIT_ENV,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            # Git is not installed, or the folder is gone
+            return None
+        
+        with proc:
+            first = proc.stdout.read(1)
+            if first:
+                # Got our answer - no need to let git finish
+                proc.terminate()
+                return True
+            try:
+                returncode = proc.wait(timeout=300)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                return None
+        
+        return False if returncode == 0 else None
+
     def _run_git_command(
         self, 
         args: list, 
         cwd: str, 
-        check: bool = True
+        check: bool = True,
+        discard_output: bool = False
     ) -> Tuple[bool, str]:
         """
         Run a git command and return the result.
@@ -173,10 +851,15 @@ class RepoMonitor:
         Args:
             args: List of command arguments (e.g., ['git', 'clone', 'url', 'path'])
             cwd: Current working directory for the command
-            check: Whether to raise exception on command failure
+            check: If True, failures are logged here; if False, the caller
+                logs them. Either way a failure returns (False, error output)
+            discard_output: Send normal output straight to the null device
+                instead of reading it into Python (for clone/fetch/pull,
+                whose output we never look at). Errors are still returned.
         
         Returns:
             Tuple of (success: bool, output: str)
+            (output is "" on success when discard_output is True)
         
         Example:
             success, output = self._run_git_command(
@@ -184,29 +867,40 @@ class RepoMonitor:
                 cwd='/path/to/repo'
             )
         """
+        if discard_output:
+            # stdout goes to the null device; stderr is kept (as bytes, only
+            # decoded if something went wrong) for the error message
+            output_args = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
+        else:
+            # capture both stdout and stderr, as strings instead of bytes
+            output_args = {'capture_output': True, 'text': True}
+        
         try:
             # Run the git command
-            # capture_output=True: capture both stdout and stderr
-            # text=True: return strings instead of bytes
             # check=True: raise CalledProcessError if command fails
             result = subprocess.run(
-                args,
+                _with_git_options(args),
                 cwd=cwd,
                 check=check,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout for network operations
+                env=GIT_ENV,
+                timeout=300,  # 5 minute timeout for network operations
+                **output_args
             )
             
+            # With check=False a failing command doesn't raise, so look at
+            # the exit code ourselves (callers log the error)
+            if result.returncode != 0:
+                return False, _as_text(result.stderr) or _as_text(result.stdout)
+            
             # Return success and output
-            return True, result.stdout
+            return True, result.stdout if not discard_output else ''
             
         except subprocess.CalledProcessError as e:
             # Command failed
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = _as_text(e.stderr) if e.stderr else str(e)
             if self.logger:
                 self.logger.error(f"Git command failed: {' '.join(args)}")
-                self.logger.error(f"Error: {error_msg}")
+                self.logger.error(f"Error: {_first_line(error_msg)}")
             return False, error_msg
             
         except subprocess.TimeoutExpired:
@@ -221,16 +915,30 @@ class RepoMonitor:
                 self.logger.error("Git is not installed or not in PATH")
             return False, "Git not found"
 
-    def clone_repo(self, repo_url: str, token: Optional[str] = None) -> str:
+    def clone_repo(
+        self,
+        repo_url: str,
+        token: Optional[str] = None,
+        upstream_url: Optional[str] = None
+    ) -> str:
         """
         Clone a GitHub repository if it doesn't exist locally.
         
-        If the repository already exists, this will skip cloning
-        and just return the path.
+        If the repository already exists, it is reset to the latest
+        default branch instead (same result as a fresh clone, but only
+        new objects are downloaded).
+        
+        Forks of the same project can share one copy of their history:
+        pass the upstream URL (its mirror is then kept up to date and
+        shared), or list a local bare repo for the URL under
+        paths.reference_repos in the config. A clone made this way reads
+        objects from the shared repo for good, so that repo must only ever
+        be fetched into - never deleted or pruned with "git gc".
         
         Args:
             repo_url: The GitHub repository URL
             token: Optional GitHub Personal Access Token for authentication
+            upstream_url: Optional URL of the project this repo is a fork of
         
         Returns:
             Path to the cloned repository
@@ -256,28 +964,10 @@ class RepoMonitor:
         # Get where this repo should be stored locally
         repo_path = self.get_repo_path(repo_url)
 
-        # ALWAYS delete existing directory before cloning — never reuse a stale clone.
-        # 'rd /s /q' is used because .git object files are read-only on Windows and
-        # shutil.rmtree raises WinError 5 (Access Denied) on them.
-        if os.path.exists(repo_path):
-            if self.logger:
-                self.logger.info(f"Removing existing clone for fresh reclone: {repo_path}")
-            import subprocess as _sp, time as _t, stat as _stat, shutil as _shutil
-            try:
-                _sp.run(['cmd', '/c', 'rd', '/s', '/q', repo_path],
-                        capture_output=True, text=True, timeout=60)
-                if os.path.exists(repo_path):
-                    # Fallback: chmod then rmtree
-                    def _rm_ro(func, path, _):
-                        os.chmod(path, _stat.S_IWRITE)
-                        func(path)
-                    _shutil.rmtree(repo_path, onerror=_rm_ro)
-            except Exception as del_err:
-                if self.logger:
-                    self.logger.warning(f"Could not remove old clone: {del_err}")
-        
-        if self.logger:
-            self.logger.info(f"Cloning repository: {repo_url}")
+        # A new clone may reuse the same file times, so forget the old status
+        # (and the default branch, in case the URL now points elsewhere)
+        self._status_cache.pop(repo_path, None)
+        self._default_branch_cache.pop(repo_path, None)
         
         # Add authentication to URL if token provided
         # This allows cloning private repos
@@ -289,12 +979,56 @@ class RepoMonitor:
             # No token, use URL as-is (works for public repos)
             auth_url = repo_url
         
+        # Bring the local mirror up to date (only new objects are downloaded)
+        mirror = self._update_mirror(repo_url, auth_url)
+        
+        # Shared object store for forks, if there is one
+        reference = self._reference_repo(repo_url, upstream_url, token)
+        
+        # Never reuse a stale clone: an existing one is reset to exactly the
+        # latest default branch (local changes, untracked and ignored files
+        # all removed). That keeps its objects, so only new ones are fetched.
+        # Deleting and cloning again is the fallback if the reset fails.
+        if os.path.exists(repo_path):
+            if self._reset_clone(repo_path, mirror or auth_url, auth_url):
+                if self.logger:
+                    self.logger.info(f"Reset existing clone to latest: {repo_path}")
+                return repo_path
+            
+            if self.logger:
+                self.logger.info(f"Removing existing clone for fresh reclone: {repo_path}")
+            self._remove_clone(repo_path)
+        
+        if self.logger:
+            self.logger.info(f"Cloning repository: {repo_url}")
+        
         # Run git clone command
         # git clone <url> <directory>
+        # With a mirror, --reference-if-able takes the objects from it instead
+        # of the network, and --dissociate copies them so the clone doesn't
+        # depend on the mirror afterwards. origin still points at GitHub.
+        # With a shared reference repo the objects are NOT copied (that's
+        # the point), and --dissociate would apply to every reference.
+        args = ['git', 'clone', '--no-progress', '--no-tags']
+        for key, value in CLONE_CONFIG.items():
+            args += ['--config', f'{key}={value}']
+        if self.clone_depth:
+            args += [f'--depth={self.clone_depth}', '--single-branch']
+        if self.clone_filter:
+            args.append(f'--filter={self.clone_filter}')
+        if reference:
+            args += ['--reference-if-able', reference]
+            if mirror:
+                args += ['--reference-if-able', mirror]
+        elif mirror:
+            args += ['--reference-if-able', mirror, '--dissociate']
+        args += [auth_url, repo_path]
+        
         success, output = self._run_git_command(
-            ['git', 'clone', '--quiet', auth_url, repo_path],
+            args,
             cwd=self.working_dir,
-            check=False
+            check=False,
+            discard_output=True
         )
         
         if success:
@@ -303,16 +1037,17 @@ class RepoMonitor:
             return repo_path
         else:
             # Cloning failed
-            error_msg = f"Failed to clone repository: {output}"
             if self.logger:
-                self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
+                self.logger.error(f"Failed to clone repository: {_first_line(output)}")
+            raise RuntimeError(f"Failed to clone repository: {output}")
 
     def pull_latest(self, repo_path: str) -> bool:
         """
         Pull the latest changes from the remote repository.
         
-        This fetches and merges changes from the origin remote.
+        This fetches and merges changes from the origin remote. For a
+        shallow clone (clone_depth > 0) it fetches the newest commit and
+        resets the branch to it instead of merging.
         
         Args:
             repo_path: Path to the local repository
@@ -332,29 +1067,53 @@ class RepoMonitor:
         if self.logger:
             self.logger.info(f"Pulling latest changes for {repo_path}")
         
-        # Step 1: Fetch from origin
-        # git fetch downloads info about remote branches without merging
-        success, output = self._run_git_command(
-            ['git', 'fetch', 'origin'],
-            cwd=repo_path,
-            check=False
-        )
-        
-        if not success:
-            if self.logger:
-                self.logger.warning(f"Failed to fetch: {output}")
-            # Continue anyway - might work with local data
-        
-        # Step 2: Get the default branch name (main or master)
+        # Step 1: Get the default branch name (main or master)
         branch = self._get_default_branch(repo_path)
         
-        # Step 3: Pull the changes
-        # git pull origin <branch> fetches and merges in one command
-        success, output = self._run_git_command(
-            ['git', 'pull', 'origin', branch, '--quiet'],
-            cwd=repo_path,
-            check=False
-        )
+        if self.clone_depth:
+            # Shallow clone: fetch just the newest commit(s) of the branch
+            # and jump to it. "git pull" would have to merge, which needs
+            # history a shallow clone doesn't have.
+            success, output = self._run_git_command(
+                ['git', 'fetch', '--no-progress', f'--depth={self.clone_depth}', '--no-tags',
+                 *self._fetch_jobs(repo_path), 'origin', branch],
+                cwd=repo_path,
+                check=False,
+                discard_output=True
+            )
+            
+            if success:
+                success, output = self._run_git_command(
+                    ['git', 'reset', '--hard', '--quiet', f'origin/{branch}'],
+                    cwd=repo_path,
+                    check=False,
+                    discard_output=True
+                )
+        else:
+            # Step 2: Fetch the branch from origin
+            # git fetch downloads new commits without merging; naming the
+            # branch means only it is asked for (and updates origin/<branch>)
+            success, output = self._run_git_command(
+                ['git', 'fetch', '--no-progress', '--no-tags', *self._fetch_jobs(repo_path), 'origin', branch],
+                cwd=repo_path,
+                check=False,
+                discard_output=True
+            )
+            
+            if not success:
+                if self.logger:
+                    self.logger.warning(f"Failed to fetch: {output}")
+                # Continue anyway - might work with local data
+            
+            # Step 3: Merge what was just fetched
+            # (not "git pull", which would fetch everything a second time)
+            # --ff-only: only move forward; never create a merge commit
+            success, output = self._run_git_command(
+                ['git', 'merge', '--ff-only', '--quiet', f'origin/{branch}'],
+                cwd=repo_path,
+                check=False,
+                discard_output=True
+            )
         
         if success:
             if self.logger:
@@ -363,10 +1122,236 @@ class RepoMonitor:
         else:
             # Pull failed - might be because we're ahead or diverged
             if self.logger:
-                self.logger.warning(f"Failed to pull latest: {output}")
+                self.logger.warning(f"Failed to pull latest: {_first_line(output)}")
                 self.logger.info("Repository may have local changes or diverged from remote")
             return False
 
+    def clone_many(
+        self,
+        repo_urls: List[str],
+        tokens: Optional[List[Optional[str]]] = None
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Clone several repositories at the same time.
+        
+        Each one goes through clone_repo(). Cloning is almost all waiting
+        on the network and disk, so running them in threads gives a
+        near-linear speedup over cloning one after another.
+        
+        Args:
+            repo_urls: GitHub repository URLs
+            tokens: Token for each URL (same order), or None for no tokens
+        
+        Returns:
+            (repo_url, local path) for each URL, in the same order.
+            The path is None if that clone failed.
+        
+        Example:
+            results = monitor.clone_many(
+                ["https://github.com/user/app-a", "https://github.com/user/app-b"],
+                [token, token]
+            )
+        """
+        if not repo_urls:
+            return []
+        
+        if tokens is None:
+            tokens = [None] * len(repo_urls)
+        
+        def clone_one(job: Tuple[str, Optional[str]]) -> Optional[str]:
+            try:
+                return self.clone_repo(*job)
+            except (ValueError, RuntimeError):
+                # clone_repo already logged why
+                return None
+        
+        workers = min(self.git_concurrency, len(repo_urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            paths = list(pool.map(clone_one, zip(repo_urls, tokens)))
+        
+        return list(zip(repo_urls, paths))
+
+    def pull_latest_swr(self, repo_path: str, max_age: float = 30) -> bool:
+        """
+        Pull the latest changes, but don't wait if the copy is recent enough.
+        
+        "Stale-while-revalidate": if the last successful pull is less than
+        max_age seconds old, return at once. If it's older, start a pull in
+        the background and carry on with the current (slightly old) copy;
+        the next call sees the result. Only a repo that was never pulled
+        successfully makes the caller wait.
+        
+        Args:
+            repo_path: Path to the local repository
+            max_age: Seconds a pulled copy counts as fresh
+        
+        Returns:
+            True if the copy is usable (pulled at some point), False if the
+            first pull failed
+        
+        Example:
+            if monitor.pull_latest_swr('./repos/my-project'):
+                ...  # usually returns immediately
+        """
+        with self._pull_lock:
+            last = self._last_pull.get(repo_path)
+            if last is not None and time.time() - last < max_age:
+                return True
+            
+            # Start a refresh unless one is already running
+            future = self._pull_futures.get(repo_path)
+            if future is None or future.done():
+                future = _BACKGROUND_PULLS.submit(self._pull_and_record, repo_path)
+                self._pull_futures[repo_path] = future
+        
+        if last is None:
+            # Nothing to fall back on yet - wait for the pull
+            return future.result()
+        return True
+
+    def _pull_and_record(self, repo_path: str) -> bool:
+        """
+        Run pull_latest() and remember when it succeeded.
+        
+        A failed pull isn't recorded, so the next pull_latest_swr() call
+        tries again instead of treating the repo as fresh.
+        """
+        success = self.pull_latest(repo_path)
+        if success:
+            with self._pull_lock:
+                self._last_pull[repo_path] = time.time()
+        return success
+
+    def pull_many(self, repo_paths: List[str]) -> List[Tuple[str, bool]]:
+        """
+        Pull the latest changes for several repositories at the same time.
+        
+        Args:
+            repo_paths: Paths to local repositories
+        
+        Returns:
+            (repo_path, success) for each path, in the same order
+        
+        Example:
+            results = monitor.pull_many(['./repos/app-a', './repos/app-b'])
+        """
+        if not repo_paths:
+            return []
+        
+        workers = min(self.git_concurrency, len(repo_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self.pull_latest, repo_paths))
+        
+        return list(zip(repo_paths, results))
+
+    # ------------------------------------------------------------------
+    # Async versions - for callers that already run an asyncio event loop
+    # ------------------------------------------------------------------
+
+    async def a_run_git_command(
+        self,
+        args: list,
+        cwd: str,
+        discard_output: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        Async version of _run_git_command (never raises, like check=False).
+        
+        The event loop keeps running other work while git runs.
+        
+        Args:
+            args: List of command arguments
+            cwd: Current working directory for the command
+            discard_output: Throw away normal output (see _run_git_command)
+        
+        Returns:
+            Tuple of (success: bool, output: str)
+        
+        Example:
+            success, output = await monitor.a_run_git_command(
+                ['git', 'fetch', 'origin'], cwd='/path/to/repo'
+            )
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *_with_git_options(args),
+                cwd=cwd,
+                env=GIT_ENV,
+                stdout=asyncio.subprocess.DEVNULL if discard_output else asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            # Git is not installed
+            if self.logger:
+                self.logger.error("Git is not installed or not in PATH")
+            return False, "Git not found"
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)
+        except asyncio.TimeoutError:
+            # Command took too long - stop it
+            proc.kill()
+            await proc.wait()
+            if self.logger:
+                self.logger.error(f"Git command timed out: {' '.join(args)}")
+            return False, "Command timed out"
+        
+        if proc.returncode != 0:
+            return False, _as_text(stderr) or _as_text(stdout)
+        return True, _as_text(stdout)
+
+    async def a_clone_repo(self, repo_url: str, token: Optional[str] = None) -> str:
+        """
+        Async version of clone_repo().
+        
+        clone_repo() is several git steps plus a file lock around the
+        mirror, so it runs as-is in a worker thread rather than being
+        written twice.
+        
+        Example:
+            path = await monitor.a_clone_repo("https://github.com/user/repo")
+        """
+        return await asyncio.to_thread(self.clone_repo, repo_url, token)
+
+    async def a_pull_latest(self, repo_path: str) -> bool:
+        """
+        Async version of pull_latest() (runs in a worker thread).
+        
+        Example:
+            success = await monitor.a_pull_latest('./repos/my-project')
+        """
+        return await asyncio.to_thread(self.pull_latest, repo_path)
+
+    async def run_many_async(
+        self,
+        coros: Iterable[Awaitable[Any]],
+        limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Run several of the async methods above at once, but at most
+        `limit` at a time.
+        
+        Args:
+            coros: Coroutines, e.g. [monitor.a_pull_latest(p) for p in paths]
+            limit: Most to run at once (default: paths.git_concurrency)
+        
+        Returns:
+            Their results, in the same order. An exception is returned in
+            place of a result instead of cancelling the others.
+        
+        Example:
+            results = asyncio.run(monitor.run_many_async(
+                [monitor.a_clone_repo(url) for url in urls]
+            ))
+        """
+        semaphore = asyncio.Semaphore(limit or self.git_concurrency)
+        
+        async def limited(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(limited(c) for c in coros), return_exceptions=True)
+
     def _get_default_branch(self, repo_path: str) -> str:
         """
         Detect what the default branch is (main, master, etc.).
@@ -383,24 +1368,69 @@ class RepoMonitor:
             branch = monitor._get_default_branch('./repos/my-project')
             # Returns: 'main'
         """
-        # Run: git rev-parse --abbrev-ref HEAD
-        # This returns the name of the current branch
-        success, output = self._run_git_command(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=repo_path,
-            check=False
-        )
+        branch = self._default_branch_cache.get(repo_path)
+        if branch:
+            return branch
         
-        if success:
-            # Output has trailing newline, .strip() removes it
-            return output.strip()
+        # The branch checked out right after cloning is the default branch
+        branch = self.get_current_branch(repo_path)
+        
+        if branch:
+            self._default_branch_cache[repo_path] = branch
+            return branch
         else:
             # Default to 'main' if detection fails
             if self.logger:
                 self.logger.warning("Could not detect default branch, using 'main'")
             return 'main'
 
-    def is_clean_working_directory(self, repo_path: str) -> bool:
+    def _read_head(self, repo_path: str) -> Optional[str]:
+        """
+        Read the current branch straight from .git/HEAD (no git process).
+        
+        Starting git costs tens of milliseconds (more on Windows); reading
+        one small file costs almost nothing. HEAD normally holds a line
+        like "ref: refs/heads/main".
+        
+        Args:
+            repo_path: Path to the local repository
+        
+        Returns:
+            The branch name, "HEAD" if no branch is checked out (same as
+            git rev-parse --abbrev-ref HEAD), or None if HEAD couldn't be
+            read (e.g. .git is a file for a worktree) - then ask git instead
+        """
+        try:
+            with open(os.path.join(repo_path, '.git', 'HEAD'), encoding='utf-8') as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+        if head.startswith('ref: '):
+            # Points at something other than a branch - let git decide
+            return None
+        return 'HEAD'
+
+    def _git_state(self, repo_path: str) -> Tuple:
+        """
+        Signature of a repository's git state (.git/index and .git/HEAD).
+        
+        Args:
+            repo_path: Path to the local repository
+        
+        Returns:
+            A tuple that changes whenever git stages, commits, checks out,
+            resets or stashes
+        """
+        git_dir = os.path.join(repo_path, '.git')
+        return (
+            _file_signature(os.path.join(git_dir, 'index')),
+            _file_signature(os.path.join(git_dir, 'HEAD'))
+        )
+
+    def is_clean_working_directory(self, repo_path: str, use_cache: bool = True) -> bool:
         """
         Check if there are uncommitted changes in the repository.
         
@@ -409,8 +1439,15 @@ class RepoMonitor:
         - New files (untracked)
         - Stashed changes
         
+        "git status" can take seconds on a big repository, so the answer is
+        remembered until git changes .git/index or .git/HEAD (any stage,
+        commit, checkout, reset or stash does). Files edited by hand or by
+        npm since the last check aren't noticed until then - pass
+        use_cache=False after changing files outside git.
+        
         Args:
             repo_path: Path to the local repository
+            use_cache: Reuse the last answer if git state hasn't changed
         
         Returns:
             True if there are no uncommitted changes, False otherwise
@@ -426,25 +1463,43 @@ class RepoMonitor:
             # If repo doesn't exist, it's "clean" (nothing to mess up)
             return True
         
+        if use_cache:
+            cached = self._status_cache.get(repo_path)
+            if cached is not None and cached[0] == self._git_state(repo_path):
+                # With fast_status (untracked files don't count) a "clean"
+                # answer is re-checked by comparing file times/sizes with
+                # .git/index - catching edits made outside git - before
+                # trusting it. Still far cheaper than starting git.
+                if not (self.fast_status and cached[1]) or _tracked_files_unchanged(repo_path):
+                    return cached[1]
+        
         # Run: git status --porcelain
         # --porcelain gives a simple, machine-readable output
         # Empty output means clean
-        success, output = self._run_git_command(
-            ['git', 'status', '--porcelain'],
-            cwd=repo_path,
-            check=False
-        )
+        args = ['git', 'status', '--porcelain']
+        if self.fast_status:
+            args.append('--untracked-files=no')
         
-        if not success:
+        # pygit2 answers in-process when it's installed
+        has_output = self._pygit2_has_changes(repo_path)
+        
+        # Otherwise ask git. Any output at all means there are changes, so
+        # stop reading (and stop git) at the first byte
+        if has_output is None:
+            has_output = self._git_has_output(args, cwd=repo_path)
+        
+        if has_output is None:
             # Could not run git status
             if self.logger:
                 self.logger.warning("Could not check git status")
             return False
         
-        # Check if output is empty
-        # .strip() removes leading/trailing whitespace
-        # If empty after stripping, directory is clean
-        is_clean = len(output.strip()) == 0
+        # No output means the directory is clean
+        is_clean = not has_output
+        
+        # Signature taken after the command, since git status may itself
+        # rewrite the index (to refresh the file times stored in it)
+        self._status_cache[repo_path] = (self._git_state(repo_path), is_clean)
         
         if self.logger:
             if is_clean:
@@ -474,32 +1529,33 @@ class RepoMonitor:
         Example:
             stashed = monitor.stash_changes('./repos/my-project')
         """
-        # First check if there are changes
-        if not self.is_clean_working_directory(repo_path):
+        # Nothing to stash in a repo that doesn't exist
+        if not os.path.exists(repo_path):
+            return True
+        
+        # Run: git stash push --include-untracked
+        # --include-untracked also saves new files
+        # No "git status" check first: on a clean tree git stash just says
+        # "No local changes to save", so one git process does both jobs
+        success, output = self._run_git_command(
+            ['git', 'stash', 'push', '--include-untracked'],
+            cwd=repo_path,
+            check=False
+        )
+        
+        if not success:
             if self.logger:
-                self.logger.info("Stashing local changes")
-            
-            # Run: git stash --include-untracked
-            # --include-untracked also saves new files
-            success, output = self._run_git_command(
-                ['git', 'stash', '--include-untracked'],
-                cwd=repo_path,
-                check=False
-            )
-            
-            if success:
-                if self.logger:
-                    self.logger.info("Changes stashed successfully")
-                return True
-            else:
-                if self.logger:
-                    self.logger.error(f"Failed to stash changes: {output}")
-                return False
-        else:
+                self.logger.error(f"Failed to stash changes: {output}")
+            return False
+        
+        if 'No local changes to save' in output:
             # No changes to stash
             if self.logger:
                 self.logger.debug("No changes to stash")
-            return True
+        else:
+            if self.logger:
+                self.logger.info("Changes stashed successfully")
+        return True
 
     def get_current_branch(self, repo_path: str) -> Optional[str]:
         """
@@ -515,6 +1571,20 @@ class RepoMonitor:
             branch = monitor.get_current_branch('./repos/my-project')
             # Returns: 'main'
         """
+        branch = self._read_head(repo_path)
+        if branch is not None:
+            return branch
+        
+        # pygit2 understands worktrees and odd refs without starting git
+        repo = self._open_git_repo(repo_path)
+        if repo is not None:
+            try:
+                return 'HEAD' if repo.head_is_detached else repo.head.shorthand
+            except pygit2.GitError:
+                pass  # e.g. no commits yet - let git answer
+        
+        # Run: git rev-parse --abbrev-ref HEAD
+        # This returns the name of the current branch
         success, output = self._run_git_command(
             ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
             cwd=repo_path,
@@ -549,6 +1619,8 @@ class RepoMonitor:
         )
         
         if success:
+            # What we remembered as the default branch may be stale now
+            self._default_branch_cache.pop(repo_path, None)
             if self.logger:
                 self.logger.info(f"Switched to branch: {branch_name}")
             return True
@@ -564,7 +1636,11 @@ class RepoMonitor:
 
 def get_repo_monitor(config: dict, logger) -> RepoMonitor:
     """
-    Create a RepoMonitor instance.
+    Get a RepoMonitor instance.
+    
+    Every call builds a new instance: a RepoMonitor keeps per-run state
+    (open git repos, pull times), so a shared one would let one guardian
+    overwrite another's.
     
     Args:
         config: Configuration dictionary
@@ -0,0 +1,127 @@
+"""
+Repo Snapshot - A one-time read of a cloned repository's npm manifest files
+
+This module reads package.json and package-lock.json ONCE per cycle so the
+other skills don't each have to open and parse the same files again.
+
+Think of this as a "photo" of the project's dependency files taken right
+after cloning. Every step of the cycle looks at the same photo, so the
+steps can't disagree about what the files contained.
+
+Beginner Python Notes:
+- dataclass: A decorator that writes __init__ and __repr__ for us
+- classmethod: A method called on the class itself (RepoSnapshot.load(...))
+- hashlib: For building a short fingerprint of the lockfile contents
+"""
+
+# ============================================================================
+# IMPORTS - Bring in external libraries we need
+# ============================================================================
+
+import os
+# os: Built-in library for file operations
+# We use it to build file paths and read modification times
+
+# fast_json (our JSON helpers, orjson when installed) is imported inside
+# RepoSnapshot.load(), so this file can be run on its own too
+
+import hashlib
+# hashlib: Built-in library for hashing
+# We use sha256 to fingerprint package-lock.json
+
+from dataclasses import dataclass, field
+# dataclasses: Built-in library for simple data-holding classes
+# field: Lets us give a dataclass attribute a default value safely
+
+from typing import Any, Dict, Optional
+# typing: Library for type hints
+# Any: Any type
+# Dict: Dictionary type
+# Optional: Can be the type or None
+
+
+# ============================================================================
+# REPO SNAPSHOT CLASS - Pre-parsed manifest files for one cycle
+# ============================================================================
+
+@dataclass
+class RepoSnapshot:
+    """
+    Pre-parsed package.json and package-lock.json for a repository.
+
+    Create one with RepoSnapshot.load() right after cloning and pass it
+    to the dependency checker and upgrade executor.
+
+    Attributes:
+        repo_path: Path to the repository
+        package_json: Parsed package.json contents
+        package_lock: Parsed package-lock.json contents ({} if there is none)
+        lock_hash: sha256 of package-lock.json ('' if there is none)
+        package_json_mtime: Modification time of package.json when read
+    """
+
+    repo_path: str
+    package_json: Dict[str, Any]
+    package_lock: Dict[str, Any] = field(default_factory=dict)
+    lock_hash: str = ''
+    package_json_mtime: float = 0.0
+
+    @classmethod
+    def load(cls, repo_path: str, logger=None) -> Optional['RepoSnapshot']:
+        """
+        Read a repository's manifest files into a snapshot.
+
+        Args:
+            repo_path: Path to the repository
+            logger: Optional logger instance
+
+        Returns:
+            A RepoSnapshot, or None if package.json is missing or unreadable
+            (i.e. this is not a Node.js project we can work with)
+
+        Example:
+            snapshot = RepoSnapshot.load('./repos/my-project')
+            if snapshot is None:
+                print("Not a Node.js project")
+        """
+        from utils import fast_json
+        # fast_json: Parses JSON with orjson when installed (falls back to json)
+        # package.json and package-lock.json are both JSON files, and lock files
+        # are often several MB
+
+        package_json_path = os.path.join(repo_path, 'package.json')
+
+        try:
+            # Read package.json - this one is required
+            package_json = fast_json.load_file(package_json_path)
+            mtime = os.path.getmtime(package_json_path)
+        except FileNotFoundError:
+            return None
+        except (IOError, ValueError) as e:
+            if logger:
+                logger.error(f"Failed to read package.json: {e}")
+            return None
+
+        # Read package-lock.json - this one is optional
+        package_lock = {}
+        lock_hash = ''
+        lock_path = os.path.join(repo_path, 'package-lock.json')
+
+        try:
+            with open(lock_path, 'rb') as f:
+                raw = f.read()
+            lock_hash = hashlib.sha256(raw).hexdigest()
+            package_lock = fast_json.loads(raw)
+        except FileNotFoundError:
+            pass
+        except (IOError, ValueError) as e:
+            if logger:
+                logger.debug(f"Could not read package-lock.json: {e}")
+
+        return cls(
+            repo_path=repo_path,
+            package_json=package_json,
+            package_lock=package_lock,
+            lock_hash=lock_hash,
+            package_json_mtime=mtime
+        )
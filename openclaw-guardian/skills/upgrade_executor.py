@@ -9,7 +9,8 @@ and makes sure everything works together.
 
 Beginner Python Notes:
 - subprocess: For running npm commands
-- json: For reading package.json
+- asyncio: For running npm without blocking (async def / await)
+- fast_json: For reading package.json (orjson when installed)
 - shutil: For copying files
 - typing: For type hints
 """
@@ -26,21 +27,170 @@ import subprocess
 # subprocess: Built-in library for running external programs
 # We use it to run 'npm update' and 'npm install'
 
-import json
-# json: Built-in library for working with JSON
-# We use it to read package.json before and after updates
+import asyncio
+# asyncio: Built-in library for running code concurrently
+# npm runs as an asyncio subprocess, so callers that use asyncio can
+# upgrade several repos at once
 
 import shutil
 # shutil: Built-in library for file operations
 # We use it to copy package.json for comparison
 
-from typing import List, Dict, Any, Optional, Tuple
+import re
+# re: Built-in library for regular expressions (text patterns)
+# We use it to find one version in package-lock.json without parsing it
+
+import mmap
+# mmap: Built-in library for reading a file through memory mapping
+# Lets the regex search a big lock file without copying it into Python
+
+from typing import List, Dict, Any, NamedTuple, Optional, Set, Tuple, TYPE_CHECKING
 # typing: Library for type hints
-# List, Dict, Any, Optional, Tuple: Type hints
+# List, Dict, Any, Optional, Set, Tuple: Type hints
+# NamedTuple: A tuple whose items also have names
+# TYPE_CHECKING: True only for type checkers, so the import below
+# costs nothing at runtime
 
 import sys
 # sys: Built-in library for system operations
 
+import functools
+# functools: Built-in library for higher-order functions
+# We use lru_cache to reuse skill instances built from the same config
+
+# Running "python skills/upgrade_executor.py" only puts skills/ on the
+# import path; utils/ and skills.* below need the project folder
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import fast_json
+# fast_json: Parses JSON with orjson when installed (falls back to json)
+# We use it to read package.json and package-lock.json
+
+if TYPE_CHECKING:
+    from config.config_loader import ConfigKey
+
+from skills.repo_snapshot import RepoSnapshot
+# RepoSnapshot: package.json / package-lock.json read once per cycle
+
+from skills.dependency_checker import (
+    _npm_error, _npm_executable, get_dependency_checker,
+    NPM_OUTDATED_ARGS, NPM_OUTDATED_TIMEOUT
+)
+# _npm_error: Spots npm's {"error": {...}} reply to 'npm outdated'
+# _npm_executable: Full path to npm, so we can run it without a shell
+# get_dependency_checker: Its cached 'npm outdated' result saves an npm run
+# NPM_OUTDATED_ARGS / NPM_OUTDATED_TIMEOUT: How we run 'npm outdated'
+
+from utils.logger import is_debug_enabled
+# is_debug_enabled: Skip work that only feeds debug messages
+
+try:
+    import ijson
+    # ijson: Optional third-party library for reading JSON piece by piece
+    # Lets us find one version in a multi-MB package-lock.json without
+    # building the whole thing in memory. Install with: pip install ijson
+except ImportError:
+    ijson = None
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+class RepoFiles(NamedTuple):
+    """Paths of the npm files in one repository (see _repo_files())."""
+    package_json: str
+    backup: str
+    lock: str
+    node_modules: str
+
+
+@functools.lru_cache(maxsize=64)
+def _repo_files(repo_path: str) -> RepoFiles:
+    """
+    Build the npm file paths for a repository (once per repo path).
+    
+    Args:
+        repo_path: Path to the repository
+    
+    Returns:
+        A RepoFiles with package.json, package.json.backup,
+        package-lock.json and node_modules paths
+    """
+    return RepoFiles(
+        package_json=os.path.join(repo_path, 'package.json'),
+        backup=os.path.join(repo_path, 'package.json.backup'),
+        lock=os.path.join(repo_path, 'package-lock.json'),
+        node_modules=os.path.join(repo_path, 'node_modules')
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _lock_version_pattern(package_name: str) -> 're.Pattern[bytes]':
+    """
+    Build (once per package) the regex that finds a package's version in
+    package-lock.json: "node_modules/<name>": { ... "version": "<version>"
+    
+    [^{}] stops the search at the end of the package's own entry, so we
+    never pick up a version from a nested object or the next package.
+    """
+    return re.compile(
+        rb'"node_modules/' + re.escape(package_name.encode('utf-8')) +
+        rb'"\s*:\s*\{[^{}]*?"version"\s*:\s*"([^"]+)"'
+    )
+
+
+def _scan_lock_version(lock_path: str, package_name: str) -> Optional[str]:
+    """
+    Find a package's version in package-lock.json with a regex (no JSON parse).
+    
+    The file is memory-mapped, so the regex reads it straight from the
+    OS's file cache without copying it into a Python bytes object first.
+    
+    Args:
+        lock_path: Path to package-lock.json
+        package_name: Name of the package
+    
+    Returns:
+        Version string, or None if the regex didn't find it (the caller
+        then falls back to really parsing the file)
+    
+    Raises:
+        FileNotFoundError: If there is no package-lock.json
+    """
+    with open(lock_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None  # Empty file - mmap can't map 0 bytes
+        
+        with data:
+            match = _lock_version_pattern(package_name).search(data)
+            # Copy the version out while the file is still mapped
+            return match.group(1).decode('utf-8') if match else None
+
+
+# Words we look for in npm's output. Precompiled, case-insensitive
+# patterns search the text as-is, without making a lowercased copy of it
+# first. \b (word boundary) means "error" matches but "errored" doesn't
+_ERROR_RE = re.compile(r'\berror\b', re.IGNORECASE)
+_ENOENT_RE = re.compile(r'\benoent\b', re.IGNORECASE)
+_PEER_RE = re.compile(r'\bpeer', re.IGNORECASE)
+_MISSING_RE = re.compile(r'\bmissing\b', re.IGNORECASE)
+
+# How much of npm's error output (stderr) to keep, in bytes. npm writes
+# the actual error at the end, so the last 64 KB is plenty
+NPM_STDERR_TAIL = 64 * 1024
+
+
+def _remove_if_exists(path: str):
+    """Delete a file, doing nothing if it isn't there (one syscall, not two)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 # ============================================================================
 # UPGRADE EXECUTOR CLASS - Handles package upgrades
@@ -51,8 +201,9 @@ class UpgradeExecutor:
     A class that handles upgrading npm dependencies.
     
     This class:
-    1. Runs 'npm update' to upgrade packages
-    2. Runs 'npm install' to validate and update package-lock.json
+    1. Runs 'npm install <pkg>@latest' (or 'npm update') to upgrade
+       packages - this also updates package-lock.json
+    2. Can run 'npm install' / 'npm ls' to validate the result
     3. Compares before/after to see what changed
     4. Handles failures gracefully
     
@@ -79,11 +230,30 @@ class UpgradeExecutor:
         """
         self.config = config
         self.logger = logger
+        
+        # Find npm once, so we can run it directly (no shell needed)
+        # Falls back to plain 'npm' - the commands will then report
+        # that npm is missing
+        self._npm = _npm_executable() or 'npm'
+        
+        # Also write package.json.backup to disk before upgrading?
+        # Off by default: the original bytes are kept in memory and written
+        # back if the upgrade fails. Turn on to survive a crash mid-upgrade
+        self.backup_to_disk = bool(config.get('agent', {}).get('keep_package_json_backup', False))
+        
+        # Parsed JSON files: path -> (mtime_ns, size, inode, parsed data)
+        # If the file's stat() still matches, we skip parsing it again
+        self._json_cache = {}
+        
+        # DependencyChecker used to read cached 'npm outdated' results
+        # (created the first time it's needed)
+        self._checker = None
 
     def upgrade_dependencies(
         self, 
         repo_path: str, 
-        packages: Optional[List[str]] = None
+        packages: Optional[List[str]] = None,
+        snapshot: Optional[RepoSnapshot] = None
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Upgrade dependencies in the repository.
@@ -95,6 +265,9 @@ class UpgradeExecutor:
             repo_path: Path to the repository
             packages: Optional list of specific packages to upgrade
                       If None, all outdated packages are upgraded
+            snapshot: Optional RepoSnapshot loaded earlier in the cycle.
+                      Its package.json is used as the "before" state
+                      instead of reading the file again.
         
         Returns:
             Tuple of (success: bool, upgraded_packages: list)
@@ -114,74 +287,118 @@ class UpgradeExecutor:
         if self.logger:
             self.logger.info("Starting dependency upgrade")
         
-        # Validate repo exists
-        if not os.path.exists(repo_path):
+        files = _repo_files(repo_path)
+        
+        # Read package.json's raw bytes once. After npm runs, comparing
+        # bytes is much cheaper than parsing the new file and comparing
+        # dictionaries. They are also our backup: a failed upgrade writes
+        # them back
+        old_bytes = self._read_bytes(files.package_json)
+        if old_bytes is None:
+            # Only now find out why (no extra stat() when all is well)
             if self.logger:
-                self.logger.error(f"Repository not found: {repo_path}")
+                if not os.path.isdir(repo_path):
+                    self.logger.error(f"Repository not found: {repo_path}")
+                else:
+                    self.logger.error("Failed to read package.json")
             return False, []
         
         # Get current package.json for comparison later
-        old_package_json = self._read_package_json(repo_path)
+        # (reuse the snapshot's copy when we have one)
+        if snapshot is not None:
+            old_package_json = snapshot.package_json
+        else:
+            try:
+                old_package_json = fast_json.loads(old_bytes)
+            except fast_json.JSONDecodeError:
+                old_package_json = None
         if not old_package_json:
             if self.logger:
                 self.logger.error("Failed to read package.json")
             return False, []
         
-        # Save a backup of the current package.json
-        backup_path = os.path.join(repo_path, 'package.json.backup')
-        try:
-            shutil.copy2(
-                os.path.join(repo_path, 'package.json'),
-                backup_path
-            )
-            if self.logger:
-                self.logger.info("Created backup of package.json")
-        except IOError as e:
-            if self.logger:
-                self.logger.warning(f"Could not create backup: {e}")
+        # Anything to do at all? 'npm install' takes 30-60s even when every
+        # package is already up to date, so ask 'npm outdated' first
+        # (usually answered from the dependency checker's cache)
+        outdated = self._get_outdated_names(repo_path)
+        if outdated is not None:
+            if packages is not None:
+                # Only install the requested packages that really are outdated
+                packages = [name for name in packages if name in outdated]
+            if not outdated or packages == []:
+                if self.logger:
+                    self.logger.info("Nothing to upgrade - packages are already up to date")
+                return True, []
+        
+        # Save a backup file of the current package.json only if asked to
+        backup_created = False
+        if self.backup_to_disk:
+            try:
+                shutil.copy2(
+                    files.package_json,
+                    files.backup
+                )
+                backup_created = True
+                if self.logger:
+                    self.logger.info("Created backup of package.json")
+            except IOError as e:
+                if self.logger:
+                    self.logger.warning(f"Could not create backup: {e}")
         
         try:
             # Run npm update
             success = self._run_npm_update(repo_path, packages)
             
+            # npm rewrote the manifests - never trust the cached copies
+            self._forget_json(files.package_json)
+            self._forget_json(files.lock)
+            
             if not success:
                 if self.logger:
                     self.logger.error("npm update failed")
                 # Restore backup
-                self._restore_package_json(repo_path)
+                self._restore_package_json(repo_path, old_bytes)
                 return False, []
             
             if self.logger:
                 self.logger.info("npm update completed successfully")
             
             # Get the new package.json to compare
-            new_package_json = self._read_package_json(repo_path)
+            new_bytes = self._read_bytes(files.package_json)
             
             # Handle case where new package.json couldn't be read
-            if new_package_json is None:
+            if new_bytes is None:
                 if self.logger:
                     self.logger.error("Could not read new package.json")
-                self._restore_package_json(repo_path)
+                self._restore_package_json(repo_path, old_bytes)
                 return False, []
             
-            # Figure out what was actually upgraded
-            upgraded_packages = self._get_updated_packages(
-                old_package_json, 
-                new_package_json
-            )
-            
-            # If no packages upgraded, check if there were changes
-            if not upgraded_packages:
-                # Compare package.json files directly
-                if old_package_json != new_package_json:
+            if new_bytes == old_bytes:
+                # Byte-for-byte the same file: nothing was upgraded, so
+                # there's nothing to parse or compare
+                upgraded_packages = []
+                new_package_json = old_package_json
+            else:
+                try:
+                    new_package_json = fast_json.loads(new_bytes)
+                except fast_json.JSONDecodeError as e:
                     if self.logger:
-                        self.logger.info("package.json changed, checking what was upgraded...")
-                    # Even if we can't parse exactly what, something changed
-                    # Get list of all packages and report them as upgraded
-                    upgraded_packages = self._find_all_differences(
-                        old_package_json, 
-                        new_package_json
-                    )
+                        self.logger.error(f"Could not read new package.json: {e}")
+                    self._restore_package_json(repo_path, old_bytes)
+                    return False, []
+                
+                # Figure out what was actually upgraded
+                upgraded_packages = self._get_updated_packages(
+                    old_package_json, 
+                    new_package_json
+                )
+            
+            # If no packages upgraded, say whether anything else changed.
+            # (No second diff here - _find_all_differences() gives the same
+            # answer as the comparison we just did)
+            if not upgraded_packages and new_bytes != old_bytes:
+                if self.logger:
+                    self.logger.info("package.json changed, but no dependency versions did")
             
             if self.logger:
                 self.logger.info(f"Upgraded {len(upgraded_packages)} packages")
@@ -191,8 +408,8 @@ class UpgradeExecutor:
                     )
             
             # Clean up backup
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
+            if backup_created:
+                _remove_if_exists(files.backup)
             
             # Consider it a success if we tried to upgrade and something changed
             if packages and upgraded_packages:
@@ -205,25 +422,130 @@ class UpgradeExecutor:
             
             return True, upgraded_packages
             
+        except Exception as e:
             if self.logger:
-                self.logger.info(f"Upgraded {len(upgraded_packages)} packages")
-                for pkg in upgraded_packages:
-                    self.logger.info(
-                        f"  {pkg['name']}: {pkg['old']} -> {pkg['new']}"
-                    )
+                self.logger.error(f"Error during upgrade: {e}")
+            # Try to restore backup
+            self._restore_package_json(repo_path, old_bytes)
+            return False, []
+
+    async def _run_npm(
+        self,
+        args: List[str],
+        repo_path: str,
+        timeout: int,
+        keep_stdout: bool = False
+    ) -> subprocess.CompletedProcess:
+        """
+        Run an npm command as an asyncio subprocess and wait for it.
+        
+        npm install can print megabytes of output. Normal output is thrown
+        away unless keep_stdout is set, and of stderr only the last
+        NPM_STDERR_TAIL bytes are kept (that's where npm puts the error).
+        Both pipes are read while npm runs, so npm never stalls on a full
+        pipe.
+        
+        Args:
+            args: Full command, starting with self._npm
+            repo_path: Folder to run it in
+            timeout: Seconds to wait before killing npm
+            keep_stdout: Return npm's normal output too ("" otherwise)
+        
+        Returns:
+            A subprocess.CompletedProcess with text stdout/stderr, like
+            subprocess.run(..., capture_output=True, text=True)
+        
+        Raises:
+            subprocess.TimeoutExpired: If npm takes longer than timeout
+            FileNotFoundError: If npm is not installed
+        """
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE if keep_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        stderr_tail = bytearray()
+        
+        async def read_stdout() -> bytes:
+            return await process.stdout.read() if keep_stdout else b''
+        
+        async def drain_stderr():
+            while True:
+                chunk = await process.stderr.read(65536)
+                if not chunk:
+                    return
+                stderr_tail.extend(chunk)
+                # Only keep the end
+                if len(stderr_tail) > NPM_STDERR_TAIL:
+                    del stderr_tail[:-NPM_STDERR_TAIL]
+        
+        try:
+            stdout, _, _ = await asyncio.wait_for(
+                asyncio.gather(read_stdout(), drain_stderr(), process.wait()),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            # Don't leave a stuck npm process behind
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        
+        return subprocess.CompletedProcess(
+            args,
+            process.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr_tail.decode('utf-8', errors='replace')
+        )
+
+    def _get_outdated_names(self, repo_path: str) -> Optional[Set[str]]:
+        """
+        Get the names of the packages 'npm outdated' reports for a repo.
+        
+        The dependency checker's cached result is used when there is one
+        (the normal cycle just checked), otherwise npm is run.
+        
+        Args:
+            repo_path: Path to the repository
+        
+        Returns:
+            Set of outdated package names, or None if we couldn't find out
+            (then the upgrade just goes ahead as if we hadn't asked)
+        """
+        try:
+            if self._checker is None:
+                self._checker = get_dependency_checker(self.config, self.logger)
+            cached = self._checker.cached_outdated(repo_path)
+            if cached is not None:
+                return {package.name for package in cached}
             
-            # Clean up backup
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
+            result = asyncio.run(self._run_npm(
+                [self._npm, *NPM_OUTDATED_ARGS],
+                repo_path,
+                timeout=NPM_OUTDATED_TIMEOUT,
+                keep_stdout=True
+            ))
             
-            return True, upgraded_packages
+            # Exit code 1 just means "some packages are outdated"
+            if result.returncode not in (0, 1):
+                return None
+            
+            # No output at all means nothing is outdated
+            if not result.stdout.strip():
+                return set()
+            
+            outdated_data = fast_json.loads(result.stdout)
+            
+            # npm couldn't check (e.g. registry unreachable) - we don't know
+            if _npm_error(outdated_data) is not None:
+                return None
+            return set(outdated_data)
             
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error during upgrade: {e}")
-            # Try to restore backup
-            self._restore_package_json(repo_path)
-            return False, []
+                self.logger.debug(f"Could not check for outdated packages: {e}")
+            return None
 
     def _run_npm_update(
         self, 
@@ -236,6 +558,11 @@ class UpgradeExecutor:
         This is different from npm update - it installs the absolute latest
         version of each package, not just the semver-satisfying version.
         
+        One 'npm install a@latest b@latest ...' already resolves the tree and
+        writes node_modules and package-lock.json, so no separate
+        'npm install' pass is needed afterwards. Call _run_npm_install()
+        yourself only if you want an extra check.
+        
         Args:
             repo_path: Path to the repository
             packages: Optional list of packages to update to latest
@@ -243,6 +570,19 @@ class UpgradeExecutor:
         Returns:
             True if successful, False otherwise
         """
+        return asyncio.run(self._run_npm_update_async(repo_path, packages))
+
+    async def _run_npm_update_async(
+        self, 
+        repo_path: str, 
+        packages: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Async version of _run_npm_update().
+        
+        Same arguments and result, but npm runs as an asyncio subprocess
+        so several repos can be upgraded at once.
+        """
         if self.logger:
             if packages:
                 self.logger.info(f"Updating packages to latest: {packages}")
@@ -251,24 +591,36 @@ class UpgradeExecutor:
         
         try:
             if packages:
-                # Install each package at latest version
-                # npm install package@latest --save
+                # Install all packages at their latest version with ONE npm
+                # command: npm install a@latest b@latest ... --save
+                # npm resolves the tree and writes node_modules once instead
+                # of once per package (and npm can't safely run in parallel
+                # on the same folder anyway)
+                cmd = [self._npm, 'install', *[f'{package}@latest' for package in packages],
+                       '--save', '--legacy-peer-deps']
+                
+                result = await self._run_npm(cmd, repo_path, timeout=300)
+                
+                if result.returncode == 0:
+                    if self.logger:
+                        self.logger.info(f"Successfully updated {len(packages)} packages")
+                    return True
+                
+                # One bad package fails the whole batch - retry one at a
+                # time so the others can still be upgraded
+                if self.logger:
+                    self.logger.warning("Batch install failed, installing packages one at a time")
+                
+                failed = 0
                 for package in packages:
                     self.logger.info(f"Installing {package}@latest")
-                    cmd = ['npm', 'install', f'{package}@latest', '--save', '--legacy-peer-deps']
+                    cmd = [self._npm, 'install', f'{package}@latest', '--save', '--legacy-peer-deps']
                     
-                    result = subprocess.run(
-                        cmd,
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True,
-                        timeout=300,
-                        shell=True
-                    )
+                    result = await self._run_npm(cmd, repo_path, timeout=300)
                     
                     if result.returncode != 0:
-                        stderr = result.stderr.lower()
-                        if 'error' in stderr:
+                        failed += 1
+                        if _ERROR_RE.search(result.stderr):
                             if self.logger:
                                 self.logger.warning(f"Failed to update {package}: {result.stderr}")
                             # Continue with other packages
@@ -276,27 +628,22 @@ class UpgradeExecutor:
                         if self.logger:
                             self.logger.info(f"Successfully updated {package}")
                 
-                # Run npm install with legacy-peer-deps to handle conflicts
-                result = subprocess.run(
-                    ['npm', 'install', '--legacy-peer-deps'],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                    shell=True
-                )
+                # Each successful install above already updated node_modules
+                # and package-lock.json. Only a failed one can leave them
+                # half-done, so only then run npm install (with
+                # legacy-peer-deps) to tidy up
+                if failed:
+                    result = await self._run_npm(
+                        [self._npm, 'install', '--legacy-peer-deps'], repo_path, timeout=300
+                    )
                 
                 return True
             else:
                 # Update all packages
-                cmd = ['npm', 'update', '--legacy-peer-deps']
-                result = subprocess.run(
-                    cmd,
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                    shell=True
+                cmd = [self._npm, 'update', '--legacy-peer-deps']
+                # npm's normal output is only used for a debug message
+                result = await self._run_npm(
+                    cmd, repo_path, timeout=300, keep_stdout=is_debug_enabled(self.logger)
                 )
                 
                 if result.returncode == 0:
@@ -304,8 +651,7 @@ class UpgradeExecutor:
                         self.logger.debug(f"npm update output: {result.stdout}")
                     return True
                 else:
-                    stderr = result.stderr.lower()
-                    if 'error' in stderr:
+                    if _ERROR_RE.search(result.stderr):
                         if self.logger:
                             self.logger.error(f"npm update error: {result.stderr}")
                         return False
@@ -336,29 +682,32 @@ class UpgradeExecutor:
         Returns:
             True if successful (or with warnings), False on critical error
         """
+        return asyncio.run(self._run_npm_install_async(repo_path))
+
+    async def _run_npm_install_async(self, repo_path: str) -> bool:
+        """
+        Async version of _run_npm_install() (same arguments and result).
+        """
         if self.logger:
             self.logger.info("Running npm install to validate")
         
         try:
-            result = subprocess.run(
-                ['npm', 'install', '--legacy-peer-deps'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                shell=True
+            result = await self._run_npm(
+                [self._npm, 'install', '--legacy-peer-deps'],
+                repo_path,
+                timeout=300  # 5 minute timeout
             )
             
             # Check for critical errors
-            stderr = result.stderr.lower()
-            if 'error' in stderr and 'enoent' in stderr:
+            stderr = result.stderr
+            if _ERROR_RE.search(stderr) and _ENOENT_RE.search(stderr):
                 # enoent = "error no entity" - file not found
                 if self.logger:
                     self.logger.error(f"npm install error: {result.stderr}")
                 return False
             
             # Check for peer dependency warnings - these are usually okay
-            if 'peer' in stderr:
+            if _PEER_RE.search(stderr):
                 if self.logger:
                     self.logger.warning("npm install had peer dependency warnings")
             
@@ -377,6 +726,58 @@ class UpgradeExecutor:
                 self.logger.error(f"npm install failed: {e}")
             return False
 
+    def _load_json(self, path: str) -> Any:
+        """
+        Read and parse a JSON file, reusing the last result if it's unchanged.
+        
+        The file counts as unchanged when its modification time (in
+        nanoseconds), size and inode all match what we saw last time.
+        One os.stat() is much cheaper than parsing a big package-lock.json.
+        
+        The returned object is shared with the cache, so don't modify it.
+        
+        Args:
+            path: Path to the JSON file
+        
+        Returns:
+            The parsed value
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            fast_json.JSONDecodeError, IOError: If it can't be read or parsed
+        """
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[:3] == signature:
+            return cached[3]
+        
+        data = fast_json.load_file(path)
+        
+        self._json_cache[path] = (*signature, data)
+        return data
+
+    def _read_bytes(self, path: str) -> Optional[bytes]:
+        """
+        Read a file's raw bytes.
+        
+        Args:
+            path: Path to the file
+        
+        Returns:
+            The file contents, or None if it can't be read
+        """
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _forget_json(self, path: str):
+        """Drop a file from the JSON cache (call after something rewrites it)."""
+        self._json_cache.pop(path, None)
+
     def _read_package_json(self, repo_path: str) -> Optional[Dict[str, Any]]:
         """
         Read the package.json file.
@@ -386,49 +787,74 @@ class UpgradeExecutor:
         
         Returns:
             The package.json contents as a dictionary, or None on error
+            (shared with the cache - don't modify it)
         """
-        package_json_path = os.path.join(repo_path, 'package.json')
-        
-        if not os.path.exists(package_json_path):
-            return None
-        
+        # No exists() check first - stat() tells us if the file is missing
         try:
-            with open(package_json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return self._load_json(_repo_files(repo_path).package_json)
+        except FileNotFoundError:
+            return None
+        except (fast_json.JSONDecodeError, IOError) as e:
             if self.logger:
                 self.logger.error(f"Failed to read package.json: {e}")
             return None
 
-    def _restore_package_json(self, repo_path: str) -> bool:
+    def _restore_package_json(self, repo_path: str, original: Optional[bytes] = None) -> bool:
         """
-        Restore package.json from backup if it exists.
+        Restore package.json from the original bytes or the backup file.
         
         This is called if the upgrade fails, to roll back changes.
         
         Args:
             repo_path: Path to the repository
+            original: package.json contents from before the upgrade.
+                      If None, package.json.backup is used instead.
         
         Returns:
             True if restored successfully, False otherwise
         """
-        backup_path = os.path.join(repo_path, 'package.json.backup')
-        package_json_path = os.path.join(repo_path, 'package.json')
-        
-        if not os.path.exists(backup_path):
-            if self.logger:
-                self.logger.warning("No backup to restore")
-            return False
+        files = _repo_files(repo_path)
+        backup_path = files.backup
+        package_json_path = files.package_json
+        
+        if original is not None:
+            try:
+                with open(package_json_path, 'wb') as f:
+                    f.write(original)
+                self._forget_json(package_json_path)
+                
+                # A backup file (if one was made) isn't needed any more
+                _remove_if_exists(backup_path)
+                
+                if self.logger:
+                    self.logger.info("Restored package.json")
+                
+                return True
+                
+            except IOError as e:
+                if self.logger:
+                    self.logger.error(f"Failed to restore package.json: {e}")
+                return False
         
         try:
-            shutil.copy2(backup_path, package_json_path)
-            os.remove(backup_path)
+            # Move the backup over package.json: one atomic rename instead
+            # of copying the file back and deleting the backup
+            os.replace(backup_path, package_json_path)
+            
+            # The backup kept the old modification time, so the cache
+            # can't tell the file changed - drop it ourselves
+            self._forget_json(package_json_path)
             
             if self.logger:
                 self.logger.info("Restored package.json from backup")
             
             return True
             
+        except FileNotFoundError:
+            if self.logger:
+                self.logger.warning("No backup to restore")
+            return False
+            
         except IOError as e:
             if self.logger:
                 self.logger.error(f"Failed to restore backup: {e}")
@@ -463,14 +889,12 @@ class UpgradeExecutor:
         """
         upgraded = []
         
-        # Get both dependencies and devDependencies
-        old_deps = old_pkg.get('dependencies', {})
-        old_dev_deps = old_pkg.get('devDependencies', {})
-        old_all = {**old_deps, **old_dev_deps}
-        
-        new_deps = new_pkg.get('dependencies', {})
-        new_dev_deps = new_pkg.get('devDependencies', {})
-        new_all = {**new_deps, **new_dev_deps}
+        # Get both dependencies and devDependencies in one dict each.
+        # (Merging is a fast C-level copy; after that one pass over old_all
+        # with new_all.get() finds every change - no intersection set or
+        # second lookup per package needed)
+        old_all = {**old_pkg.get('dependencies', {}), **old_pkg.get('devDependencies', {})}
+        new_all = {**new_pkg.get('dependencies', {}), **new_pkg.get('devDependencies', {})}
         
         # Compare each package
         for name, old_version in old_all.items():
@@ -503,27 +927,8 @@ class UpgradeExecutor:
         Returns:
             List of packages that changed
         """
-        upgraded = []
-        
-        old_deps = old_pkg.get('dependencies', {})
-        old_dev_deps = old_pkg.get('devDependencies', {})
-        
-        new_deps = new_pkg.get('dependencies', {})
-        new_dev_deps = new_pkg.get('devDependencies', {})
-        
-        all_old = {**old_deps, **old_dev_deps}
-        all_new = {**new_deps, **new_dev_deps}
-        
-        for name, old_ver in all_old.items():
-            new_ver = all_new.get(name)
-            if new_ver and new_ver != old_ver:
-                upgraded.append({
-                    'name': name,
-                    'old': old_ver,
-                    'new': new_ver
-                })
-        
-        return upgraded
+        # Same comparison as _get_updated_packages()
+        return self._get_updated_packages(old_pkg, new_pkg)
 
     def validate_installation(self, repo_path: str) -> Tuple[bool, str]:
         """
@@ -545,37 +950,40 @@ class UpgradeExecutor:
             if not success:
                 print(f"Validation failed: {msg}")
         """
+        return asyncio.run(self.validate_installation_async(repo_path))
+
+    async def validate_installation_async(self, repo_path: str) -> Tuple[bool, str]:
+        """
+        Async version of validate_installation() (same arguments and result).
+        
+        Example:
+            success, msg = asyncio.run(executor.validate_installation_async(repo_path))
+        """
         if self.logger:
             self.logger.info("Validating installation")
         
         # Check node_modules exists
-        node_modules = os.path.join(repo_path, 'node_modules')
-        if not os.path.exists(node_modules):
+        if not os.path.isdir(_repo_files(repo_path).node_modules):
             return False, "node_modules not found - run npm install first"
         
         try:
             # Try running npm ls to verify packages
-            result = subprocess.run(
-                ['npm', 'ls', '--depth=0'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                shell=True
+            result = await self._run_npm(
+                [self._npm, 'ls', '--depth=0'], repo_path, timeout=60, keep_stdout=True
             )
             
             # Check for errors in output
-            stderr = result.stderr.lower()
-            stdout = result.stdout.lower()
+            stderr = result.stderr
+            stdout = result.stdout
             
             # Empty output with 0 return code = success
-            if result.returncode == 0 and 'error' not in stderr:
+            if result.returncode == 0 and not _ERROR_RE.search(stderr):
                 if self.logger:
                     self.logger.info("Installation validated successfully")
                 return True, "All packages installed correctly"
             
             # Check if it's just missing peer dependencies (not critical)
-            if 'missing' in stdout or 'peer' in stderr:
+            if _MISSING_RE.search(stdout) or _PEER_RE.search(stderr):
                 if self.logger:
                     self.logger.warning("Some peer dependencies missing")
                 return True, "Packages installed (some peer deps may be missing)"
@@ -612,14 +1020,25 @@ class UpgradeExecutor:
             version = executor.get_package_lock_version('./repos/my-project', 'lodash')
             print(f"Installed lodash version: {version}")
         """
-        lock_path = os.path.join(repo_path, 'package-lock.json')
-        
-        if not os.path.exists(lock_path):
-            return None
+        lock_path = _repo_files(repo_path).lock
         
+        # No exists() check first - stat() tells us if the file is missing
         try:
-            with open(lock_path, 'r', encoding='utf-8') as f:
-                lock_data = json.load(f)
+            if lock_path not in self._json_cache:
+                # Not parsed yet - first try a plain text search, which
+                # finds the usual '"node_modules/<name>": {"version": ...'
+                # entry without parsing any JSON
+                version = _scan_lock_version(lock_path, package_name)
+                if version is not None:
+                    return version
+                
+                # With ijson, stream through the file and stop at the package
+                if ijson is not None:
+                    return self._stream_lock_version(lock_path, package_name)
+            
+            # Lock files can be several MB, so reuse the parsed copy when
+            # the file hasn't changed since the last lookup
+            lock_data = self._load_json(lock_path)
             
             # Try to find the package in package-lock.json
             # The structure varies, so we check different paths
@@ -639,11 +1058,50 @@ class UpgradeExecutor:
             
             return None
             
+        except FileNotFoundError:
+            # No package-lock.json - nothing to look up
+            return None
         except Exception as e:
             if self.logger:
                 self.logger.debug(f"Could not read package-lock.json: {e}")
             return None
 
+    def _stream_lock_version(self, lock_path: str, package_name: str) -> Optional[str]:
+        """
+        Find a package's version in package-lock.json with ijson.
+        
+        Reads the file as a stream of JSON events and stops as soon as
+        "packages" -> "node_modules/<name>" -> "version" turns up, so
+        only the part of the file before it is ever read.
+        
+        Args:
+            lock_path: Path to package-lock.json
+            package_name: Name of the package
+        
+        Returns:
+            Version string, or None if not found
+        
+        Raises:
+            FileNotFoundError: If there is no package-lock.json
+        """
+        # ijson names each value by its path, joined with dots
+        wanted = f'packages.node_modules/{package_name}.version'
+        legacy = f'dependencies.{package_name}.version'
+        legacy_version = None
+        
+        with open(lock_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event != 'string':
+                    continue
+                if prefix == wanted:
+                    return value
+                if prefix == legacy:
+                    # Old lockfile format - only used if "packages" doesn't
+                    # have the package (same order as the full-parse path)
+                    legacy_version = value
+        
+        return legacy_version
+
 
 # ============================================================================
 # CONVENIENCE FUNCTION - Simple way to get an UpgradeExecutor
@@ -651,7 +1109,11 @@ class UpgradeExecutor:
 
 def get_upgrade_executor(config: Dict[str, Any], logger) -> UpgradeExecutor:
     """
-    Create an UpgradeExecutor instance.
+    Get an UpgradeExecutor instance.
+    
+    Instances are cached by config contents, so asking twice with the
+    same config and logger returns the same object instead of
+    building (and re-validating) a new one.
     
     Args:
         config: Configuration dictionary
@@ -663,7 +1125,16 @@ def get_upgrade_executor(config: Dict[str, Any], logger) -> UpgradeExecutor:
     Example:
         executor = get_upgrade_executor(config, logger)
     """
-    return UpgradeExecutor(config, logger)
+    # ConfigKey: Hashable wrapper so a config dict can be a cache key
+    # (imported here so this file still runs on its own)
+    from config.config_loader import ConfigKey
+    return _cached_upgrade_executor(ConfigKey(config), logger)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_upgrade_executor(config_key: 'ConfigKey', logger) -> UpgradeExecutor:
+    """Build the UpgradeExecutor behind get_upgrade_executor() (cached per config + logger)."""
+    return UpgradeExecutor(config_key.config, logger)
 
 
 # ============================================================================
@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures for the OpenClaw Guardian tests
+
+The tests don't share any files, so they can run in parallel with
+pytest-xdist (see requirements.txt):
+
+    pytest -n auto --dist=loadfile
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --runslow option (slow tests are skipped without it)"""
+    parser.addoption(
+        '--runslow', action='store_true', default=False,
+        help='also run tests marked @pytest.mark.slow'
+    )
+
+
+def pytest_configure(config):
+    """Register the slow marker so pytest doesn't warn about it"""
+    config.addinivalue_line('markers', 'slow: imports every skill / loads config.yaml (run with --runslow)')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow was given"""
+    if config.getoption('--runslow'):
+        return
+    
+    skip_slow = pytest.mark.skip(reason='need --runslow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def shared_config():
+    """config.yaml, loaded once for the whole test session"""
+    from config.config_loader import load_config
+    return load_config('config.yaml')
+
+
+@pytest.fixture(scope="session")
+def shared_logger(tmp_path_factory):
+    """The agent's logger, created once for the whole test session"""
+    from utils.logger import get_logger
+    # Log to a temporary folder instead of ./logs. With pytest-xdist each
+    # worker is its own session, so workers never write to the same file
+    return get_logger(log_dir=str(tmp_path_factory.mktemp('logs')))
+
+
+@pytest.fixture(scope="session")
+def pr_creator(shared_config, shared_logger):
+    """A PRCreator built once for the whole test session"""
+    from skills.pr_creator import get_pr_creator
+    return get_pr_creator(shared_config, shared_logger)
+
+
+@pytest.fixture(scope="session")
+def moltbook_poster(shared_config, shared_logger):
+    """A MoltbookPoster built once for the whole test session"""
+    from skills.moltbook_poster import get_moltbook_poster
+    return get_moltbook_poster(shared_config, shared_logger)
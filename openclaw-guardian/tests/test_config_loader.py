@@ -3,13 +3,8 @@ Unit tests for ConfigLoader
 """
 
 import os
-import sys
 import tempfile
 import pytest
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.config_loader import ConfigLoader
 
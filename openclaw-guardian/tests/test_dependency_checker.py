@@ -3,16 +3,15 @@ Unit tests for DependencyChecker
 """
 
 import os
-import sys
 import json
+import asyncio
 import tempfile
+import threading
+import time
 import pytest
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from skills.dependency_checker import DependencyChecker
+from skills.dependency_checker import DependencyChecker, Package
+from skills.repo_snapshot import RepoSnapshot
 
 
 class TestDependencyChecker:
@@ -65,15 +64,16 @@ class TestDependencyChecker:
         assert result[0]['latest'] == '4.17.21'
         assert result[1]['name'] == 'axios'
         assert result[1]['current'] == '0.27.0'
+        assert result[0].as_dict()['wanted'] == '4.17.21'
     
     def test_filter_packages_to_upgrade(self, mock_config, mock_logger):
         """Test filtering packages based on memory"""
         checker = DependencyChecker(mock_config, mock_logger)
         
         outdated_list = [
-            {'name': 'lodash', 'current': '4.17.15', 'wanted': '4.17.21', 'latest': '4.17.21'},
-            {'name': 'axios', 'current': '0.27.0', 'wanted': '0.27.2', 'latest': '1.6.0'},
-            {'name': 'react', 'current': '17.0.1', 'wanted': '17.0.2', 'latest': '18.2.0'}
+            Package.from_dict({'name': 'lodash', 'current': '4.17.15', 'wanted': '4.17.21', 'latest': '4.17.21'}),
+            Package.from_dict({'name': 'axios', 'current': '0.27.0', 'wanted': '0.27.2', 'latest': '1.6.0'}),
+            Package.from_dict({'name': 'react', 'current': '17.0.1', 'wanted': '17.0.2', 'latest': '18.2.0'})
         ]
         
         # Mock memory that has lodash as recently upgraded
@@ -88,6 +88,116 @@ class TestDependencyChecker:
         assert 'lodash' not in [p['name'] for p in result]
         assert 'axios' in [p['name'] for p in result]
         assert 'react' in [p['name'] for p in result]
+    
+    def test_check_outdated_many_returns_result_per_repo(self, mock_config, mock_logger):
+        """Test that check_outdated_many gives one entry per repo path"""
+        checker = DependencyChecker(mock_config, mock_logger)
+        
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            # No package.json in either, so npm is never started
+            results = asyncio.run(checker.check_outdated_many([first, second]))
+        
+        assert results == {first: [], second: []}
+    
+    def test_check_outdated_uses_cache(self, mock_logger):
+        """Test that a fresh cache entry is returned without running npm"""
+        with tempfile.TemporaryDirectory() as repo_path, tempfile.TemporaryDirectory() as cache_dir:
+            with open(os.path.join(repo_path, 'package.json'), 'w') as f:
+                json.dump({'dependencies': {'lodash': '^4.17.15'}}, f)
+            
+            config = {'paths': {'npm_cache_directory': cache_dir}}
+            checker = DependencyChecker(config, mock_logger)
+            
+            cached = [Package('lodash', '4.17.15', '4.17.21', '4.17.21', 'myproject', '')]
+            checker._write_outdated_cache(checker._outdated_cache_key(repo_path), cached)
+            
+            assert checker.check_outdated(repo_path) == cached
+            
+            # After invalidating, the entry is gone
+            assert checker.invalidate_cache(repo_path) is True
+            assert checker._read_outdated_cache(checker._outdated_cache_key(repo_path)) is None
+    
+    def test_cached_outdated_never_runs_npm(self, mock_logger):
+        """Test that cached_outdated only reads the cache"""
+        with tempfile.TemporaryDirectory() as repo_path, tempfile.TemporaryDirectory() as cache_dir:
+            with open(os.path.join(repo_path, 'package.json'), 'w') as f:
+                json.dump({'dependencies': {'lodash': '^4.17.15'}}, f)
+            
+            config = {'paths': {'npm_cache_directory': cache_dir}}
+            checker = DependencyChecker(config, mock_logger)
+            
+            # Nothing cached yet
+            assert checker.cached_outdated(repo_path) is None
+            
+            cached = [Package('lodash', '4.17.15', '4.17.21', '4.17.21', 'myproject', '')]
+            checker._write_outdated_cache(checker._outdated_cache_key(repo_path), cached)
+            
+            assert checker.cached_outdated(repo_path) == cached
+    
+    @pytest.mark.skipif(os.name == 'nt', reason='uses a shell script as a fake npm')
+    def test_failed_npm_run_is_not_cached(self, mock_logger):
+        """Test that a crashed npm run with no output is not cached as up to date"""
+        with tempfile.TemporaryDirectory() as repo_path, tempfile.TemporaryDirectory() as cache_dir:
+            with open(os.path.join(repo_path, 'package.json'), 'w') as f:
+                json.dump({'dependencies': {'lodash': '^4.17.15'}}, f)
+            
+            # A fake npm that dies without printing anything
+            fake_npm = os.path.join(cache_dir, 'npm')
+            with open(fake_npm, 'w') as f:
+                f.write('#!/bin/sh\nexit 137\n')
+            os.chmod(fake_npm, 0o755)
+            
+            config = {'paths': {'npm_cache_directory': os.path.join(cache_dir, 'cache')}}
+            checker = DependencyChecker(config, mock_logger)
+            checker._npm = fake_npm
+            
+            assert checker.check_outdated(repo_path) == []
+            assert asyncio.run(checker.check_outdated_async(repo_path)) == []
+            assert checker.cached_outdated(repo_path) is None
+    
+    def test_concurrent_checks_share_one_run(self, mock_config, mock_logger):
+        """Test that simultaneous checks of one repo only run npm once"""
+        checker = DependencyChecker(mock_config, mock_logger)
+        calls = []
+        
+        def slow_check(repo_path, snapshot):
+            calls.append(repo_path)
+            time.sleep(0.2)
+            return ['lodash']
+        
+        checker._check_outdated = slow_check
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(checker.check_outdated('./repo')))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert results == [['lodash']] * 3
+    
+    def test_repo_snapshot_load(self):
+        """Test that RepoSnapshot reads package.json and package-lock.json once"""
+        with tempfile.TemporaryDirectory() as repo_path:
+            with open(os.path.join(repo_path, 'package.json'), 'w') as f:
+                json.dump({'dependencies': {'lodash': '^4.17.15'}}, f)
+            with open(os.path.join(repo_path, 'package-lock.json'), 'w') as f:
+                json.dump({'lockfileVersion': 3}, f)
+            
+            snapshot = RepoSnapshot.load(repo_path)
+            
+            assert snapshot.package_json['dependencies']['lodash'] == '^4.17.15'
+            assert snapshot.package_lock['lockfileVersion'] == 3
+            assert len(snapshot.lock_hash) == 64
+    
+    def test_repo_snapshot_missing_package_json(self):
+        """Test that a repo without package.json gives no snapshot"""
+        with tempfile.TemporaryDirectory() as repo_path:
+            assert RepoSnapshot.load(repo_path) is None
 
 
 if __name__ == '__main__':
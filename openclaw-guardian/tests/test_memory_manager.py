@@ -3,46 +3,42 @@ Unit tests for MemoryManager
 """
 
 import os
-import sys
 import json
-import tempfile
+import threading
 import pytest
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from skills.memory_manager import MemoryManager
+from skills.memory_manager import MemoryManager, get_memory_manager, upgrades_file_for
 
 
 class TestMemoryManager:
     """Tests for the MemoryManager class"""
     
     @pytest.fixture
-    def temp_memory_file(self):
-        """Create a temporary memory file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({}, f)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+    def temp_memory_file(self, tmp_path):
+        """Path for a memory file in a fresh temporary directory"""
+        # MemoryManager creates the file (and its .bak / history files)
+        # itself, and pytest removes tmp_path for us
+        return str(tmp_path / 'memory.json')
+    
+    @pytest.fixture
+    def memory_factory(self, tmp_path_factory):
+        """Builds fresh MemoryManagers, each in its own temporary directory"""
+        def _make():
+            return MemoryManager(str(tmp_path_factory.mktemp('memory') / 'memory.json'))
+        return _make
     
-    def test_create_empty_memory(self, temp_memory_file):
+    def test_create_empty_memory(self, memory_factory):
         """Test creating empty memory structure"""
-        memory = MemoryManager(temp_memory_file)
+        memory = memory_factory()
         
         assert memory.memory is not None
         assert 'repo_url' in memory.memory
         assert 'last_checked' in memory.memory
         assert 'last_updated' in memory.memory
     
-    def test_record_upgrade(self, temp_memory_file):
+    def test_record_upgrade(self, memory_factory):
         """Test recording an upgrade"""
-        memory = MemoryManager(temp_memory_file)
+        memory = memory_factory()
         
         result = memory.record_upgrade(
             'auto/test-branch',
@@ -56,46 +52,127 @@ class TestMemoryManager:
         assert memory.memory['last_updated'][0]['packages'] == ['lodash', 'axios']
         assert memory.memory['successful_upgrades'] == 1
     
-    def test_has_been_upgraded(self, temp_memory_file):
-        """Test checking if package was upgraded"""
+    def test_record_upgrade_appends_history_line(self, temp_memory_file):
+        """Test that upgrades go to the JSONL file and load back"""
         memory = MemoryManager(temp_memory_file)
+        memory.record_upgrade('auto/first', ['lodash'])
+        memory.flush()
+        memory.record_upgrade('auto/second', ['axios'])
+        memory.flush()
+        
+        with open(upgrades_file_for(temp_memory_file), 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])['branch'] == 'auto/second'
+        
+        # memory.json itself no longer carries the history
+        with open(temp_memory_file, 'r', encoding='utf-8') as f:
+            assert 'last_updated' not in json.load(f)
+        
+        reloaded = MemoryManager(temp_memory_file)
+        assert [e['branch'] for e in reloaded.memory['last_updated']] == ['auto/first', 'auto/second']
+        assert reloaded.has_been_upgraded('axios')
+    
+    def test_msgpack_history_migrates_from_jsonl(self, temp_memory_file):
+        """Test that switching to MessagePack keeps the JSON Lines history"""
+        pytest.importorskip('msgpack')
         
-        # Record an upgrade
-        memory.record_upgrade('auto/test-branch', ['lodash'])
+        with MemoryManager(temp_memory_file) as memory:
+            memory.record_upgrade('auto/first', ['lodash'])
         
-        # Check if lodash was upgraded
-        assert memory.has_been_upgraded('lodash') is True
+        with MemoryManager(temp_memory_file, upgrades_format='msgpack') as memory:
+            memory.record_upgrade('auto/second', ['axios'])
         
-        # Check if react was upgraded
-        assert memory.has_been_upgraded('react') is False
+        assert not os.path.exists(upgrades_file_for(temp_memory_file))
+        reloaded = MemoryManager(temp_memory_file, upgrades_format='msgpack')
+        assert [e['branch'] for e in reloaded.memory['last_updated']] == ['auto/first', 'auto/second']
     
-    def test_get_recently_upgraded_packages(self, temp_memory_file):
-        """Test getting recently upgraded packages"""
+    def test_history_is_capped_at_max_entries(self, temp_memory_file):
+        """Test that only the newest max_entries upgrades are kept"""
+        with MemoryManager(temp_memory_file, max_entries=2) as memory:
+            for name in ['a', 'b', 'c']:
+                memory.record_upgrade(f'auto/{name}', [name])
+            
+            assert [e['branch'] for e in memory.memory['last_updated']] == ['auto/b', 'auto/c']
+            assert not memory.has_been_upgraded('a')
+        
+        reloaded = MemoryManager(temp_memory_file, max_entries=2)
+        assert len(reloaded.memory['last_updated']) == 2
+    
+    def test_reload_sees_changes_made_by_another_manager(self, temp_memory_file):
+        """Test that the parsed-file cache never hides a newer save"""
+        first = MemoryManager(temp_memory_file)
+        assert MemoryManager(temp_memory_file).memory['last_updated'] == []
+        
+        with first:
+            first.record_upgrade('auto/test-branch', ['lodash'])
+        
+        second = MemoryManager(temp_memory_file)
+        assert second.has_been_upgraded('lodash')
+        
+        # Changes to one manager's list don't leak into another's
+        second.record_upgrade('auto/other', ['axios'])
+        assert len(MemoryManager(temp_memory_file).memory['last_updated']) == 1
+    
+    def test_changes_are_saved_on_flush(self, temp_memory_file):
+        """Test that changes only reach the disk when flushed"""
+        with MemoryManager(temp_memory_file) as memory:
+            memory.set_repo_url('https://github.com/test/repo')
+            assert MemoryManager(temp_memory_file).memory['repo_url'] == ''
+        
+        assert MemoryManager(temp_memory_file).memory['repo_url'] == 'https://github.com/test/repo'
+    
+    def test_damaged_memory_file_falls_back_to_backup(self, temp_memory_file):
+        """Test that a half-written memory.json doesn't lose the saved state"""
         memory = MemoryManager(temp_memory_file)
+        memory.set_repo_url('https://github.com/test/repo')
+        memory.flush()
+        memory.update_last_check_time()
+        memory.flush()  # second save makes the .bak
         
-        memory.record_upgrade('auto/test-branch', ['lodash', 'axios'])
+        # Simulate a crash that left memory.json truncated
+        with open(temp_memory_file, 'w', encoding='utf-8') as f:
+            f.write('{"repo_url": ')
         
-        recent = memory.get_recently_upgraded_packages()
+        reloaded = MemoryManager(temp_memory_file)
+        assert reloaded.memory['repo_url'] == 'https://github.com/test/repo'
+    
+    @pytest.fixture
+    def prepared_memory(self, memory_factory):
+        """A MemoryManager that has recorded one upgrade of lodash and axios"""
+        memory = memory_factory()
+        memory.record_upgrade('auto/test-branch', ['lodash', 'axios'])
+        return memory
+    
+    @pytest.mark.parametrize("package,expected", [
+        ('lodash', True),
+        ('axios', True),
+        ('react', False),
+    ])
+    def test_has_been_upgraded(self, prepared_memory, package, expected):
+        """Test checking if package was upgraded"""
+        assert prepared_memory.has_been_upgraded(package) is expected
+    
+    def test_get_recently_upgraded_packages(self, prepared_memory):
+        """Test getting recently upgraded packages"""
+        recent = prepared_memory.get_recently_upgraded_packages()
         
         assert 'lodash' in recent
         assert 'axios' in recent
     
-    def test_get_stats(self, temp_memory_file):
+    def test_get_stats(self, prepared_memory):
         """Test getting statistics"""
-        memory = MemoryManager(temp_memory_file)
-        
-        memory.record_upgrade('auto/test-branch', ['lodash'])
-        memory.update_last_check_time()
+        prepared_memory.update_last_check_time()
         
-        stats = memory.get_stats()
+        stats = prepared_memory.get_stats()
         
         assert stats['total_runs'] == 1
         assert stats['successful_upgrades'] == 1
         assert stats['last_checked'] is not None
     
-    def test_update_last_check_time(self, temp_memory_file):
+    def test_update_last_check_time(self, memory_factory):
         """Test updating last check time"""
-        memory = MemoryManager(temp_memory_file)
+        memory = memory_factory()
         
         assert memory.memory['last_checked'] is None
         
@@ -104,6 +181,29 @@ class TestMemoryManager:
         assert memory.memory['last_checked'] is not None
         assert memory.memory['total_runs'] == 1
 
+    
+    def test_get_memory_manager_never_shares_state(self, temp_memory_file):
+        """Test that guardians using the same memory file get separate managers"""
+        managers = {}
+        
+        def setup_guardian(repo_url):
+            memory = get_memory_manager(temp_memory_file)
+            memory.memory['repo_url'] = repo_url
+            managers[repo_url] = memory
+        
+        threads = [
+            threading.Thread(target=setup_guardian, args=(f'https://github.com/test/repo{i}',))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(memory) for memory in managers.values()}) == 4
+        for repo_url, memory in managers.items():
+            assert memory.memory['repo_url'] == repo_url
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
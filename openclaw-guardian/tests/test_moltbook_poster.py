@@ -0,0 +1,71 @@
+"""
+Unit tests for MoltbookPoster
+"""
+
+import pytest
+
+from skills.moltbook_poster import MoltbookPoster
+
+
+class FakeResponse:
+    """Just enough of a requests.Response for MoltbookPoster"""
+
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    """Records each POST and answers with the next queued status code"""
+
+    def __init__(self, *status_codes):
+        self.status_codes = list(status_codes)
+        self.posted = []
+
+    def post(self, url, json=None, timeout=None):
+        self.posted.append(url)
+        return FakeResponse(self.status_codes.pop(0))
+
+
+class TestMoltbookPoster:
+    """Tests for the MoltbookPoster class"""
+
+    @pytest.fixture
+    def mock_logger(self):
+        """Mock logger"""
+        class MockLogger:
+            def debug(self, msg): pass
+            def info(self, msg): pass
+            def warning(self, msg): pass
+            def error(self, msg): pass
+        return MockLogger()
+
+    @pytest.fixture
+    def poster(self, mock_logger):
+        """An enabled poster (the session is swapped for a fake in each test)"""
+        return MoltbookPoster({'moltbook': {'api_key': 'test-key'}}, mock_logger)
+
+    def test_post_upgrade_creates_submolt_then_posts(self, poster):
+        """Test that an enabled post_upgrade creates the submolt and posts"""
+        poster._session_instance = FakeSession(201, 201)
+
+        result = poster.post_upgrade(
+            'https://github.com/test/repo',
+            [{'name': 'lodash', 'old_version': '4.17.15', 'new_version': '4.17.21'}],
+            'https://github.com/test/repo/pull/1'
+        )
+
+        assert result is True
+        assert [url.rsplit('/', 1)[-1] for url in poster._session.posted] == ['submolts', 'posts']
+
+    def test_post_upgrade_only_creates_submolt_once(self, poster):
+        """Test that a second post skips the submolt request"""
+        poster._session_instance = FakeSession(409, 201, 201)
+
+        assert poster.post_upgrade('https://github.com/test/repo', [], 'pr-1') is True
+        assert poster.post_upgrade('https://github.com/test/repo', [], 'pr-2') is True
+        assert [url.rsplit('/', 1)[-1] for url in poster._session.posted] == ['submolts', 'posts', 'posts']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
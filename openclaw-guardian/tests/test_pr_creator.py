@@ -0,0 +1,144 @@
+"""
+Unit tests for PRCreator
+"""
+
+import json
+import threading
+import pytest
+
+from skills.pr_creator import PRCreator
+
+
+# Reply to "create a pull request", trimmed from GitHub's API docs. The
+# nested user/repo objects have html_url values of their own
+PR_RESPONSE = b"""{
+  "url": "https://api.github.com/repos/octocat/Hello-World/pulls/1347",
+  "id": 1,
+  "node_id": "MDExOlB1bGxSZXF1ZXN0MQ==",
+  "html_url": "https://github.com/octocat/Hello-World/pull/1347",
+  "diff_url": "https://github.com/octocat/Hello-World/pull/1347.diff",
+  "issue_url": "https://api.github.com/repos/octocat/Hello-World/issues/1347",
+  "number": 1347,
+  "state": "open",
+  "title": "Amazing new feature",
+  "user": {
+    "login": "octocat",
+    "html_url": "https://github.com/octocat",
+    "type": "User"
+  },
+  "body": "Please pull these awesome changes in!",
+  "head": {
+    "label": "octocat:new-topic",
+    "ref": "new-topic",
+    "repo": {
+      "full_name": "octocat/Hello-World",
+      "html_url": "https://github.com/octocat/Hello-World"
+    }
+  },
+  "_links": {
+    "html": {"href": "https://github.com/octocat/Hello-World/pull/1347"}
+  }
+}"""
+
+
+class FakeResponse:
+    """Just enough of a requests.Response for PRCreator._html_url"""
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class TestHtmlUrl:
+    """Tests for reading the PR/issue link out of a GitHub reply"""
+
+    def test_pull_request_response(self):
+        """Test the link from a recorded pull request reply"""
+        assert PRCreator._html_url(FakeResponse(PR_RESPONSE)) == \
+            'https://github.com/octocat/Hello-World/pull/1347'
+
+    def test_nested_html_urls_are_skipped(self):
+        """Test that user/repo links listed first aren't taken for the PR link"""
+        data = json.loads(PR_RESPONSE)
+        reordered = {'user': data['user'], 'head': data['head'], **data}
+
+        assert PRCreator._html_url(FakeResponse(json.dumps(reordered).encode())) == \
+            'https://github.com/octocat/Hello-World/pull/1347'
+
+    def test_issue_response(self):
+        """Test the link from an issue reply"""
+        # The body text mentions another link (json.dumps escapes its quotes)
+        body = json.dumps({
+            'body': 'See "html_url": "https://github.com/x/y/pull/1" for details',
+            'user': {'html_url': 'https://github.com/octocat'},
+            'html_url': 'https://github.com/octocat/Hello-World/issues/7',
+        }).encode()
+
+        assert PRCreator._html_url(FakeResponse(body)) == \
+            'https://github.com/octocat/Hello-World/issues/7'
+
+    def test_falls_back_to_json(self):
+        """Test that a link the pattern doesn't know is read by parsing"""
+        body = json.dumps({
+            'user': {'html_url': 'https://github.com/octocat'},
+            'html_url': 'https://ghe.example.com/octocat/Hello-World/pull/12?tab=files',
+        }).encode()
+
+        assert PRCreator._html_url(FakeResponse(body)) == \
+            'https://ghe.example.com/octocat/Hello-World/pull/12?tab=files'
+
+
+class TestPRCreator:
+    """Tests for the PRCreator class"""
+
+    @pytest.fixture
+    def mock_config(self):
+        """Mock configuration"""
+        return {
+            'paths': {'working_directory': './repos'},
+            'github': {'token': '', 'repo_url': ''}
+        }
+
+    def test_last_branch_name_is_per_thread(self, mock_config):
+        """Test that parallel workflows each record their own branch"""
+        creator = PRCreator(mock_config, None)
+        names = iter(['auto/dependency-update-a', 'auto/dependency-update-b'])
+        names_lock = threading.Lock()
+        both_started = threading.Barrier(2)
+
+        def generate_branch_name():
+            with names_lock:
+                return next(names)
+
+        def create_branch(repo_path, branch_name):
+            # Both threads have picked a branch before either carries on
+            both_started.wait(timeout=5)
+            return True
+
+        creator.generate_branch_name = generate_branch_name
+        creator.create_branch = create_branch
+        creator.commit_changes = lambda repo_path, packages: True
+        creator.push_branch = lambda repo_path, branch_name: True
+        creator.create_pull_request = lambda branch_name, packages, base_branch: f'pr-for-{branch_name}'
+
+        results = {}
+
+        def run(repo_path):
+            pr_url = creator.create_branch_and_pr(repo_path, [])
+            results[repo_path] = (pr_url, creator.last_branch_name)
+
+        threads = [threading.Thread(target=run, args=(path,)) for path in ('repo-1', 'repo-2')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for pr_url, branch_name in results.values():
+            assert pr_url == f'pr-for-{branch_name}'
+        assert creator.last_branch_name is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
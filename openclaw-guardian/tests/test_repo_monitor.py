@@ -0,0 +1,256 @@
+"""
+Unit tests for RepoMonitor
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+import threading
+import time
+import pytest
+
+from skills.repo_monitor import RepoMonitor, _tracked_files_unchanged
+
+
+needs_git = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+
+def git(repo_path, *args):
+    """Run a git command in a test repository"""
+    subprocess.run(
+        ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+        cwd=repo_path, check=True, capture_output=True
+    )
+
+
+def index_version(repo_path):
+    """Read the format version from a repository's .git/index"""
+    with open(os.path.join(repo_path, '.git', 'index'), 'rb') as f:
+        return struct.unpack('>4sI', f.read(8))[1]
+
+
+def set_mtime_ns(path, mtime_ns):
+    """Give a file an exact modification time"""
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@needs_git
+class TestTrackedFilesUnchanged:
+    """Tests for the .git/index reader behind fast_status"""
+
+    @pytest.fixture
+    def repo_path(self, tmp_path):
+        """A committed repository with files that share name prefixes"""
+        repo = tmp_path / 'repo'
+        (repo / 'src' / 'lib').mkdir(parents=True)
+        (repo / 'a.txt').write_text('alpha\n')
+        (repo / 'b.txt').write_text('bravo\n')
+        (repo / 'src' / 'lib' / 'one.js').write_text('module.exports = 1\n')
+        (repo / 'src' / 'lib' / 'two.js').write_text('module.exports = 2\n')
+        (repo / 'src' / 'main.js').write_text('require("./lib/one")\n')
+        git(repo, 'init', '-q')
+        git(repo, 'add', '.')
+        git(repo, 'commit', '-q', '-m', 'initial')
+        return str(repo)
+
+    def test_clean_v2_index(self, repo_path):
+        """Test that an untouched checkout reads as unchanged"""
+        assert index_version(repo_path) == 2
+        assert _tracked_files_unchanged(repo_path) is True
+
+    def test_size_change_is_seen(self, repo_path):
+        """Test that an edit that changes the size is seen"""
+        with open(os.path.join(repo_path, 'src', 'main.js'), 'a') as f:
+            f.write('// more\n')
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_same_size_edit_with_new_mtime_is_seen(self, repo_path):
+        """Test that a same-size edit is caught by its modification time"""
+        path = os.path.join(repo_path, 'b.txt')
+        old_mtime_ns = os.stat(path).st_mtime_ns
+        with open(path, 'w') as f:
+            f.write('BRAVO\n')
+        set_mtime_ns(path, old_mtime_ns + 5_000_000_000)
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_racy_same_size_edit_is_seen(self, repo_path):
+        """Test that a same-size, same-mtime edit is caught by hashing (racy git)"""
+        path = os.path.join(repo_path, 'b.txt')
+        index_path = os.path.join(repo_path, '.git', 'index')
+        old_mtime_ns = os.stat(path).st_mtime_ns
+
+        # The index is older than the file's recorded time, so the time
+        # alone can't be trusted
+        set_mtime_ns(index_path, old_mtime_ns - 1_000_000_000)
+        assert _tracked_files_unchanged(repo_path) is True
+
+        with open(path, 'w') as f:
+            f.write('BRAVO\n')
+        set_mtime_ns(path, old_mtime_ns)
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_v4_index(self, repo_path):
+        """Test reading the prefix-compressed names of a version 4 index"""
+        git(repo_path, 'update-index', '--index-version', '4')
+        assert index_version(repo_path) == 4
+        assert _tracked_files_unchanged(repo_path) is True
+
+        with open(os.path.join(repo_path, 'src', 'lib', 'two.js'), 'a') as f:
+            f.write('// more\n')
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_extended_flag_entry(self, repo_path):
+        """Test that entries after an extended-flag (v3) entry are still read"""
+        git(repo_path, 'update-index', '--skip-worktree', 'a.txt')
+        assert index_version(repo_path) == 3
+        assert _tracked_files_unchanged(repo_path) is True
+
+        with open(os.path.join(repo_path, 'b.txt'), 'a') as f:
+            f.write('more\n')
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_submodule_falls_back_to_git(self, repo_path):
+        """Test that a submodule (gitlink) entry makes us ask git instead"""
+        git(repo_path, 'update-index', '--add', '--cacheinfo',
+            f'160000,{"1" * 40},vendor/sub')
+
+        assert _tracked_files_unchanged(repo_path) is False
+
+    def test_sha256_repository_falls_back_to_git(self, tmp_path):
+        """Test that a SHA-256 repository makes us ask git instead"""
+        repo = tmp_path / 'repo256'
+        repo.mkdir()
+        (repo / 'a.txt').write_text('alpha\n')
+        try:
+            git(repo, 'init', '-q', '--object-format=sha256')
+        except subprocess.CalledProcessError:
+            pytest.skip('git without SHA-256 support')
+        git(repo, 'add', '.')
+        git(repo, 'commit', '-q', '-m', 'initial')
+
+        assert _tracked_files_unchanged(str(repo)) is False
+
+    def test_unreadable_index_falls_back_to_git(self, tmp_path):
+        """Test that a folder without .git/index makes us ask git instead"""
+        assert _tracked_files_unchanged(str(tmp_path)) is False
+
+
+@needs_git
+class TestCloneRepo:
+    """Tests for clone_repo reusing an existing clone"""
+
+    def make_remote(self, path, text):
+        """A committed repository at path with one file, as a file:// URL"""
+        path.mkdir(parents=True)
+        (path / 'a.txt').write_text(text)
+        git(path, 'init', '-q')
+        git(path, 'add', '.')
+        git(path, 'commit', '-q', '-m', 'initial')
+        return path.as_uri()
+
+    def test_reset_clone_points_origin_at_new_url(self, tmp_path):
+        """Test that a reused clone's origin follows the URL it was reset from"""
+        old_url = self.make_remote(tmp_path / 'old' / 'project', 'old\n')
+        new_url = self.make_remote(tmp_path / 'new' / 'project', 'new\n')
+        monitor = RepoMonitor({'paths': {'working_directory': str(tmp_path / 'repos')}}, None)
+
+        repo_path = monitor.clone_repo(old_url)
+        # Same repo name, so the existing clone is reset instead of re-cloned
+        assert monitor.clone_repo(new_url) == repo_path
+
+        origin = subprocess.run(
+            ['git', 'remote', 'get-url', 'origin'],
+            cwd=repo_path, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        assert origin == new_url
+        assert (tmp_path / 'repos' / 'project' / 'a.txt').read_text() == 'new\n'
+
+
+class TestPullLatestSwr:
+    """Tests for pull_latest_swr (stale-while-revalidate pulls)"""
+
+    REPO = './repos/my-project'
+
+    @pytest.fixture
+    def monitor(self):
+        """A RepoMonitor whose pull_latest is replaced in each test"""
+        config = {
+            'paths': {'working_directory': './repos'},
+            'github': {'token': '', 'repo_url': ''}
+        }
+        monitor = RepoMonitor(config, None)
+        monitor.pull_calls = []
+        return monitor
+
+    def fake_pull(self, monitor, result, release=None):
+        """Replace pull_latest with one that records calls and returns result"""
+        def pull_latest(repo_path):
+            monitor.pull_calls.append(repo_path)
+            if release is not None:
+                release.wait(timeout=5)
+            return result
+        monitor.pull_latest = pull_latest
+
+    def test_fresh_copy_returns_without_pulling(self, monitor):
+        """Test that a recent pull is reused"""
+        self.fake_pull(monitor, True)
+        monitor._last_pull[self.REPO] = time.time()
+
+        assert monitor.pull_latest_swr(self.REPO, max_age=30) is True
+        assert monitor.pull_calls == []
+
+    def test_never_pulled_waits_for_the_pull(self, monitor):
+        """Test that the first pull makes the caller wait for it"""
+        self.fake_pull(monitor, True)
+
+        assert monitor.pull_latest_swr(self.REPO) is True
+        assert monitor.pull_calls == [self.REPO]
+        assert self.REPO in monitor._last_pull
+
+    def test_failed_first_pull_is_not_recorded(self, monitor):
+        """Test that a failed pull isn't remembered as fresh"""
+        self.fake_pull(monitor, False)
+
+        assert monitor.pull_latest_swr(self.REPO) is False
+        assert self.REPO not in monitor._last_pull
+
+        # The next call tries again
+        assert monitor.pull_latest_swr(self.REPO) is False
+        assert monitor.pull_calls == [self.REPO, self.REPO]
+
+    def test_stale_copy_refreshes_in_background(self, monitor):
+        """Test that a stale copy is used at once while a pull runs"""
+        release = threading.Event()
+        self.fake_pull(monitor, True, release)
+        stale = time.time() - 100
+        monitor._last_pull[self.REPO] = stale
+
+        # Returns while the pull is still blocked
+        assert monitor.pull_latest_swr(self.REPO, max_age=30) is True
+        # A second call doesn't start another pull
+        assert monitor.pull_latest_swr(self.REPO, max_age=30) is True
+
+        release.set()
+        assert monitor._pull_futures[self.REPO].result(timeout=5) is True
+        assert monitor.pull_calls == [self.REPO]
+        assert monitor._last_pull[self.REPO] > stale
+
+    def test_failed_background_refresh_keeps_old_time(self, monitor):
+        """Test that a failed refresh leaves the copy stale, so it's retried"""
+        self.fake_pull(monitor, False)
+        stale = time.time() - 100
+        monitor._last_pull[self.REPO] = stale
+
+        assert monitor.pull_latest_swr(self.REPO, max_age=30) is True
+        assert monitor._pull_futures[self.REPO].result(timeout=5) is False
+        assert monitor._last_pull[self.REPO] == stale
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,266 @@
+"""
+Unit tests for UpgradeExecutor
+"""
+
+import os
+import json
+import subprocess
+import pytest
+
+from skills.dependency_checker import DependencyChecker, Package
+from skills.upgrade_executor import UpgradeExecutor, _scan_lock_version
+
+
+class TestUpgradeExecutor:
+    """Tests for the UpgradeExecutor class"""
+
+    @pytest.fixture
+    def mock_logger(self):
+        """Mock logger"""
+        class MockLogger:
+            def debug(self, msg): pass
+            def info(self, msg): pass
+            def warning(self, msg): pass
+            def error(self, msg): pass
+        return MockLogger()
+
+    @pytest.fixture
+    def repo_path(self, tmp_path):
+        """A repository folder with a package.json that depends on lodash"""
+        repo = tmp_path / 'repo'
+        repo.mkdir()
+        (repo / 'package.json').write_text(json.dumps({'dependencies': {'lodash': '^4.17.15'}}))
+        return str(repo)
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Config with its own, empty 'npm outdated' cache folder"""
+        return {'paths': {'npm_cache_directory': str(tmp_path / 'npm-cache')}}
+
+    @pytest.fixture
+    def executor(self, config, mock_logger):
+        """An UpgradeExecutor whose npm update is recorded instead of run"""
+        executor = UpgradeExecutor(config, mock_logger)
+        executor.update_calls = []
+
+        def fake_update(repo_path, packages=None):
+            executor.update_calls.append(packages)
+            return False
+
+        executor._run_npm_update = fake_update
+        return executor
+
+    def test_npm_error_payload_is_not_a_package(self, executor, repo_path):
+        """Test that npm's {"error": ...} reply doesn't filter out the upgrade"""
+        async def fake_run_npm(args, repo_path, timeout, keep_stdout=False):
+            stdout = json.dumps({'error': {'code': 'ENOTFOUND', 'summary': 'getaddrinfo ENOTFOUND'}})
+            return subprocess.CompletedProcess(args, 1, stdout, '')
+
+        executor._run_npm = fake_run_npm
+
+        assert executor._get_outdated_names(repo_path) is None
+
+        # We couldn't find out, so the upgrade goes ahead as asked
+        assert executor.upgrade_dependencies(repo_path, ['lodash']) == (False, [])
+        assert executor.update_calls == [['lodash']]
+
+    def test_cached_outdated_skips_npm(self, executor, config, mock_logger, repo_path):
+        """Test that a cached 'npm outdated' result is used without running npm"""
+        async def fail_run_npm(args, repo_path, timeout, keep_stdout=False):
+            raise AssertionError('npm should not run')
+
+        executor._run_npm = fail_run_npm
+
+        checker = DependencyChecker(config, mock_logger)
+        checker._write_outdated_cache(
+            checker._outdated_cache_key(repo_path),
+            [Package('axios', '0.27.0', '0.27.2', '1.6.0', 'myproject', '')]
+        )
+
+        # lodash isn't outdated - nothing to do, and npm update never runs
+        assert executor.upgrade_dependencies(repo_path, ['lodash']) == (True, [])
+        assert executor.update_calls == []
+
+        # axios is - only it is passed on to npm
+        executor.upgrade_dependencies(repo_path, ['lodash', 'axios'])
+        assert executor.update_calls == [['axios']]
+
+
+class TestLockVersionLookup:
+    """Tests for finding a package's version in package-lock.json"""
+
+    @pytest.fixture
+    def executor(self):
+        """An UpgradeExecutor with no logger"""
+        return UpgradeExecutor({}, None)
+
+    @pytest.fixture
+    def write_lock(self, tmp_path):
+        """Writes a package-lock.json (text as given) and returns the repo path"""
+        def _write(text):
+            (tmp_path / 'package-lock.json').write_text(text)
+            return str(tmp_path)
+        return _write
+
+    def test_top_level_package(self, executor, write_lock):
+        """Test the usual '"node_modules/<name>": {"version": ...}' entry"""
+        repo_path = write_lock(json.dumps({
+            'lockfileVersion': 3,
+            'packages': {
+                '': {'name': 'app', 'dependencies': {'lodash': '^4.17.15'}},
+                'node_modules/lodash': {'version': '4.17.21', 'resolved': 'https://x/lodash.tgz'},
+            }
+        }, indent=2))
+
+        assert _scan_lock_version(os.path.join(repo_path, 'package-lock.json'), 'lodash') == '4.17.21'
+        assert executor.get_package_lock_version(repo_path, 'lodash') == '4.17.21'
+
+    def test_nested_copy_is_not_matched(self, executor, write_lock):
+        """Test that node_modules/x/node_modules/<name> isn't taken for the top-level package"""
+        repo_path = write_lock(json.dumps({
+            'packages': {
+                'node_modules/x/node_modules/lodash': {'version': '3.10.1'},
+                'node_modules/lodash': {'version': '4.17.21'},
+            }
+        }))
+        lock_path = os.path.join(repo_path, 'package-lock.json')
+
+        assert _scan_lock_version(lock_path, 'lodash') == '4.17.21'
+
+        # Only the nested copy - it isn't installed at the top level
+        write_lock(json.dumps({'packages': {'node_modules/x/node_modules/lodash': {'version': '3.10.1'}}}))
+        assert _scan_lock_version(lock_path, 'lodash') is None
+
+    def test_scoped_package(self, executor, write_lock):
+        """Test @scope/name packages (the / and @ must match literally)"""
+        repo_path = write_lock(json.dumps({
+            'packages': {
+                'node_modules/@types/node': {'version': '20.11.5'},
+                'node_modules/@types/nodejs': {'version': '0.0.1'},
+            }
+        }))
+
+        assert executor.get_package_lock_version(repo_path, '@types/node') == '20.11.5'
+
+    def test_version_after_nested_object_uses_fallback(self, executor, write_lock):
+        """Test that a version listed after a nested object is found by parsing"""
+        repo_path = write_lock(json.dumps({
+            'packages': {
+                'node_modules/lodash': {
+                    'dependencies': {'other': {'version': '9.9.9'}},
+                    'version': '4.17.21',
+                },
+            }
+        }))
+
+        assert _scan_lock_version(os.path.join(repo_path, 'package-lock.json'), 'lodash') is None
+        assert executor.get_package_lock_version(repo_path, 'lodash') == '4.17.21'
+
+    def test_empty_file(self, executor, write_lock):
+        """Test that an empty package-lock.json gives None instead of failing"""
+        repo_path = write_lock('')
+
+        assert _scan_lock_version(os.path.join(repo_path, 'package-lock.json'), 'lodash') is None
+        assert executor.get_package_lock_version(repo_path, 'lodash') is None
+
+    def test_v1_lockfile(self, executor, write_lock):
+        """Test the old format, which only has a "dependencies" section"""
+        repo_path = write_lock(json.dumps({
+            'lockfileVersion': 1,
+            'dependencies': {'lodash': {'version': '4.17.21', 'requires': {}}},
+        }))
+
+        assert _scan_lock_version(os.path.join(repo_path, 'package-lock.json'), 'lodash') is None
+        assert executor.get_package_lock_version(repo_path, 'lodash') == '4.17.21'
+
+    def test_missing_lockfile(self, executor, tmp_path):
+        """Test that a repo without package-lock.json gives None"""
+        assert executor.get_package_lock_version(str(tmp_path), 'lodash') is None
+
+    def test_regex_hit_skips_other_lookups(self, executor, write_lock):
+        """Test that a regex match is returned without streaming or parsing"""
+        repo_path = write_lock(json.dumps({'packages': {'node_modules/lodash': {'version': '4.17.21'}}}))
+
+        def fail(*args):
+            raise AssertionError('should not be called')
+
+        executor._stream_lock_version = fail
+        executor._load_json = fail
+
+        assert executor.get_package_lock_version(repo_path, 'lodash') == '4.17.21'
+
+    def test_parsed_lockfile_is_reused(self, executor, write_lock):
+        """Test that once the lockfile is parsed, lookups use the parsed copy"""
+        repo_path = write_lock(json.dumps({
+            'packages': {'node_modules/lodash': {'dependencies': {}, 'version': '4.17.21'}}
+        }))
+        executor._load_json(os.path.join(repo_path, 'package-lock.json'))
+
+        def fail(*args):
+            raise AssertionError('should not be called')
+
+        executor._stream_lock_version = fail
+
+        assert executor.get_package_lock_version(repo_path, 'lodash') == '4.17.21'
+
+
+class TestStreamLockVersion:
+    """Tests for the ijson lookup used when the regex scan finds nothing"""
+
+    @pytest.fixture(autouse=True)
+    def need_ijson(self):
+        """These tests only make sense with ijson installed"""
+        pytest.importorskip('ijson')
+
+    @pytest.fixture
+    def executor(self):
+        """An UpgradeExecutor with no logger"""
+        return UpgradeExecutor({}, None)
+
+    def write_lock(self, tmp_path, text):
+        """Write package-lock.json and return its path"""
+        lock_path = tmp_path / 'package-lock.json'
+        lock_path.write_text(text)
+        return str(lock_path)
+
+    def test_packages_wins_over_legacy_dependencies(self, executor, tmp_path):
+        """Test that "packages" is preferred even when "dependencies" comes first"""
+        # Written by hand so "dependencies" really is first in the file
+        lock_path = self.write_lock(tmp_path, (
+            '{"dependencies": {"lodash": {"version": "1.0.0"}},'
+            ' "packages": {"node_modules/lodash": {"dependencies": {}, "version": "2.0.0"}}}'
+        ))
+
+        assert executor._stream_lock_version(lock_path, 'lodash') == '2.0.0'
+
+    def test_legacy_dependencies_used_when_packages_lacks_it(self, executor, tmp_path):
+        """Test the fallback to the old "dependencies" section"""
+        lock_path = self.write_lock(tmp_path, json.dumps({
+            'packages': {'node_modules/axios': {'version': '1.6.0'}},
+            'dependencies': {'lodash': {'version': '4.17.21'}},
+        }))
+
+        assert executor._stream_lock_version(lock_path, 'lodash') == '4.17.21'
+        assert executor._stream_lock_version(lock_path, 'react') is None
+
+    def test_used_when_regex_misses(self, executor, tmp_path):
+        """Test that get_package_lock_version streams when the regex finds nothing"""
+        self.write_lock(tmp_path, json.dumps({
+            'dependencies': {'lodash': {'version': '1.0.0'}},
+            'packages': {'node_modules/lodash': {'dependencies': {}, 'version': '2.0.0'}},
+        }))
+        streamed = []
+        stream = executor._stream_lock_version
+
+        def record_stream(lock_path, package_name):
+            streamed.append(package_name)
+            return stream(lock_path, package_name)
+
+        executor._stream_lock_version = record_stream
+
+        assert executor.get_package_lock_version(str(tmp_path), 'lodash') == '2.0.0'
+        assert streamed == ['lodash']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
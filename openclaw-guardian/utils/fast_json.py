@@ -0,0 +1,112 @@
+"""
+Fast JSON - Uses orjson when it's installed, falls back to the json module
+
+npm can print a lot of JSON (hundreds of KB for big projects). orjson
+parses and writes it several times faster than Python's built-in json
+module, but it is an optional extra, so everything here still works
+without it.
+
+Beginner Python Notes:
+- try/except ImportError: the standard way to use a library only if it exists
+- bytes vs str: orjson.loads() accepts both, json.loads() does too
+- dumps() always returns bytes (UTF-8), ready to write to a file opened 'wb'
+"""
+
+# ============================================================================
+# IMPORTS - Bring in external libraries we need
+# ============================================================================
+
+import json
+# json: Built-in library for working with JSON data
+# Used whenever orjson isn't installed
+
+from typing import Any, Union
+# typing: Library for type hints
+# Any: Any type
+# Union: One of several types
+
+try:
+    import orjson
+    # orjson: Optional third-party library for very fast JSON parsing
+    # Install with: pip install orjson
+except ImportError:
+    orjson = None
+
+
+# ============================================================================
+# FUNCTIONS
+# ============================================================================
+
+# Catch this to handle bad JSON from either library
+# (orjson.JSONDecodeError is a subclass of json.JSONDecodeError)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text into Python objects.
+
+    Args:
+        data: JSON as a string or bytes
+
+    Returns:
+        The parsed value (usually a dict or list)
+
+    Raises:
+        JSONDecodeError: If the text is not valid JSON
+
+    Example:
+        data = loads('{"lodash": {"current": "4.17.15"}}')
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is read as raw bytes, which lets orjson skip decoding the
+    text into a Python string first.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed value
+
+    Raises:
+        IOError: If the file can't be read
+        JSONDecodeError: If the file is not valid JSON
+
+    Example:
+        package_json = load_file('./repos/my-project/package.json')
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dumps(value: Any, pretty: bool = False) -> bytes:
+    """
+    Turn Python objects into JSON bytes.
+
+    Args:
+        value: The value to convert (dicts, lists, strings, numbers, ...)
+        pretty: Indent with 2 spaces so people can read the file
+
+    Returns:
+        The JSON as UTF-8 bytes
+
+    Raises:
+        TypeError: If the value contains something JSON can't store
+
+    Example:
+        with open('memory.json', 'wb') as f:
+            f.write(dumps(memory, pretty=True))
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -9,7 +9,7 @@ Beginner Python Notes:
 - logging: Python's built-in library for creating log messages
 - formatter: controls how log messages look
 - handler: determines where log messages go (console, file, etc.)
-- singleton: a design pattern where we only create one instance of a class
+- logging.getLogger(name) always returns the same logger for the same name
 """
 
 # ============================================================================
@@ -23,9 +23,25 @@ import logging
 #   - Multiple outputs (console, file, etc.)
 #   - Timestamps and formatting
 
+import logging.handlers
+# logging.handlers: Extra handlers that ship with logging
+# QueueHandler/QueueListener move the actual writing to a background thread
+
+import queue
+# queue: Built-in library for thread-safe queues
+# Log records are passed to the background writer through a queue
+
+import atexit
+# atexit: Built-in library for running code when Python exits
+# We use it to flush any queued log records before the program ends
+
+import functools
+# functools: Built-in library for higher-order functions
+# We use lru_cache so the log file path is only worked out once
+
 import os
-# os: Built-in Python library for file/directory operations
-# We use it to check if log directory exists and create paths
+# os: Built-in Python library for operating system features
+# We use it to read the pytest-xdist worker name from the environment
 
 from datetime import datetime
 # datetime: Built-in Python library for working with dates/times
@@ -33,6 +49,7 @@ from datetime import datetime
 
 from pathlib import Path
 # pathlib: Built-in Python library for file path operations
+# We use it to build the log file path and create the log directory
 
 from typing import Optional
 # typing: Built-in Python library for type hints
@@ -40,238 +57,214 @@ from typing import Optional
 
 
 # ============================================================================
-# LOGGER CLASS - Main logging handler
+# HELPERS - Small functions used by the logger setup
 # ============================================================================
 
-class Logger:
+@functools.lru_cache(maxsize=16)
+def _resolve_log_file(name: str, log_dir: str) -> Path:
     """
-    A custom logger class that handles logging to both console and file.
+    Build today's log file path.
     
-    Think of this like a diary that writes down everything the program does:
-    - INFO: Normal operations ("Checking for outdated packages")
-    - WARNING: Something unexpected but not critical ("No updates found")
-    - ERROR: Something went wrong ("Failed to clone repository")
-    - DEBUG: Detailed information for debugging
+    Cached so the date formatting only happens once per
+    (name, log_dir) pair. The directory itself is created later by
+    LazyFileHandler, when the first record is written.
     
-    Attributes:
-        name: The name of the logger (usually the module name)
-        log_file: Path to the log file
-        level: The minimum log level to record
+    Args:
+        name: Name of the logger (used as the file prefix)
+        log_dir: Directory to store log files
+    
+    Returns:
+        Path like logs/openclaw-guardian-2024-01-15.log, or
+        logs/openclaw-guardian-2024-01-15-gw0.log inside a pytest-xdist worker
     """
+    # pytest-xdist sets PYTEST_XDIST_WORKER (gw0, gw1, ...) in each worker
+    # Giving every worker its own file stops them writing to the same one
+    worker = os.environ.get('PYTEST_XDIST_WORKER', '')
+    suffix = f'-{worker}' if worker else ''
+    return Path(log_dir) / f'{name}-{datetime.now():%Y-%m-%d}{suffix}.log'
+
+
+class LazyFileHandler(logging.FileHandler):
+    """
+    A FileHandler that creates its log directory on the first write.
     
-    # Class variable to store the single logger instance (singleton pattern)
-    # This ensures we only create one logger even if Logger is imported many times
-    _instance: Optional['Logger'] = None
-    _logger: Optional[logging.Logger] = None
-
-    def __new__(cls, *args, **kwargs):
-        """
-        Creates a singleton instance of Logger.
-        
-        This ensures we only have one logger in the entire application,
-        which is a best practice for logging.
-        
-        Returns:
-            The single Logger instance
-        """
-        # Check if we've already created a logger
-        if cls._instance is None:
-            # If not, create a new one
-            cls._instance = super(Logger, cls).__new__(cls)
-        # Return the existing instance
-        return cls._instance
-
-    def __init__(
-        self, 
-        name: str = 'openclaw-guardian',
-        log_dir: str = 'logs',
-        level: int = logging.INFO
-    ):
-        """
-        Initialize the logger with the given settings.
-        
-        Args:
-            name: Name of the logger (defaults to 'openclaw-guardian')
-            log_dir: Directory to store log files (defaults to 'logs')
-            level: Minimum log level to record (defaults to INFO)
-        
-        Note:
-            __init__ only runs the first time we create a Logger.
-            Subsequent calls with different args are ignored.
-        """
-        # If logger already exists, don't reconfigure
-        if Logger._logger is not None:
-            return
-        
-        # Store settings
-        self.name = name
-        self.log_dir = log_dir
-        self.level = level
-        
+    Used with delay=True, nothing touches the disk until a record is
+    actually written to the file.
+    """
+
+    def _open(self):
         # Create log directory if it doesn't exist
         # exist_ok=True means don't error if directory already exists
-        os.makedirs(self.log_dir, exist_ok=True)
-        
-        # Generate log filename with current date
-        # Example: openclaw-guardian-2024-01-15.log
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        self.log_file = os.path.join(self.log_dir, f'{name}-{date_str}.log')
-        
-        # Create the actual Python logger
-        self._setup_logger()
-
-    def _setup_logger(self):
-        """
-        Sets up the Python logging system with handlers and formatters.
-        
-        This creates:
-        1. A logger object with our name
-        2. A console handler (shows logs in terminal)
-        3. A file handler (saves logs to file)
-        4. A formatter (defines how logs look)
-        """
-        # Create the logger object
-        # This is the main object we'll use to log messages
-        logger = logging.getLogger(self.name)
-        
-        # Set the minimum log level
-        # Only messages at this level or higher will be recorded
-        logger.setLevel(self.level)
-        
-        # Clear any existing handlers
-        # This prevents duplicate logs if we accidentally call setup twice
-        logger.handlers.clear()
-        
-        # ----------------------
-        # Create Formatter
-        # ----------------------
-        # Formatter defines how each log message looks
-        # Example output:
-        # 2024-01-15 10:30:45 [INFO] - Checking for outdated packages
-        
-        formatter = logging.Formatter(
-            fmt='%(asctime)s [%(levelname)s] - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        # %(asctime)s: Human-readable timestamp
-        # %(levelname)s: INFO, WARNING, ERROR, etc.
-        # %(message)s: The actual log message
-        
-        # ----------------------
-        # Console Handler
-        # ----------------------
-        # Handler sends logs to a destination
-        # StreamHandler sends to console (terminal)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self.level)  # Set level for this handler
-        console_handler.setFormatter(formatter)  # Apply our format
-        logger.addHandler(console_handler)  # Add handler to logger
-        
-        # ----------------------
-        # File Handler
-        # ----------------------
-        # FileHandler sends logs to a file
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setLevel(self.level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        # Store logger for later use
-        Logger._logger = logger
-        
-        # Log a startup message
-        logger.info(f"Logger initialized. Log file: {self.log_file}")
-
-    def debug(self, message: str):
-        """
-        Log a debug message.
-        
-        Debug messages are detailed information used for troubleshooting.
-        They show exactly what's happening step by step.
-        
-        Args:
-            message: The message to log
-        
-        Example:
-            logger.debug("Opening config file at: config.yaml")
-        """
-        Logger._logger.debug(message)
-
-    def info(self, message: str):
-        """
-        Log an info message.
-        
-        Info messages confirm that normal operations are happening.
-        
-        Args:
-            message: The message to log
-        
-        Example:
-            logger.info("Successfully cloned repository")
-        """
-        Logger._logger.info(message)
-
-    def warning(self, message: str):
-        """
-        Log a warning message.
-        
-        Warning messages indicate something unexpected happened,
-        but the program can continue running.
-        
-        Args:
-            message: The message to log
-        
-        Example:
-            logger.warning("No outdated packages found")
-        """
-        Logger._logger.warning(message)
-
-    def error(self, message: str):
-        """
-        Log an error message.
-        
-        Error messages indicate something failed, but the program
-        might be able to recover or continue.
-        
-        Args:
-            message: The message to log
-        
-        Example:
-            logger.error("Failed to connect to GitHub API")
-        """
-        Logger._logger.error(message)
-
-    def critical(self, message: str):
-        """
-        Log a critical message.
-        
-        Critical messages indicate a serious problem that prevents
-        the program from continuing.
-        
-        Args:
-            message: The message to log
-        
-        Example:
-            logger.critical("Cannot load configuration - exiting")
-        """
-        Logger._logger.critical(message)
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
 
 
 # ============================================================================
-# CONVENIENCE FUNCTION - Simple way to get a logger
+# LOGGER SETUP - Attach handlers to the standard library logger once
 # ============================================================================
 
+# Think of the logger like a diary that writes down everything the program does:
+# - INFO: Normal operations ("Checking for outdated packages")
+# - WARNING: Something unexpected but not critical ("No updates found")
+# - ERROR: Something went wrong ("Failed to clone repository")
+# - DEBUG: Detailed information for debugging
+#
+# The one logger our handlers are attached to (None until get_logger() is
+# first called). Every later get_logger() call returns it, whatever name it
+# asks for - a new name would otherwise get a logger with no handlers.
+_LOGGER: Optional[logging.Logger] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Formatter defines how each log message looks
+# Built once here and shared by the console and file handlers
+# Example output:
+# 2024-01-15 10:30:45 [INFO] - Checking for outdated packages
+_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s [%(levelname)s] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+# %(asctime)s: Human-readable timestamp
+# %(levelname)s: INFO, WARNING, ERROR, etc.
+# %(message)s: The actual log message
+
+
+def _setup_logger(logger: logging.Logger, log_file: Path, level: int):
+    """
+    Sets up the Python logging system with handlers and formatters.
+    
+    This creates:
+    1. A console handler (shows logs in terminal)
+    2. A file handler (saves logs to file), fed in batches
+    
+    Args:
+        logger: The standard library logger to configure
+        log_file: Path of the file to write logs to
+        level: Minimum log level to record
+    """
+    global _listener
+    
+    # Set the minimum log level
+    # Only messages at this level or higher will be recorded
+    logger.setLevel(level)
+    
+    # Clear any existing handlers
+    # This prevents duplicate logs if we accidentally call setup twice
+    logger.handlers.clear()
+    
+    # ----------------------
+    # Console Handler
+    # ----------------------
+    # Handler sends logs to a destination
+    # StreamHandler sends to console (terminal)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(level)  # Set level for this handler
+    console_handler.setFormatter(_FORMATTER)  # Apply our format
+    
+    # ----------------------
+    # File Handler
+    # ----------------------
+    # FileHandler sends logs to a file
+    # delay=True waits until the first write to create the folder and open it
+    file_handler = LazyFileHandler(log_file, encoding='utf-8', delay=True)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(_FORMATTER)
+    
+    # ----------------------
+    # Memory Handler
+    # ----------------------
+    # MemoryHandler collects records and hands them to the file handler
+    # in batches of up to 1024, instead of one disk write per message.
+    # ERROR and above are flushed straight away so they are never held back.
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    memory_handler.setLevel(level)
+    
+    # ----------------------
+    # Queue Handler + Listener
+    # ----------------------
+    # The logger itself only puts records on a queue (fast, never waits
+    # on the disk). A background QueueListener thread takes them off the
+    # queue and hands them to the console and file handlers above.
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    # respect_handler_level=True keeps each handler's own level working
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        memory_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    
+    # Make sure everything still in the queue is written on exit.
+    # atexit runs these last-registered-first: the listener drains the
+    # queue into the memory handler, then closing it flushes to the file.
+    atexit.register(memory_handler.close)
+    atexit.register(_listener.stop)
+    
+    # Log a startup message
+    logger.info("Logger initialized. Log file: %s", log_file)
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS - Simple way to get a logger
+# ============================================================================
+
+def is_enabled_for(logger, level: int) -> bool:
+    """
+    Check whether messages at a level would be recorded by a logger.
+    
+    Use this to skip building expensive messages that would be
+    thrown away anyway.
+    
+    Args:
+        logger: A logging.Logger, a test stand-in, or None
+        level: A logging level such as logging.INFO
+    
+    Returns:
+        False for None, the logger's own answer if it has isEnabledFor(),
+        otherwise True (simple stand-ins are assumed to log everything)
+    
+    Example:
+        if is_enabled_for(self.logger, logging.INFO):
+            self.logger.info("\n".join(lines))
+    """
+    if not logger:
+        return False
+    
+    check = getattr(logger, 'isEnabledFor', None)
+    if check is None:
+        return True
+    return check(level)
+
+
+def is_debug_enabled(logger) -> bool:
+    """
+    Shortcut for is_enabled_for(logger, logging.DEBUG).
+    
+    Example:
+        if is_debug_enabled(self.logger):
+            self.logger.debug(f"Skipped: {skipped_names}")
+    """
+    return is_enabled_for(logger, logging.DEBUG)
+
+
 def get_logger(
     name: str = 'openclaw-guardian',
     log_dir: str = 'logs',
     level: int = logging.INFO
-) -> Logger:
+) -> logging.Logger:
     """
-    Get or create a Logger instance.
+    Get the application logger, setting it up on the first call.
     
     This is the main function other code will use to get a logger.
-    It uses the singleton pattern, so calling this multiple times
-    always returns the same logger.
+    The first call attaches the console and file handlers; later calls
+    just return the same logger (their arguments, name included, are
+    ignored).
     
     Args:
         name: Name of the logger (defaults to 'openclaw-guardian')
@@ -279,14 +272,25 @@ def get_logger(
         level: Minimum log level (defaults to logging.INFO)
     
     Returns:
-        A Logger instance
+        A standard logging.Logger
     
     Example:
         logger = get_logger()
         logger.info("Starting application")
+        logger.debug("Opening config file at: %s", config_path)
     """
-    # Create logger instance (singleton ensures only one exists)
-    logger = Logger(name, log_dir, level)
+    global _LOGGER
+    
+    # Already set up? Hand back the existing logger straight away
+    if _LOGGER is not None:
+        return _LOGGER
+    
+    logger = logging.getLogger(name)
+    
+    # Create the log directory and generate the filename with the date
+    # Example: logs/openclaw-guardian-2024-01-15.log
+    _setup_logger(logger, _resolve_log_file(name, log_dir), level)
+    _LOGGER = logger
     return logger
 
 
@@ -309,5 +313,5 @@ if __name__ == "__main__":
     logger.warning("This is a warning")
     logger.error("This is an error")
     
-    print(f"\nLog file created at: {logger.log_file}")
+    print(f"\nLog file created at: {_resolve_log_file(logger.name, 'logs')}")
     print("Check the log file to see all the messages!")